@@ -8,16 +8,27 @@ QUALITY_MAP = {
 COMPRESSION_MAP = {
     "None": 0,
     "Fast": 1,
-    "Normal": 6,
-    "Maximum": 9
+    "Normal": 4,
+    "Maximum": 6
 }
 
-DEFAULT_CONVERTER_SETTINGS = {
-    'jpeg_quality': 'High',
-    'webp_quality': 'High',
-    'png_compression': 'Normal',
-    'pdf_dpi': '150 DPI',
-    'pdf_quality': 'High'
+# PDF quality setting -> render scale on top of the DPI (PDF input) and JPEG quality (PDF output)
+PDF_RENDER_SCALE_MAP = {
+    "High": 2.0,
+    "Medium": 1.5,
+    "Low": 1.0
+}
+
+PDF_JPEG_QUALITY_MAP = {
+    "High": 95,
+    "Medium": 76,
+    "Low": 57
+}
+
+WEBP_METHOD_MAP = {
+    "Best (Slow)": 6,
+    "Balanced": 4,
+    "Fast": 2
 }
 
 DEFAULT_UPSCALER_SETTINGS = {
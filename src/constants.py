@@ -15,6 +15,23 @@ DENOISE_FORMATS = ["PNG", "JPEG", "JPG", "WEBP"]
 UPSCALE_FACTORS = ["1x", "2x", "3x", "4x"]
 UPSCALE_MODELS = ["realesr", "waifu2x", "realcugan"]
 
+# Converter Settings (what the Settings tab combos start at, and what's used before it's opened)
+DEFAULT_QUALITY_SETTINGS = {
+    'jpeg_quality': "Maximum",
+    'webp_quality': "Maximum",
+    'webp_method': "Balanced",
+    'png_compression': "Maximum",
+    'pdf_dpi': "150 DPI",
+    'pdf_quality': "High",
+    'pdf_optimize': False,
+}
+
+# Logger Settings
+LOG_MAX_LINES = 5000  # Lines kept in memory and in the log view; older lines are dropped
+LOG_MAX_LINES_OPTIONS = [1000, 2000, 5000, 10000]  # Choices for that cap on the Logger page
+LOG_FILTER_DELAY_MS = 150  # Pause after the last keystroke in the log search before re-filtering
+LOG_FLUSH_INTERVAL_MS = 33  # Queued log lines are appended at most this often (~30 times a second)
+
 # Color Scheme
 COLORS = {
     'primary': "#007AFF", 
@@ -32,3 +49,11 @@ COLORS = {
     '!tab': "#262636", 
     'error_hover': "#c2281f"
 }
+
+# Log colour for each level; other levels keep the default text colour
+LOG_LEVEL_COLORS = {
+    'ERROR': COLORS['error'],
+    'WARNING': "#FFCC00",
+    'SUCCESS': COLORS['success'],
+    'TERMINAL': "#00BFFF",
+}
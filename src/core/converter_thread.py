@@ -1,20 +1,60 @@
 import os
 import sys
 import time
+import shutil
+import functools
 import subprocess
-import gc
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait, FIRST_COMPLETED
 from pathlib import Path
 from PyQt6.QtCore import QThread, pyqtSignal
 from PIL import Image, ImageFile
-from psd_tools import PSDImage
+from src.config import QUALITY_MAP, COMPRESSION_MAP, WEBP_METHOD_MAP, PDF_RENDER_SCALE_MAP, PDF_JPEG_QUALITY_MAP
+from src.core.ncnn_batch import NcnnBatchMixin, NCNN_SECONDS_PER_FILE
 
-try:
-    import fitz
-    PDF_CONVERTER = "pymupdf"
-except ImportError:
-    PDF_CONVERTER = None
+# Convert what can be decoded from truncated files instead of failing them outright
+ImageFile.LOAD_TRUNCATED_IMAGES = True
 
-class ConverterThread(QThread):
+# Inputs are the user's own files, so large scans and canvases shouldn't trip the DecompressionBomb check
+Image.MAX_IMAGE_PIXELS = None
+
+# psd_tools and PyMuPDF are slow to import, so they are only loaded once a PSD or PDF needs converting
+@functools.lru_cache(maxsize=None)
+def _load_psd_image():
+    from psd_tools import PSDImage
+    return PSDImage
+
+@functools.lru_cache(maxsize=None)
+def _load_fitz():
+    """Return the PyMuPDF module, or None if it isn't installed"""
+    try:
+        import fitz
+    except ImportError:
+        return None
+    return fitz
+
+# PyMuPDF is not thread-safe; image workers embedding JPEGs in PDFs share it with PDF conversion
+_FITZ_LOCK = threading.Lock()
+
+# PDF image filters ("" is uncompressed) that extract_image returns losslessly, and the outputs they can be written as
+EMBEDDED_IMAGE_FORMATS = {'DCTDecode': ('jpg', 'jpeg'), 'FlateDecode': ('png',), '': ('png',)}
+
+# The extract_image "ext" whose bytes can be written unchanged as each output format
+EXTRACTED_IMAGE_EXTS = {'jpg': 'jpeg', 'jpeg': 'jpeg', 'png': 'png'}
+
+# Modes Pillow can write as BMP without converting first
+BMP_SAVE_MODES = ('1', 'L', 'P', 'RGB', 'RGBA')
+
+# Minimum seconds between progress updates sent to the UI
+PROGRESS_EMIT_INTERVAL = 0.1
+
+# Upper bound on the bytes held by rendered PDF pages that are waiting to be encoded
+PDF_PIXMAP_BUDGET = 512 * 1024 * 1024
+
+# Upper bound on images converted concurrently (each holds a decoded frame in memory)
+IMAGE_WORKERS = 4
+
+class ConverterThread(QThread, NcnnBatchMixin):
     progress_signal = pyqtSignal(int, str, str)
     completion_signal = pyqtSignal(str, float, float, int, int)
     error_signal = pyqtSignal(str, str)
@@ -39,189 +79,91 @@ class ConverterThread(QThread):
         self.success_count = 0
         self.failure_count = 0
         self.last_output_path = ""
+        self._last_progress_emit = 0.0
+        self.process = None  # The running upscaler
         
     def stop(self):
         """Stop the thread and terminate any running process"""
         self.running = False
         self.cancelled = True
         
-        # Terminate any running subprocess
-        if hasattr(self, 'process') and self.process:
+        # Terminate the upscaler so it doesn't keep the GPU busy
+        process = self.process
+        if process is not None:
             try:
-                self.process.terminate()
-            except Exception as e:
-                self.log_signal.emit(f"Error terminating process: {str(e)}", "ERROR")
+                process.terminate()
+            except OSError:
+                pass
         
     def run(self):
         self.start_time = time.time()
         
-        # Calculate total input size for progress tracking
-        for file_path in self.files:
-            try:
-                self.total_input_size += os.path.getsize(file_path)
-            except:
-                pass
+        # When upscaling, converted files are staged so the upscaler can process them in one batch
+        upscale_batch = self.enable_upscale and self.output_format in ['png', 'jpg', 'jpeg', 'webp']
+        self.total_steps = self.total_files * (2 if upscale_batch else 1)
+        if upscale_batch:
+            staging_dir = os.path.join(self.output_dir, "temp_upscale_in")
+            os.makedirs(staging_dir, exist_ok=True)
+        else:
+            staging_dir = self.output_dir
+        pending_upscale = []
+        self._pending_upscale = pending_upscale if upscale_batch else None
         
-        for file_path in self.files:
-            if not self.running:
-                break
-                
-            try:
-                # Get file extension and base name
-                file_ext = os.path.splitext(file_path)[1].lower()
-                base_name = os.path.basename(file_path)
-                base_name_without_ext = os.path.splitext(base_name)[0]
-                
-                # Create output filename
-                output_filename = f"{base_name_without_ext}.{self.output_format}"
-                output_path = os.path.join(self.output_dir, output_filename)
-                
-                # Convert based on file type
-                if file_ext == '.psd':
-                    self._convert_psd(file_path, output_path)
-                elif file_ext == '.pdf' and self.output_format != 'pdf':
-                    self._convert_pdf(file_path, output_path)
-                else:
-                    self._convert_image(file_path, output_path)
+        # Plain images are decoded and encoded on a worker pool (Pillow's codecs release
+        # the GIL), so slow encoders like WebP overlap across files. PSDs and PDFs stay on
+        # this thread because psd_tools is pure Python and PyMuPDF is not thread-safe.
+        max_workers = max(1, min(IMAGE_WORKERS, os.cpu_count() or 1))
+        in_flight = {}
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for file_path in self.files:
+                if not self.running:
+                    break
                 
-                # Apply AI upscaling if enabled
-                if self.enable_upscale and self.output_format.lower() in ['png', 'jpg', 'jpeg', 'webp']:
-                    scale_factor = int(self.upscale_settings.get('scale', '2x')[0])
-                    temp_output = output_path
-                    
-                    # Create a temporary filename for the upscaled version
-                    temp_upscaled = os.path.join(
-                        self.output_dir,
-                        f"{base_name_without_ext}_temp.{self.output_format}"
-                    )
-                    
-                    # Determine model and executable from upscale_settings
-                    model_name = self.upscale_settings.get('model', 'realesr').lower()
-                    style_model = self.upscale_settings.get('style_model', 'realesr-animevideov3')
-                    noise_level = self.upscale_settings.get('noise_level', -1)
-                    base_dir = os.path.dirname(os.path.abspath(__file__))
-                    
-                    if model_name == "waifu2x":
-                        exe_dir = os.path.join(base_dir, "waifu2x-ncnn-vulkan")
-                        exe_path = os.path.join(exe_dir, "waifu2x-ncnn-vulkan_waifu2xEX.exe")
-                        if not os.path.exists(exe_path):
-                            exe_path = os.path.join(exe_dir, "waifu2x-ncnn-vulkan.exe")
-                    elif model_name == "realcugan":
-                        exe_dir = os.path.join(base_dir, "realcugan-ncnn-vulkan")
-                        exe_path = os.path.join(exe_dir, "realcugan-ncnn-vulkan.exe")
-                    else:
-                        exe_dir = os.path.join(base_dir, "esr")
-                        exe_path = os.path.join(exe_dir, "realesrgan-ncnn-vulkan.exe")
+                # Accumulate input size as we go instead of a separate stat pass
+                try:
+                    self.total_input_size += os.path.getsize(file_path)
+                except OSError:
+                    pass
                     
-                    if not os.path.exists(exe_path):
-                        raise Exception(f"AI upscaler not found at: {exe_path}")
+                try:
+                    # Get file extension and base name
+                    file_ext = os.path.splitext(file_path)[1].lower()
+                    base_name = os.path.basename(file_path)
+                    base_name_without_ext = os.path.splitext(base_name)[0]
                     
-                    try:
-                        startupinfo = None
-                        if os.name == 'nt':
-                            startupinfo = subprocess.STARTUPINFO()
-                            startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
-                            startupinfo.wShowWindow = 0
-                        
-                        # Build command based on model type
-                        cmd = [exe_path, "-i", temp_output, "-o", temp_upscaled]
-                        
-                        if model_name == "waifu2x":
-                            cmd.extend(["-s", str(scale_factor), "-n", str(noise_level), "-m", style_model])
-                        elif model_name == "realcugan":
-                            if style_model == "models-se":
-                                cmd.extend(["-n", str(noise_level)])
-                            elif style_model == "models-nose":
-                                cmd.extend(["-n", "0"])
-                            cmd.extend(["-s", str(scale_factor), "-m", style_model])
-                        else:
-                            # ESRGAN variants
-                            esrgan_model = style_model if style_model and not style_model.startswith("models-") else "realesr-animevideov3"
-                            cmd.extend(["-s", str(scale_factor), "-n", esrgan_model])
-                        
-                        cmd.extend(["-f", self.output_format])
-                        
-                        # Use GPU (auto) unconditionally
-                        if model_name == "waifu2x":
-                            cmd.extend(["-g", "auto"])
-                        else:
-                            cmd.extend(["-g", "auto"])
-                            
-                        result = subprocess.run(cmd, stdout=subprocess.DEVNULL, 
-                           stderr=subprocess.PIPE,
-                           timeout=300, 
-                           startupinfo=startupinfo, 
-                           creationflags=subprocess.CREATE_NO_WINDOW,
-                           cwd=exe_dir)
-                        
-                        # Check process result and error output
-                        if result.returncode != 0:
-                            error_msg = result.stderr.decode().strip() if result.stderr else "Unknown error occurred"
-                            raise Exception(f"Upscaling process failed: {error_msg}")
-                            
-                        # Check if the output file exists
-                        if not os.path.exists(temp_upscaled):
-                            raise Exception("Upscaling failed: Output file was not created")
-                            
-                        # Update output path to upscaled version
-                        if os.path.exists(output_path):
-                            os.remove(output_path)
-                        os.rename(temp_upscaled, output_path)
-                        
-                    except subprocess.TimeoutExpired:
-                        if os.path.exists(temp_upscaled):
-                            os.remove(temp_upscaled)
-                        raise Exception("Upscaling process timed out after 5 minutes")
-                    except Exception as e:
-                        if os.path.exists(temp_upscaled):
-                            os.remove(temp_upscaled)
-                        raise Exception(f"Upscaling error: {str(e)}")                   
+                    # Create output filename
+                    output_filename = f"{base_name_without_ext}.{self.output_format}"
+                    output_path = os.path.join(staging_dir, output_filename)
                     
-                # Update progress
-                self.processed_files += 1
-                self.success_count += 1
-                self.last_output_path = output_path
-                
-                # Calculate output size
-                if os.path.exists(output_path):
-                    self.total_output_size += os.path.getsize(output_path)
-                
-                # Update progress
-                progress = int((self.processed_files / self.total_files) * 100)
-                
-                # Calculate ETA
-                elapsed_time = time.time() - self.start_time
-                if self.processed_files > 0:
-                    avg_time_per_file = elapsed_time / self.processed_files
-                    remaining_files = self.total_files - self.processed_files
-                    eta_seconds = avg_time_per_file * remaining_files
+                    # Never let two workers write the same file; finish the earlier one first
+                    for future, (_, busy_path) in list(in_flight.items()):
+                        if busy_path == output_path:
+                            wait([future])
+                            self._collect_image_jobs(in_flight, [future])
                     
-                    # Format ETA
-                    if eta_seconds < 60:
-                        eta_text = f"ETA: {int(eta_seconds)} seconds"
+                    # Convert based on file type
+                    if file_ext == '.psd':
+                        self._convert_psd(file_path, output_path)
+                        self._file_converted(file_path, [output_path])
+                    elif file_ext == '.pdf':
+                        with _FITZ_LOCK:
+                            written_paths = self._convert_pdf(file_path, output_path)
+                        self._file_converted(file_path, written_paths)
                     else:
-                        eta_text = f"ETA: {int(eta_seconds / 60)} minutes {int(eta_seconds % 60)} seconds"
-                else:
-                    eta_text = "Calculating ETA..."
-                
-                # Calculate processing speed
-                if elapsed_time > 0:
-                    files_per_second = self.processed_files / elapsed_time
-                    speed_text = f"Speed: {files_per_second:.2f} files/second"
-                else:
-                    speed_text = "Calculating speed..."
-                
-                self.progress_signal.emit(progress, eta_text, speed_text)
-                
-            except Exception as e:
-                self.failure_count += 1
-                error_message = f"Error converting {file_path}: {str(e)}"
-                self.error_signal.emit(error_message, "conversion_error")
-                
-                # Update progress even on error
-                self.processed_files += 1
-                progress = int((self.processed_files / self.total_files) * 100)
-                self.progress_signal.emit(progress, "Processing...", "Error occurred on last file")
+                        # Bound the number of decoded images held in memory
+                        if len(in_flight) >= max_workers:
+                            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                            self._collect_image_jobs(in_flight, done)
+                        in_flight[executor.submit(self._convert_image, file_path, output_path)] = (file_path, output_path)
+                    
+                except Exception as e:
+                    self._file_failed(file_path, e)
+            
+            self._collect_image_jobs(in_flight, as_completed(list(in_flight)))
+        
+        if upscale_batch:
+            self._upscale_staged(staging_dir, pending_upscale)
         
         # Clean up temp directory
         self.cleanup_temp_directory()
@@ -235,116 +177,382 @@ class ConverterThread(QThread):
             self.failure_count
         )
     
+    def _file_converted(self, file_path, written_paths):
+        """Account for a converted file, queueing it for upscaling when batching"""
+        self.processed_files += 1
+        
+        if self._pending_upscale is not None:
+            # AI upscaling happens for the whole batch once conversion is done
+            self._pending_upscale.append((file_path, written_paths))
+        else:
+            self._record_output(written_paths)
+        
+        # Update progress
+        self._update_progress_info(self.processed_files)
+    
+    def _file_failed(self, file_path, error):
+        """Report a file that could not be converted"""
+        self.failure_count += 1
+        error_message = f"Error converting {file_path}: {str(error)}"
+        self.error_signal.emit(error_message, "conversion_error")
+        
+        # Update progress even on error
+        self.processed_files += 1
+        progress = int((self.processed_files / self.total_steps) * 100)
+        self.progress_signal.emit(progress, "Processing...", "Error occurred on last file")
+    
+    def _collect_image_jobs(self, in_flight, finished):
+        """Account for finished image conversions and drop them from in_flight"""
+        for future in finished:
+            file_path, output_path = in_flight.pop(future)
+            try:
+                future.result()
+            except Exception as e:
+                self._file_failed(file_path, e)
+            else:
+                self._file_converted(file_path, [output_path])
+    
+    def _record_output(self, output_paths):
+        """Count a successfully produced file and add its outputs to the size total"""
+        self.success_count += 1
+        for output_path in output_paths:
+            self.last_output_path = output_path
+            
+            # Calculate output size
+            try:
+                self.total_output_size += os.stat(output_path).st_size
+            except FileNotFoundError:
+                pass
+    
+    def _update_progress_info(self, completed_steps):
+        """Calculate and emit progress information including ETA and speed"""
+        # Emit at most ~10 times a second; the final update always goes through
+        now = time.monotonic()
+        if now - self._last_progress_emit < PROGRESS_EMIT_INTERVAL and completed_steps < self.total_steps:
+            return
+        self._last_progress_emit = now
+        
+        progress = int((completed_steps / self.total_steps) * 100)
+        
+        # Calculate ETA
+        elapsed_time = time.time() - self.start_time
+        if completed_steps > 0:
+            avg_time_per_step = elapsed_time / completed_steps
+            remaining_steps = self.total_steps - completed_steps
+            eta_seconds = avg_time_per_step * remaining_steps
+            
+            # Format ETA
+            if eta_seconds < 60:
+                eta_text = f"ETA: {int(eta_seconds)} seconds"
+            else:
+                eta_text = f"ETA: {int(eta_seconds / 60)} minutes {int(eta_seconds % 60)} seconds"
+        else:
+            eta_text = "Calculating ETA..."
+        
+        # Calculate processing speed
+        if elapsed_time > 0:
+            files_per_second = completed_steps * self.total_files / self.total_steps / elapsed_time
+            speed_text = f"Speed: {files_per_second:.2f} files/second"
+        else:
+            speed_text = "Calculating speed..."
+        
+        self.progress_signal.emit(progress, eta_text, speed_text)
+    
+    def _upscale_staged(self, staging_dir, pending_upscale):
+        """Upscale all staged files in a single upscaler run and move them into the output directory"""
+        upscaled_dir = os.path.join(self.output_dir, "temp_upscale_out")
+        os.makedirs(upscaled_dir, exist_ok=True)
+        
+        upscale_error = "Output file was not created"
+        if pending_upscale and self.running:
+            try:
+                self._run_upscaler(staging_dir, upscaled_dir)
+            except Exception as e:
+                upscale_error = str(e)
+        
+        for file_path, written_paths in pending_upscale:
+            final_paths = []
+            all_upscaled = True
+            for staged_path in written_paths:
+                file_name = os.path.basename(staged_path)
+                upscaled_path = os.path.join(upscaled_dir, file_name)
+                final_path = os.path.join(self.output_dir, file_name)
+                
+                try:
+                    os.replace(upscaled_path, final_path)
+                except FileNotFoundError:
+                    # Keep the plain conversion if the upscaler didn't produce this file
+                    all_upscaled = False
+                    try:
+                        os.replace(staged_path, final_path)
+                    except FileNotFoundError:
+                        continue
+                final_paths.append(final_path)
+            
+            if all_upscaled:
+                self._record_output(final_paths)
+            else:
+                self.failure_count += 1
+                if self.running:
+                    self.error_signal.emit(f"Error converting {file_path}: Upscaling error: {upscale_error}", "conversion_error")
+        
+        shutil.rmtree(upscaled_dir, ignore_errors=True)
+        shutil.rmtree(staging_dir, ignore_errors=True)
+    
+    def _run_upscaler(self, input_dir, output_dir):
+        """Run the selected AI upscaler once over every file in input_dir"""
+        cmd, exe_dir = self._build_upscale_command(input_dir, output_dir)
+        file_count = max(1, len(os.listdir(input_dir)))
+        try:
+            returncode, error_output = self._run_ncnn(cmd, exe_dir, NCNN_SECONDS_PER_FILE * file_count)
+        except subprocess.TimeoutExpired:
+            raise Exception(f"Upscaling process timed out after {NCNN_SECONDS_PER_FILE * file_count // 60} minutes")
+        if returncode != 0 and self.running:
+            raise Exception(f"Upscaling process failed: {error_output or 'Unknown error occurred'}")
+    
+    def _emit_partial_progress(self):
+        """Count each file the upscaler finishes as the second step of its conversion"""
+        self._update_progress_info(self.processed_files + min(int(self._batch_progress), self.processed_files))
+    
+    def _build_upscale_command(self, input_path, output_path):
+        """Build the upscaler command line from upscale_settings, returning (cmd, exe_dir)"""
+        scale_factor = int(self.upscale_settings.get('scale', '2x')[0])
+        
+        # Determine model and executable from upscale_settings
+        model_name = self.upscale_settings.get('model', 'realesr').lower()
+        style_model = self.upscale_settings.get('style_model', 'realesr-animevideov3')
+        noise_level = self.upscale_settings.get('noise_level', -1)
+        base_dir = os.path.dirname(os.path.abspath(__file__))
+        
+        if model_name == "waifu2x":
+            exe_dir = os.path.join(base_dir, "waifu2x-ncnn-vulkan")
+            exe_path = os.path.join(exe_dir, "waifu2x-ncnn-vulkan_waifu2xEX.exe")
+            if not os.path.exists(exe_path):
+                exe_path = os.path.join(exe_dir, "waifu2x-ncnn-vulkan.exe")
+        elif model_name == "realcugan":
+            exe_dir = os.path.join(base_dir, "realcugan-ncnn-vulkan")
+            exe_path = os.path.join(exe_dir, "realcugan-ncnn-vulkan.exe")
+        else:
+            exe_dir = os.path.join(base_dir, "esr")
+            exe_path = os.path.join(exe_dir, "realesrgan-ncnn-vulkan.exe")
+        
+        if not os.path.exists(exe_path):
+            raise Exception(f"AI upscaler not found at: {exe_path}")
+        
+        # Build command based on model type
+        cmd = [exe_path, "-i", input_path, "-o", output_path]
+        
+        if model_name == "waifu2x":
+            cmd.extend(["-s", str(scale_factor), "-n", str(noise_level), "-m", style_model])
+        elif model_name == "realcugan":
+            if style_model == "models-se":
+                cmd.extend(["-n", str(noise_level)])
+            elif style_model == "models-nose":
+                cmd.extend(["-n", "0"])
+            cmd.extend(["-s", str(scale_factor), "-m", style_model])
+        else:
+            # ESRGAN variants
+            esrgan_model = style_model if style_model and not style_model.startswith("models-") else "realesr-animevideov3"
+            cmd.extend(["-s", str(scale_factor), "-n", esrgan_model])
+        
+        cmd.extend(["-f", self.output_format])
+        
+        # Use GPU (auto) unconditionally
+        cmd.extend(["-g", "auto"])
+        
+        return cmd, exe_dir
+    
     def cleanup_temp_directory(self):
         """Clean up any temporary files created during conversion"""
-        try:
-            temp_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "temp")
-            if os.path.exists(temp_dir):
-                for file in os.listdir(temp_dir):
-                    file_path = os.path.join(temp_dir, file)
-                    try:
-                        if os.path.isfile(file_path):
-                            os.unlink(file_path)
-                    except Exception as e:
-                        self.log_signal.emit(f"Error deleting temporary file {file_path}: {str(e)}", "ERROR")
-        except Exception as e:
-            self.log_signal.emit(f"Error cleaning up temporary directory: {str(e)}", "ERROR")
+        temp_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "temp")
+        shutil.rmtree(temp_dir, ignore_errors=True)
     
     def _convert_psd(self, input_path, output_path):
         try:
-            psd = PSDImage.open(input_path)
-            psd_image = psd.composite()
-            
-            output_dir = os.path.dirname(output_path)
-            if not os.path.exists(output_dir):
-                os.makedirs(output_dir)
-            
-            if not os.access(output_dir, os.W_OK):
-                raise Exception(f"Output directory is not writable: {output_dir}")
-            
-            # Handle color mode conversion for different formats
-            if self.output_format.lower() in ['jpg', 'jpeg'] and psd_image.mode in ['RGBA', 'LA', 'P']:
-                psd_image = psd_image.convert('RGB')
-            
-            self._save_image_with_settings(psd_image, output_path)
-            
-            del psd, psd_image
-            gc.collect()
+            psd = _load_psd_image().open(input_path)
+            # The composite's pixel buffer is freed by refcounting as soon as
+            # the with-block closes it; no full gc.collect() pass is needed
+            with psd.composite() as psd_image:
+                output_dir = os.path.dirname(output_path)
+                if not os.path.exists(output_dir):
+                    os.makedirs(output_dir)
+                
+                if not os.access(output_dir, os.W_OK):
+                    raise Exception(f"Output directory is not writable: {output_dir}")
+                
+                # Handle color mode conversion for different formats
+                if self.output_format in ['jpg', 'jpeg'] and psd_image.mode in ['RGBA', 'LA', 'P']:
+                    with psd_image.convert('RGB') as rgb_image:
+                        self._save_image_with_settings(rgb_image, output_path)
+                else:
+                    self._save_image_with_settings(psd_image, output_path)
             
         except Exception as e:
             raise Exception(f"PSD conversion error: {str(e)}")
     
     def _convert_pdf(self, input_path, output_path):
+        """Convert a PDF and return the list of files written"""
         try:
-            if PDF_CONVERTER == "pymupdf":
+            # PDF to PDF is a plain copy unless the user asked for the file to be rewritten
+            if self.output_format == 'pdf' and not self.settings.get('pdf_optimize', False):
+                try:
+                    shutil.copyfile(input_path, output_path)
+                except shutil.SameFileError:
+                    pass
+                return [output_path]
+            
+            fitz = _load_fitz()
+            if fitz is not None:
                 pdf_document = fitz.open(input_path)
                 
                 # Get DPI setting
                 dpi_setting = self.settings.get('pdf_dpi', '150 DPI')
                 dpi = int(dpi_setting.split()[0])  # Extract numeric part
                 
-                # Get quality setting
-                quality_setting = self.settings.get('pdf_quality', 'High')
-                quality_factor = 1.0
-                if quality_setting == 'High':
-                    quality_factor = 2.0
-                elif quality_setting == 'Medium':
-                    quality_factor = 1.5
-                else:  # Low
-                    quality_factor = 1.0
+                # Get quality setting (anything unrecognised renders like Low)
+                quality_factor = PDF_RENDER_SCALE_MAP.get(self.settings.get('pdf_quality', 'High'), 1.0)
                 
                 # Calculate zoom factor based on DPI and quality
                 zoom_factor = (dpi / 72.0) * quality_factor
                 
                 # If there's only one page, convert directly
                 if pdf_document.page_count == 1:
-                    page = pdf_document.load_page(0)
-                    pix = page.get_pixmap(matrix=fitz.Matrix(zoom_factor, zoom_factor))
-                    
-                    # Convert pixmap to PIL Image
-                    img = Image.frombytes("RGB", [pix.width, pix.height], pix.samples)
-                    
-                    if self.output_format.lower() == 'pdf':
+                    if self.output_format == 'pdf':
                         # Just copy the PDF file if output is also PDF
                         pdf_document.save(output_path, garbage=3, deflate=True)
                     else:
-                        self._save_image_with_settings(img, output_path)
+                        page = pdf_document.load_page(0)
+                        if not self._extract_page_image(page, output_path):
+                            pix = page.get_pixmap(matrix=fitz.Matrix(zoom_factor, zoom_factor), alpha=False)
+                            self._save_pixmap(pix, output_path)
                 else:
-                    # For multi-page PDFs, convert only the first page
                     base_name = os.path.splitext(output_path)[0]
-                    output_path = f"{base_name}_page1.{self.output_format}"
-                    
-                    page = pdf_document.load_page(0)
-                    pix = page.get_pixmap(matrix=fitz.Matrix(zoom_factor, zoom_factor))
-                    
-                    # Convert pixmap to PIL Image
-                    img = Image.frombytes("RGB", [pix.width, pix.height], pix.samples)
                     
-                    if self.output_format.lower() == 'pdf':
+                    if self.output_format == 'pdf':
                         # For PDF to PDF, extract just the first page
+                        output_path = f"{base_name}_page1.{self.output_format}"
                         new_pdf = fitz.open()
                         new_pdf.insert_pdf(pdf_document, from_page=0, to_page=0)
                         new_pdf.save(output_path, garbage=3, deflate=True)
                         new_pdf.close()
                     else:
-                        self._save_image_with_settings(img, output_path)
+                        # For multi-page PDFs, export every page (fewer if cancelled part way)
+                        page_paths = [f"{base_name}_page{i + 1}.{self.output_format}" for i in range(pdf_document.page_count)]
+                        written_paths = self._render_pdf_pages(pdf_document, zoom_factor, page_paths)
+                        pdf_document.close()
+                        return written_paths
                 
                 pdf_document.close()
+                return [output_path]
             else:
                 raise Exception("No PDF converter available. Please install PyMuPDF.")
                 
         except Exception as e:
             raise Exception(f"PDF conversion error: {str(e)}")
     
+    def _extract_page_image(self, page, output_path):
+        """Write a page that is just one full-page image straight from its embedded stream; returns True if it did"""
+        # Only streams already in the output format qualify, so scanned pages skip rasterizing and re-encoding
+        images = page.get_images(full=True)
+        if len(images) != 1 or page.rotation:
+            return False
+        xref, smask, filter_name = images[0][0], images[0][1], images[0][8]
+        if smask or self.output_format not in EMBEDDED_IMAGE_FORMATS.get(filter_name, ()):
+            return False
+        
+        # The image must be upright and exactly cover the page, with nothing drawn over it
+        placements = page.get_image_info()
+        if len(placements) != 1:
+            return False
+        a, b, c, d, _, _ = placements[0]['transform']
+        bbox = placements[0]['bbox']
+        if b or c or a <= 0 or d <= 0 or any(abs(x - y) > 0.5 for x, y in zip(bbox, page.rect)):
+            return False
+        if page.get_text().strip() or page.get_drawings():
+            return False
+        
+        # The filter name alone doesn't say what extract_image hands back (JPX, JBIG2, 16-bit samples...),
+        # so check the stream it actually returned before writing it as the output file
+        image = page.parent.extract_image(xref)
+        if (image.get('ext') != EXTRACTED_IMAGE_EXTS.get(self.output_format) or image.get('bpc') != 8
+                or image.get('colorspace') not in (1, 3)):
+            return False
+        with open(output_path, 'wb') as f:
+            f.write(image['image'])
+        return True
+    
+    def _save_pixmap(self, pix, output_path):
+        """Write a PyMuPDF pixmap, letting MuPDF encode it when it can honour the settings"""
+        if self.output_format == 'png' and self._get_compression_level(self.settings['png_compression']) == 6:
+            # MuPDF writes PNGs at zlib's default level 6, so only use it when that was asked for
+            pix.save(output_path, output='png')
+        else:
+            # MuPDF's JPEG writer doesn't subsample chroma (much larger files), and it can't
+            # write the other formats, so everything else goes through Pillow
+            self._save_image_with_settings(self._pixmap_image(pix), output_path)
+    
+    def _pixmap_image(self, pix):
+        """Wrap a pixmap's samples in a PIL Image without copying them; pix must outlive the image"""
+        # Pages are rendered with alpha=False, so the samples are packed RGB that every encoder takes as-is
+        return Image.frombuffer("RGB", (pix.width, pix.height), pix.samples_mv, "raw", "RGB", pix.stride, 1)
+    
+    def _save_page_image(self, img, pix, output_path):
+        """Save a rendered page; pix is passed along only to keep the image's pixel buffer alive"""
+        self._save_image_with_settings(img, output_path)
+    
+    def _render_pdf_pages(self, pdf_document, zoom_factor, page_paths):
+        """Render PDF pages in order and encode/save them on a worker pool; returns the paths written"""
+        # PyMuPDF is not thread-safe, so pages are rasterized on this thread while
+        # the Pillow encoders (which release the GIL) run in parallel
+        matrix = _load_fitz().Matrix(zoom_factor, zoom_factor)
+        max_workers = max(1, min(len(page_paths), os.cpu_count() or 1))
+        written_paths = []
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # Rendered pages waiting to be encoded, mapped to the bytes their pixmaps hold
+            pending = {}
+            for page_index, page_path in enumerate(page_paths):
+                if not self.running:
+                    break
+                
+                page = pdf_document.load_page(page_index)
+                if self._extract_page_image(page, page_path):
+                    written_paths.append(page_path)
+                    continue
+                
+                # Bound both the number of pages in flight and the memory their pixmaps use
+                # (a single 600 DPI page is hundreds of MB), before allocating the next one
+                rect = page.rect
+                page_bytes = int(rect.width * zoom_factor + 1) * int(rect.height * zoom_factor + 1) * 3
+                while pending and (len(pending) >= max_workers or sum(pending.values()) + page_bytes > PDF_PIXMAP_BUDGET):
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        del pending[future]
+                        future.result()
+                
+                pix = page.get_pixmap(matrix=matrix, alpha=False)
+                img = self._pixmap_image(pix)
+                pending[executor.submit(self._save_page_image, img, pix, page_path)] = page_bytes
+                written_paths.append(page_path)
+            
+            for future in as_completed(pending):
+                future.result()
+        
+        return written_paths
+    
     def _convert_image(self, input_path, output_path):
         try:
-            ImageFile.LOAD_TRUNCATED_IMAGES = True
-            
             with Image.open(input_path) as img:
+                # JPEGs can go into a PDF as-is instead of being decoded and re-encoded
+                if (self.output_format == 'pdf' and img.format == 'JPEG' and img.mode in ['RGB', 'L']
+                        and self.settings.get('pdf_quality', 'High') == 'High'):
+                    if self._embed_jpeg_in_pdf(input_path, img.size, output_path):
+                        return
+                
                 # Handle color mode conversion for different formats
-                if self.output_format.lower() in ['jpg', 'jpeg'] and img.mode in ['RGBA', 'LA', 'P']:
+                if self.output_format in ['jpg', 'jpeg'] and img.mode in ['RGBA', 'LA', 'P']:
                     img = img.convert('RGB')
-                elif self.output_format.lower() == 'png' and img.mode == 'P':
+                elif self.output_format == 'png' and img.mode == 'P':
                     img = img.convert('RGBA')
                 
                 self._save_image_with_settings(img, output_path)
@@ -352,76 +560,100 @@ class ConverterThread(QThread):
         except Exception as e:
             raise Exception(f"Image conversion error: {str(e)}")
 
+    def _embed_jpeg_in_pdf(self, input_path, size, output_path):
+        """Write a one-page PDF wrapping the original JPEG stream; returns False without PyMuPDF"""
+        fitz = _load_fitz()
+        if fitz is None:
+            return False
+        
+        dpi = int(self.settings.get('pdf_dpi', '150 DPI').split()[0])
+        width, height = size
+        with open(input_path, 'rb') as f:
+            jpeg_bytes = f.read()
+        
+        with _FITZ_LOCK:
+            pdf_document = fitz.open()
+            try:
+                page = pdf_document.new_page(width=width * 72 / dpi, height=height * 72 / dpi)
+                page.insert_image(page.rect, stream=jpeg_bytes)
+                pdf_document.save(output_path, garbage=3)
+            finally:
+                pdf_document.close()
+        return True
+    
     def _save_image_with_settings(self, img, output_path):
         """Save a PIL Image using the current format settings."""
-        # Save with appropriate settings for each format
-        if self.output_format.lower() in ['jpg', 'jpeg']:
-            quality = self._get_quality_value(self.settings['jpeg_quality'])
-            img.save(output_path, quality=quality, optimize=True)
-            
-        elif self.output_format.lower() == 'png':
-            compression = self._get_compression_level(self.settings['png_compression'])
-            # Fix PNG compression by using correct parameters
-            img.save(output_path, format='PNG', compress_level=int(compression), optimize=False)
-            
-        elif self.output_format.lower() == 'webp':
-            quality = self._get_quality_value(self.settings['webp_quality'])
-            img.save(output_path, quality=quality, method=6)
-            
-        elif self.output_format.lower() == 'tiff':
-            img.save(output_path, format='TIFF', compression='tiff_deflate')
-            
-        elif self.output_format.lower() == 'bmp':
-            img.save(output_path, format='BMP')
-            
-        elif self.output_format.lower() == 'gif':
-            if img.mode != 'P':
-                img = img.convert('P')
-            img.save(output_path, format='GIF')
-            
-        elif self.output_format.lower() == 'pdf':
-            # Convert image to PDF with quality settings
-            img_rgb = img.convert('RGB')
-            
-            # Get PDF quality and DPI settings
-            quality_setting = self.settings.get('pdf_quality', 'High')
-            dpi_setting = self.settings.get('pdf_dpi', '150 DPI')
-            
-            # Extract DPI value from setting
-            dpi = int(dpi_setting.split()[0])
-            
-            # Apply quality factor based on setting
-            quality_factor = 1.0
-            if quality_setting == 'High':
-                quality_factor = 1.0  # No compression
-            elif quality_setting == 'Medium':
-                quality_factor = 0.8  # Medium compression
-            else:  # Low
-                quality_factor = 0.6  # Higher compression
-            
-            # Save with appropriate resolution and quality
-            img_rgb.save(output_path, format='PDF', resolution=dpi, quality=int(95 * quality_factor))
-            
-        else:
+        saver = self._SAVERS.get(self.output_format)
+        if saver is None:
             img.save(output_path)
+        else:
+            saver(self, img, output_path)
+    
+    def _save_jpeg(self, img, output_path):
+        quality = self._get_quality_value(self.settings['jpeg_quality'])
+        img.save(output_path, quality=quality, optimize=True)
+    
+    def _save_png(self, img, output_path):
+        compression = self._get_compression_level(self.settings['png_compression'])
+        img.save(output_path, format='PNG', compress_level=compression)
+    
+    def _save_webp(self, img, output_path):
+        quality = self._get_quality_value(self.settings['webp_quality'])
+        img.save(output_path, quality=quality, method=self._get_webp_method(self.settings.get('webp_method', 'Balanced')))
+    
+    def _save_tiff(self, img, output_path):
+        img.save(output_path, format='TIFF', compression='tiff_deflate')
+    
+    def _save_bmp(self, img, output_path):
+        # Pillow's BMP writer only takes 1/L/P/RGB/RGBA; anything else (CMYK, LA, 16-bit) would fail
+        if img.mode not in BMP_SAVE_MODES:
+            img = img.convert('RGBA' if 'A' in img.mode else 'RGB')
+        img.save(output_path, format='BMP')
+    
+    def _save_gif(self, img, output_path):
+        if img.mode == 'RGB':
+            # Fast octree builds an adaptive palette in about half the time of the default
+            # web palette + Floyd-Steinberg pass, and matches the colours more closely
+            img = img.quantize(256, method=Image.Quantize.FASTOCTREE)
+        elif img.mode != 'P':
+            img = img.convert('P')
+        img.save(output_path, format='GIF')
+    
+    def _save_pdf(self, img, output_path):
+        # Convert image to PDF with quality settings; convert() always copies, so skip it for RGB input
+        img_rgb = img if img.mode == 'RGB' else img.convert('RGB')
+        
+        # Get PDF quality and DPI settings (anything unrecognised saves like Low)
+        quality = PDF_JPEG_QUALITY_MAP.get(self.settings.get('pdf_quality', 'High'), 57)
+        dpi_setting = self.settings.get('pdf_dpi', '150 DPI')
+        
+        # Extract DPI value from setting
+        dpi = int(dpi_setting.split()[0])
+        
+        # Save with appropriate resolution and quality
+        img_rgb.save(output_path, format='PDF', resolution=dpi, quality=quality)
+    
+    # Output format -> saver, looked up once per image instead of walking an if/elif chain
+    _SAVERS = {
+        'jpg': _save_jpeg,
+        'jpeg': _save_jpeg,
+        'png': _save_png,
+        'webp': _save_webp,
+        'tiff': _save_tiff,
+        'bmp': _save_bmp,
+        'gif': _save_gif,
+        'pdf': _save_pdf,
+    }
 
     def _get_quality_value(self, quality_setting):
         """Convert quality setting to numerical value"""
-        quality_map = {
-            "Maximum": 95,
-            "High": 85,
-            "Medium": 70,
-            "Low": 50
-        }
-        return quality_map.get(quality_setting, 85)
+        return QUALITY_MAP.get(quality_setting, 85)
 
     def _get_compression_level(self, compression_setting):
         """Convert compression setting to numerical value"""
-        compression_map = {
-            "None": 0,
-            "Fast": 1,
-            "Normal": 6,
-            "Maximum": 9
-        }
-        return compression_map.get(compression_setting, 6)
+        return COMPRESSION_MAP.get(compression_setting, 4)
+
+    def _get_webp_method(self, method_setting):
+        """Convert WEBP encoding setting to libwebp's method (effort) value"""
+        return WEBP_METHOD_MAP.get(method_setting, 4)
 
@@ -1,34 +1,30 @@
 import os
 import sys
 import time
-import subprocess
-import gc
-from pathlib import Path
 from PyQt6.QtCore import QThread, pyqtSignal
-from PIL import Image, ImageFile
-from psd_tools import PSDImage
+from src.core.ncnn_batch import NcnnBatchMixin, BATCH_FORMATS
 
-try:
-    import fitz
-    PDF_CONVERTER = "pymupdf"
-except ImportError:
-    PDF_CONVERTER = None
+# Minimum seconds between in-file progress updates sent to the UI
+PROGRESS_EMIT_INTERVAL = 0.1
 
-class DenoiserThread(QThread):
+class DenoiserThread(QThread, NcnnBatchMixin):
     """Thread for handling image denoising operations"""
     progress_signal = pyqtSignal(int, str, str)
     completion_signal = pyqtSignal(str, float, float, int, int)
     error_signal = pyqtSignal(str, str)
     log_signal = pyqtSignal(str, str)  # Add this signal for logging
+    NCNN_TASK = "Denoising"
     
-    def __init__(self, files, output_dir, noise_level=1, model="anime", keep_format=True, output_format="PNG"):
+    def __init__(self, files, output_dir, noise_level=1, model="anime", keep_format=True, output_format="PNG", threads=None):
         super().__init__()
         self.files = files
         self.output_dir = output_dir
         self.noise_level = noise_level
+        self.noise_arg = str(noise_level)
         self.model = "models-cunet" if model == "anime" else "models-upconv_7_photo"
         self.keep_format = keep_format
         self.output_format = output_format.lower()
+        self.threads = threads or self._default_threads()
         self.running = True
         self.cancelled = False
         self.total_files = len(files)
@@ -39,95 +35,63 @@ class DenoiserThread(QThread):
         self.success_count = 0
         self.failure_count = 0
         self.last_output_path = ""
+        self.process = None  # The running denoiser
     
     def stop(self):
-        """Stop the thread"""
+        """Stop the thread and terminate the running denoiser"""
         self.running = False
+        self.cancelled = True
+        
+        # Terminate the denoiser so it doesn't keep the GPU busy
+        process = self.process
+        if process is not None:
+            try:
+                process.terminate()
+            except OSError:
+                pass
     
     def run(self):
         """Main thread execution method"""
         self.start_time = time.time()
+        self._batch_progress = 0.0  # Files of the running batch done, with the current one's fraction
+        self._last_progress_emit = 0.0
+        self._last_progress = -1
         
-        # Calculate total input size
+        # The executable is located once for every batch
+        self.denoiser_path = self._find_denoiser()
+        
+        # Files are grouped by the format the denoiser writes and denoised with one process
+        # per group, so the Vulkan and model start-up is paid once instead of once per file
+        batches = {}
         for file_path in self.files:
+            # Total input size is summed here instead of in a separate stat pass
             try:
-                self.total_input_size += os.path.getsize(file_path)
-            except:
-                pass
+                self.total_input_size += os.stat(file_path).st_size
+            except OSError:
+                self._file_failed(file_path, f"Input file not found: {file_path}")
+                continue
+            
+            output_path = self._output_path(file_path)
+            file_ext = os.path.splitext(file_path)[1]
+            
+            # Formats the denoiser can't write (BMP, TIFF, ...) are denoised to PNG and
+            # re-encoded by Pillow
+            tool_format = BATCH_FORMATS.get(os.path.splitext(output_path)[1].lower())
+            reencode = tool_format is None
+            batches.setdefault(tool_format or 'png', []).append((file_path, output_path, file_ext, reencode))
         
-        for file_path in self.files:
+        for tool_format, jobs in batches.items():
             if not self.running:
                 break
-                
             try:
-                # Get file extension and base name
-                file_ext = os.path.splitext(file_path)[1].lower()
-                base_name = os.path.basename(file_path)
-                base_name_without_ext = os.path.splitext(base_name)[0]
-                
-                # Log the denoising process
-                self.log_signal.emit(f"Denoising {file_path} with noise level {self.noise_level} using {self.model}", "INFO")
-
-                # Determine output format
-                output_ext = file_ext if self.keep_format else f".{self.output_format}"
-                if not output_ext.startswith('.'):
-                    output_ext = f".{output_ext}"
-                
-                # Create output filename with _denoised suffix
-                output_filename = f"{base_name_without_ext}_denoised{output_ext}"
-                output_path = os.path.join(self.output_dir, output_filename)
-                
-                # Run waifu2x-ncnn-vulkan for denoising
-                self._denoise_image(file_path, output_path)
-                
-                # Update progress
-                self.processed_files += 1
-                self.success_count += 1
-                self.last_output_path = output_path
-                
-                # Calculate output size
-                if os.path.exists(output_path):
-                    self.total_output_size += os.path.getsize(output_path)
-                
-                # Update progress
-                progress = int((self.processed_files / self.total_files) * 100)
-                elapsed_time = time.time() - self.start_time
-                remaining_files = self.total_files - self.processed_files
-                
-                if self.processed_files > 0 and remaining_files > 0:
-                    # Calculate ETA
-                    avg_time_per_file = elapsed_time / self.processed_files
-                    eta_seconds = avg_time_per_file * remaining_files
-                    
-                    # Format ETA
-                    if eta_seconds < 60:
-                        eta_text = f"ETA: {eta_seconds:.0f} seconds"
-                    elif eta_seconds < 3600:
-                        eta_text = f"ETA: {eta_seconds/60:.1f} minutes"
-                    else:
-                        eta_text = f"ETA: {eta_seconds/3600:.1f} hours"
-                    
-                    # Calculate processing speed
-                    if elapsed_time > 0:
-                        files_per_second = self.processed_files / elapsed_time
-                        speed_text = f"Speed: {files_per_second:.2f} files/sec"
-                    else:
-                        speed_text = "Speed: calculating..."
-                    
-                    # Send progress update
-                    self.progress_signal.emit(progress, eta_text, speed_text)
-                else:
-                    self.progress_signal.emit(progress, "Processing...", "Starting...")
-                
+                self._check_output_dir()
             except Exception as e:
-                self.failure_count += 1
-                error_message = f"Error denoising {file_path}: {str(e)}"
-                self.error_signal.emit(error_message, "denoising_error")
-                
-                # Update progress even on error
-                self.processed_files += 1
-                progress = int((self.processed_files / self.total_files) * 100)
-                self.progress_signal.emit(progress, "Processing...", "Error occurred on last file")
+                for file_path, _, _, _ in jobs:
+                    self._file_failed(file_path, e)
+                continue
+            self.log_signal.emit(f"Denoising {len(jobs)} files with noise level {self.noise_level} using {self.model}", "INFO")
+            self._ncnn_batch(jobs, tool_format,
+                             lambda batch_in, batch_out: self._denoise_command(batch_in, batch_out, tool_format))
         
         # Emit completion signal
         self.completion_signal.emit(
@@ -138,73 +102,123 @@ class DenoiserThread(QThread):
             self.failure_count
         )
     
-    def _denoise_image(self, input_path, output_path):
-        """Run waifu2x-ncnn-vulkan to denoise an image"""
-        # Check if input file exists and is a supported format
-        if not os.path.exists(input_path):
-            raise Exception(f"Input file not found: {input_path}")
+    def _default_threads(self):
+        """Return a load:proc:save thread triple sized to the machine's cores"""
+        # Only one denoiser runs at a time, so it can use every core; more than 4 threads
+        # only fight over the caches, and saving needs about half as many as loading
+        n = max(1, min(4, os.cpu_count() or 1))
+        return f"{n}:{n}:{max(1, n // 2)}"
+    
+    def _output_path(self, file_path):
+        """Return the _denoised output path for an input file"""
+        # Get file extension and base name
+        file_ext = os.path.splitext(file_path)[1].lower()
+        base_name_without_ext = os.path.splitext(os.path.basename(file_path))[0]
         
-        # Create output directory if it doesn't exist
-        output_dir = os.path.dirname(output_path)
-        if not os.path.exists(output_dir):
-            os.makedirs(output_dir)
+        # Determine output format
+        output_ext = file_ext if self.keep_format else f".{self.output_format}"
+        if not output_ext.startswith('.'):
+            output_ext = f".{output_ext}"
         
-        # Check if output directory is writable
-        if not os.access(output_dir, os.W_OK):
-            raise Exception(f"Output directory is not writable: {output_dir}")
+        # Create output filename with _denoised suffix
+        output_filename = f"{base_name_without_ext}_denoised{output_ext}"
+        return os.path.join(self.output_dir, output_filename)
+    
+    def _file_done(self, output_path):
+        """Account for a denoised file and report progress"""
+        self.processed_files += 1
+        self.success_count += 1
+        self.last_output_path = output_path
         
-        # Get waifu2x-ncnn-vulkan path
-        denoiser_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 
-                                   "waifu2x-ncnn-vulkan", 
-                                   "waifu2x-ncnn-vulkan_waifu2xEX.exe")
+        # Calculate output size
+        if os.path.exists(output_path):
+            self.total_output_size += os.path.getsize(output_path)
         
-        # Check if the denoiser exists
-        if not os.path.exists(denoiser_path):
-            # Try alternate executable name
-            denoiser_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 
-                                      "waifu2x-ncnn-vulkan", 
-                                      "waifu2x-ncnn-vulkan.exe")
-            if not os.path.exists(denoiser_path):
-                raise Exception(f"Denoiser executable not found in waifu2x-ncnn-vulkan directory")
+        # Update progress; the batch's own progress lines may already have moved the bar further
+        progress = max(int((self.processed_files / self.total_files) * 100), self._last_progress)
+        elapsed_time = time.time() - self.start_time
+        remaining_files = self.total_files - self.processed_files
         
-        try:
-            # Create startupinfo to hide console window
-            startupinfo = None
-            if os.name == 'nt':  # Windows
-                startupinfo = subprocess.STARTUPINFO()
-                startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
-                startupinfo.wShowWindow = 0  # SW_HIDE
+        if self.processed_files > 0 and remaining_files > 0:
+            # Calculate ETA
+            avg_time_per_file = elapsed_time / self.processed_files
+            eta_seconds = avg_time_per_file * remaining_files
             
-            # Run the denoiser
-            result = subprocess.run([
-                denoiser_path,
-                "-i", input_path,
-                "-o", output_path,
-                "-n", str(self.noise_level),  # Noise level (-1 to 3)
-                "-s", "1",  # Scale 1x (no upscaling)
-                "-m", self.model,  # Model path
-                "-f", os.path.splitext(output_path)[1].lower().lstrip('.'),  # Force output format
-                "-g", "auto",  # Auto GPU selection
-                "-j", f"{os.cpu_count()}:{os.cpu_count()}:{os.cpu_count()}"
-                 # Use 2 threads for loading/processing/saving
-            ], stdout=subprocess.PIPE, 
-               stderr=subprocess.PIPE,
-               timeout=300, 
-               startupinfo=startupinfo, 
-               creationflags=subprocess.CREATE_NO_WINDOW)
+            # Format ETA
+            if eta_seconds < 60:
+                eta_text = f"ETA: {eta_seconds:.0f} seconds"
+            elif eta_seconds < 3600:
+                eta_text = f"ETA: {eta_seconds/60:.1f} minutes"
+            else:
+                eta_text = f"ETA: {eta_seconds/3600:.1f} hours"
             
-            # Check process result and error output
-            if result.returncode != 0:
-                error_msg = result.stderr.decode().strip() if result.stderr else "Unknown error occurred"
-                raise Exception(f"Denoising process failed: {error_msg}")
+            # Calculate processing speed
+            if elapsed_time > 0:
+                files_per_second = self.processed_files / elapsed_time
+                speed_text = f"Speed: {files_per_second:.2f} files/sec"
+            else:
+                speed_text = "Speed: calculating..."
             
-            # Check if the output file exists
-            if not os.path.exists(output_path):
-                raise Exception("Denoising failed: Output file was not created")
-                
-        except subprocess.TimeoutExpired:
-            raise Exception("Denoising process timed out after 5 minutes")
-        except Exception as e:
-            raise Exception(f"Denoising error: {str(e)}")
-
-
+            # Send progress update
+            self.progress_signal.emit(progress, eta_text, speed_text)
+        else:
+            self.progress_signal.emit(progress, "Processing...", "Starting...")
+    
+    def _emit_partial_progress(self):
+        """Report progress through the files being denoised, at most ~10 times a second"""
+        now = time.monotonic()
+        if now - self._last_progress_emit < PROGRESS_EMIT_INTERVAL:
+            return
+        done = self.processed_files + self._batch_progress
+        progress = int(done / self.total_files * 100)
+        if progress <= self._last_progress:
+            return  # The bar wouldn't move
+        self._last_progress_emit = now
+        self._last_progress = progress
+        self.progress_signal.emit(progress, "Processing...", f"Denoised {int(done)} of {self.total_files} files")
+    
+    def _file_failed(self, file_path, error):
+        """Report a file that could not be denoised"""
+        self.failure_count += 1
+        error_message = f"Error denoising {file_path}: {str(error)}"
+        self.error_signal.emit(error_message, "denoising_error")
+        
+        # Update progress even on error
+        self.processed_files += 1
+        progress = int((self.processed_files / self.total_files) * 100)
+        self.progress_signal.emit(progress, "Processing...", "Error occurred on last file")
+    
+    def _check_output_dir(self):
+        """Create the output directory if needed and make sure it is writable"""
+        if not os.path.exists(self.output_dir):
+            os.makedirs(self.output_dir)
+        
+        if not os.access(self.output_dir, os.W_OK):
+            raise Exception(f"Output directory is not writable: {self.output_dir}")
+        
+        # The executable is located once per run
+        if self.denoiser_path is None:
+            raise Exception(f"Denoiser executable not found in waifu2x-ncnn-vulkan directory")
+    
+    def _denoise_command(self, batch_in, batch_out, tool_format):
+        """Build the waifu2x command line that denoises batch_in into batch_out, returning (cmd, working directory)"""
+        return [
+            self.denoiser_path,
+            "-i", batch_in,
+            "-o", batch_out,
+            "-n", self.noise_arg,  # Noise level (-1 to 3)
+            "-s", "1",  # Scale 1x (no upscaling)
+            "-m", self.model,  # Model path
+            "-f", tool_format,  # Force output format
+            "-g", "auto",  # Auto GPU selection
+            "-j", self.threads  # Threads for loading/processing/saving
+        ], None
+    
+    def _find_denoiser(self):
+        """Return the waifu2x-ncnn-vulkan executable, or None if neither build is present"""
+        tool_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "waifu2x-ncnn-vulkan")
+        for exe_name in ("waifu2x-ncnn-vulkan_waifu2xEX.exe", "waifu2x-ncnn-vulkan.exe"):
+            denoiser_path = os.path.join(tool_dir, exe_name)
+            if os.path.exists(denoiser_path):
+                return denoiser_path
+        return None
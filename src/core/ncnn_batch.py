@@ -0,0 +1,152 @@
+import os
+import shutil
+import tempfile
+import subprocess
+import threading
+from collections import deque
+from PIL import Image
+
+# Output extensions the ncnn-vulkan tools can write themselves (their -f values)
+BATCH_FORMATS = {'.png': 'png', '.jpg': 'jpg', '.jpeg': 'jpg', '.webp': 'webp'}
+
+# Seconds each file of a batch may take before the whole run is killed
+NCNN_SECONDS_PER_FILE = 300
+
+class NcnnBatchMixin:
+    """Runs an ncnn-vulkan tool (waifu2x, Real-ESRGAN, Real-CUGAN) once over a whole batch of files"""
+    # The thread provides running, cancelled, process and output_dir, plus the hooks
+    # _emit_partial_progress(), _file_failed(file_path, error) and _file_done(output_path)
+    NCNN_TASK = "Processing"  # Names the work in error messages
+
+    def _ncnn_batch(self, jobs, tool_format, build_command):
+        """Process (input, output, input extension, re-encode) jobs with one tool run over a staging directory"""
+        # Staging next to the output keeps hard links and the final moves on one filesystem
+        batch_dir = tempfile.mkdtemp(prefix="temp_ncnn_", dir=self.output_dir)
+        batch_in = os.path.join(batch_dir, "in")
+        batch_out = os.path.join(batch_dir, "out")
+        os.makedirs(batch_in)
+        os.makedirs(batch_out)
+
+        try:
+            staged = self._stage_batch(jobs, batch_in, batch_out, tool_format)
+            if staged:
+                error = self._run_ncnn_batch(build_command, batch_in, batch_out, len(staged))
+                self._collect_batch(staged, error)
+        finally:
+            shutil.rmtree(batch_dir, ignore_errors=True)
+
+    def _stage_batch(self, jobs, batch_in, batch_out, tool_format):
+        """Link (or copy) the inputs into batch_in; returns (input, output, tool output, re-encode) for each"""
+        # Stage under numbered names so inputs sharing a name can't collide; the
+        # tool writes each result as <stem>.<format> in the output directory
+        staged = []
+        for index, (file_path, output_path, file_ext, reencode) in enumerate(jobs):
+            stem = f"{index:06d}"
+            staged_path = os.path.join(batch_in, stem + file_ext)
+            try:
+                try:
+                    os.link(file_path, staged_path)
+                except OSError:
+                    shutil.copyfile(file_path, staged_path)
+            except OSError as e:
+                self._file_failed(file_path, f"Failed to stage file: {str(e)}")
+                continue
+            staged.append((file_path, output_path, os.path.join(batch_out, f"{stem}.{tool_format}"), reencode))
+        return staged
+
+    def _run_ncnn_batch(self, build_command, batch_in, batch_out, file_count):
+        """Run the tool over batch_in; returns the error to report for any file it didn't write"""
+        error = f"{self.NCNN_TASK} failed: output file was not created"
+        try:
+            cmd, cwd = build_command(batch_in, batch_out)
+            returncode, error_output = self._run_ncnn(cmd, cwd, NCNN_SECONDS_PER_FILE * file_count)
+            if returncode != 0:
+                error = f"{self.NCNN_TASK} process failed (code {returncode}): {error_output or 'Unknown error occurred'}"
+            elif error_output:
+                error = f"{error}. Error output:\n{error_output}"
+        except subprocess.TimeoutExpired:
+            error = f"{self.NCNN_TASK} timed out after {NCNN_SECONDS_PER_FILE * file_count // 60} minutes"
+        except Exception as e:
+            error = f"{self.NCNN_TASK} error: {str(e)}"
+        return error
+
+    def _collect_batch(self, staged, error):
+        """Move (or re-encode) each result to its final name, reporting the ones the tool didn't write"""
+        for file_path, output_path, result_path, reencode in staged:
+            if self.cancelled:
+                break
+            try:
+                if reencode:
+                    with Image.open(result_path) as img:
+                        img.save(output_path)
+                else:
+                    os.replace(result_path, output_path)
+            except FileNotFoundError:
+                self._file_failed(file_path, error)
+            except Exception as e:
+                self._file_failed(file_path, f"Failed to save output image: {str(e)}")
+            else:
+                self._file_done(output_path)
+
+    def _run_ncnn(self, cmd, cwd, timeout):
+        """Run an ncnn tool, streaming its stderr for progress; returns (returncode, tail of the error output)"""
+        # Verbose mode prints one "<input> -> <output> done" line per finished file
+        process = subprocess.Popen(
+            cmd + ["-v"],
+            stdout=subprocess.DEVNULL,  # Never read; only stderr is reported on failure
+            stderr=subprocess.PIPE,
+            startupinfo=self._startupinfo(),
+            creationflags=subprocess.CREATE_NO_WINDOW,
+            cwd=cwd
+        )
+        self.process = process
+        self._batch_progress = 0.0  # Files of the run done, with the current one's fraction
+
+        timed_out = threading.Event()
+        def kill_on_timeout():
+            timed_out.set()
+            process.kill()
+        timer = threading.Timer(timeout, kill_on_timeout)
+        timer.start()
+
+        # Reading as it arrives keeps the pipe drained; only the last lines are kept for error messages
+        error_lines = deque(maxlen=64)
+        files_done = 0
+        try:
+            for raw_line in process.stderr:
+                if not self.running:
+                    process.terminate()
+                    break
+                line = raw_line.decode('utf-8', errors='ignore').strip()
+                if line.endswith('%'):
+                    # Per-image progress like "37.50%" moves the bar between finished files
+                    try:
+                        self._batch_progress = files_done + float(line[:-1]) / 100
+                    except ValueError:
+                        continue
+                    self._emit_partial_progress()
+                elif line.endswith(" done"):
+                    files_done += 1
+                    self._batch_progress = files_done
+                    self._emit_partial_progress()
+                elif line:
+                    error_lines.append(line)
+            returncode = process.wait()
+        finally:
+            timer.cancel()
+            process.stderr.close()
+            self.process = None
+            self._batch_progress = 0.0
+
+        if timed_out.is_set():
+            raise subprocess.TimeoutExpired(cmd, timeout)
+        return returncode, "\n".join(error_lines)
+
+    def _startupinfo(self):
+        """Create startupinfo that hides the tool's console window on Windows"""
+        startupinfo = None
+        if os.name == 'nt':  # Windows
+            startupinfo = subprocess.STARTUPINFO()
+            startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
+            startupinfo.wShowWindow = 0  # SW_HIDE
+        return startupinfo
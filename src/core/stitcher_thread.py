@@ -1,18 +1,33 @@
 import os
 import re
-import time
-import subprocess
-import gc
-from pathlib import Path
+import math
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import numpy as np
 from PyQt6.QtCore import QThread, pyqtSignal
-from PIL import Image, ImageFile
-from psd_tools import PSDImage
+from PIL import Image
 
-try:
-    import fitz
-    PDF_CONVERTER = "pymupdf"
-except ImportError:
-    PDF_CONVERTER = None
+STITCH_EXTENSIONS = frozenset({'.png', '.jpg', '.jpeg', '.webp', '.bmp', '.gif', '.tiff', '.tif'})
+
+# Output format -> (Pillow format, save options); anything else is inferred from the extension
+STITCH_SAVE_ARGS = {
+    'jpg': ('JPEG', {'quality': 95}),
+    'jpeg': ('JPEG', {'quality': 95}),
+    'png': ('PNG', {}),
+    'webp': ('WEBP', {'quality': 95}),
+}
+
+# Largest side each format can encode; bigger stitches are split into parts
+STITCH_MAX_DIMENSIONS = {'webp': 16300, 'jpg': 65500, 'jpeg': 65500}
+
+# Folders stitched at once; each keeps its own full-size canvas, so this bounds how many are in memory
+STITCH_FOLDER_WORKERS = 2
+
+_NATSORT_SPLIT = re.compile(r'(\d+)').split
+
+def _natural_key(path, _split=_NATSORT_SPLIT, _basename=os.path.basename):
+    """Natural sort key on the file name, so page2 sorts before page10"""
+    return [int(t) if t.isdigit() else t.lower() for t in _split(_basename(path))]
 
 class StitcherThread(QThread):
     """Thread for stitching images together"""
@@ -20,7 +35,7 @@ class StitcherThread(QThread):
     finished_signal = pyqtSignal(int, int, str)
     error_signal = pyqtSignal(str)
     
-    def __init__(self, folders, output_dir, is_vertical, spacing, output_format, virtual_files=None, alignment="Center", bg_color="Transparent", resize_option="Don't Resize", reverse_order=False):
+    def __init__(self, folders, output_dir, is_vertical, spacing, output_format, virtual_files=None, alignment="Center", bg_color="Transparent", resize_option="Don't Resize", reverse_order=False, fast_jpeg_decode=False):
         super().__init__()
         self.folders = folders
         self.output_dir = output_dir
@@ -32,60 +47,150 @@ class StitcherThread(QThread):
         self.bg_color = bg_color
         self.resize_option = resize_option
         self.reverse_order = reverse_order
+        self.fast_jpeg_decode = fast_jpeg_decode
         self.running = True
+        
+        # Canvas memory reused across folders so similarly sized stitches don't remap pages.
+        # Kept per worker thread since folders are stitched concurrently.
+        self._canvas = threading.local()
     
     def run(self):
         """Run the stitching process"""
         success_count = 0
         error_count = 0
+        completed = 0
         
         # Create output directory if it doesn't exist
         os.makedirs(self.output_dir, exist_ok=True)
         
-        # Process each folder
-        for i, folder_path in enumerate(self.folders):
-            if not self.running:
-                break
-                
-            try:
-                # Get folder name for output file
-                if folder_path.startswith("virtual:"):
-                    folder_name = folder_path.split(":", 1)[1]
+        # Folders are independent jobs, so stitch a couple at once (each already decodes its pages in parallel)
+        max_workers = max(1, min(len(self.folders), STITCH_FOLDER_WORKERS))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {executor.submit(self._process_folder, folder_path): folder_path for folder_path in self.folders}
+            for future in as_completed(futures):
+                success, folder_name = future.result()
+                if success is None:
+                    # Skipped because the user cancelled
+                    continue
+                if success:
+                    success_count += 1
                 else:
-                    folder_name = os.path.basename(folder_path)
+                    error_count += 1
                 
                 # Emit progress signal
-                self.progress_signal.emit(i, folder_name)
-                
-                # Get files to stitch
-                files_to_stitch = []
-                if folder_path.startswith("virtual:"):
-                    # For virtual folders, use the stored files
-                    files_to_stitch = self.virtual_files.get(folder_path, [])
-                else:
-                    # For real folders, get image files
-                    for ext in ['*.png', '*.jpg', '*.jpeg', '*.webp', '*.bmp', '*.gif', '*.tiff', '*.tif']:
-                        files_to_stitch.extend([str(f) for f in Path(folder_path).glob(ext)])
-                
-                # Sort files naturally
-                files_to_stitch.sort(key=lambda s: [int(t) if t.isdigit() else t.lower() for t in re.split(r'(\d+)', os.path.basename(s))])
+                completed += 1
+                self.progress_signal.emit(completed, folder_name)
                 
-                if not files_to_stitch:
-                    raise ValueError(f"No images found in {folder_name}")
-                
-                # Stitch images
-                output_path = os.path.join(self.output_dir, f"{folder_name}_stitched.{self.output_format}")
-                self._stitch_images(files_to_stitch, output_path)
-                
-                success_count += 1
-                
-            except Exception as e:
-                error_count += 1
-                self.error_signal.emit(f"Error stitching {folder_path}: {str(e)}")
+                if not self.running:
+                    executor.shutdown(wait=False, cancel_futures=True)
+                    break
         
         # Emit finished signal
         self.finished_signal.emit(success_count, error_count, self.output_dir)
     
+    def _process_folder(self, folder_path):
+        """Stitch a single folder, returning (success, folder_name); success is None if cancelled"""
+        # Get folder name for output file
+        if folder_path.startswith("virtual:"):
+            folder_name = folder_path.split(":", 1)[1]
+        else:
+            folder_name = os.path.basename(folder_path)
+        
+        if not self.running:
+            return None, folder_name
+            
+        try:
+            # Get files to stitch
+            files_to_stitch = []
+            if folder_path.startswith("virtual:"):
+                # For virtual folders, use the stored files
+                files_to_stitch = self.virtual_files.get(folder_path, [])
+            else:
+                # For real folders, get image files in a single directory pass
+                with os.scandir(folder_path) as entries:
+                    files_to_stitch = [entry.path for entry in entries
+                                       if entry.is_file() and os.path.splitext(entry.name)[1].lower() in STITCH_EXTENSIONS]
+            
+            # Sort files naturally
+            files_to_stitch.sort(key=_natural_key)
+            
+            if not files_to_stitch:
+                raise ValueError(f"No images found in {folder_name}")
+            
+            # Stitch images
+            output_path = os.path.join(self.output_dir, f"{folder_name}_stitched.{self.output_format}")
+            self._stitch_images(files_to_stitch, output_path)
+            
+            return True, folder_name
+            
+        except Exception as e:
+            self.error_signal.emit(f"Error stitching {folder_path}: {str(e)}")
+            return False, folder_name
+    
+    def _get_canvas(self, height, width, channels):
+        """Return an uninitialised (height, width, channels) view over the reusable canvas buffer"""
+        need = height * width * channels
+        buf = getattr(self._canvas, 'buf', None)
+        if buf is None or need > buf.size:
+            # Drop the old buffer first so both never live at the same time
+            self._canvas.buf = buf = None
+            self._canvas.buf = buf = np.empty(need, dtype=np.uint8)
+        return buf[:need].reshape(height, width, channels)
+    
+    def _blit_tile(self, out, path, size, offset, mode, fill):
+        """Decode one image, resize it to size and copy it into its slot of the canvas"""
+        height, width = out.shape[:2]
+        with Image.open(path) as img:
+            if self.fast_jpeg_decode and img.format == 'JPEG' and (size[0] < img.width or size[1] < img.height):
+                # Let libjpeg decode at 1/2, 1/4 or 1/8 scale; the resize below still lands on the exact size
+                img.draft(None, size)
+            tile_img = img
+            if tile_img.size != size:
+                # Convert to RGB if needed (for transparency handling) so resampling ignores alpha
+                if tile_img.mode == 'RGBA' and mode == 'RGB':
+                    tile_img = tile_img.convert('RGB')
+                if self.is_vertical:
+                    ratio = size[0] / tile_img.width
+                else:
+                    ratio = size[1] / tile_img.height
+                resample = Image.Resampling.LANCZOS if ratio < 1 else Image.Resampling.BICUBIC
+                tile_img = tile_img.resize(size, resample)
+            if tile_img.mode == 'RGBA' and mode == 'RGB':
+                # Drop alpha with a strided view instead of a separate RGB conversion pass
+                tile = np.asarray(tile_img)[..., :3]
+            else:
+                if tile_img.mode != mode:
+                    tile_img = tile_img.convert(mode)
+                tile = np.asarray(tile_img)
+        
+        tile_height, tile_width = tile.shape[:2]
+        alignment_setting = getattr(self, 'alignment', "Center")
+        
+        if self.is_vertical:
+            if alignment_setting == "Start (Left/Top)":
+                x_offset = 0
+            elif alignment_setting == "End (Right/Bottom)":
+                x_offset = width - tile_width
+            else: # Center
+                x_offset = (width - tile_width) // 2
+            
+            rows = out[offset:offset + tile_height]
+            rows[:, :x_offset] = fill
+            rows[:, x_offset:x_offset + tile_width] = tile
+            rows[:, x_offset + tile_width:] = fill
+        else:
+            if alignment_setting == "Start (Left/Top)":
+                y_offset = 0
+            elif alignment_setting == "End (Right/Bottom)":
+                y_offset = height - tile_height
+            else: # Center
+                y_offset = (height - tile_height) // 2
+            
+            cols = out[:, offset:offset + tile_width]
+            cols[:y_offset] = fill
+            cols[y_offset:y_offset + tile_height] = tile
+            cols[y_offset + tile_height:] = fill
+    
     def _stitch_images(self, image_paths, output_path):
         """Stitch images together and save to output path"""
         if not image_paths:
@@ -94,67 +199,61 @@ class StitcherThread(QThread):
         # Disable PIL's DecompressionBomb error for massive stitches
         Image.MAX_IMAGE_PIXELS = None
         
-        # Open all images
-        images = []
+        # Pass 1: read only the headers so the layout is known without decoding any pixels
+        entries = []
         for path in image_paths:
             try:
-                img = Image.open(path)
-                # Convert to RGB if needed (for transparency handling)
-                if img.mode == 'RGBA' and self.output_format.lower() in ['jpg', 'jpeg']:
-                    img = img.convert('RGB')
-                images.append(img)
+                with Image.open(path) as img:
+                    entries.append((path, img.size))
             except Exception as e:
                 self.error_signal.emit(f"Error opening image {path}: {str(e)}")
                 continue
         
-        if not images:
+        if not entries:
             raise ValueError("No valid images to stitch")
             
         if getattr(self, 'reverse_order', False):
-            images.reverse()
+            entries.reverse()
         
         # Apply resize options if needed
-        if len(images) > 0 and getattr(self, 'resize_option', "Don't Resize") != "Don't Resize":
+        sizes = [size for _, size in entries]
+        if getattr(self, 'resize_option', "Don't Resize") != "Don't Resize":
             if self.is_vertical:
                 # Vertical stitching: match widths
                 if self.resize_option == "Match Smallest":
-                    target_width = min(img.width for img in images)
+                    target_width = min(w for w, h in sizes)
                 elif self.resize_option == "Match Largest":
-                    target_width = max(img.width for img in images)
+                    target_width = max(w for w, h in sizes)
                 else: # Match First
-                    target_width = images[0].width
+                    target_width = sizes[0][0]
                 
-                for i in range(len(images)):
-                    if images[i].width != target_width:
-                        ratio = target_width / images[i].width
-                        new_height = int(images[i].height * ratio)
-                        resample = Image.Resampling.LANCZOS if ratio < 1 else Image.Resampling.BICUBIC
-                        images[i] = images[i].resize((target_width, new_height), resample)
+                for i, (w, h) in enumerate(sizes):
+                    if w != target_width:
+                        ratio = target_width / w
+                        sizes[i] = (target_width, int(h * ratio))
             else:
                 # Horizontal stitching: match heights
                 if self.resize_option == "Match Smallest":
-                    target_height = min(img.height for img in images)
+                    target_height = min(h for w, h in sizes)
                 elif self.resize_option == "Match Largest":
-                    target_height = max(img.height for img in images)
+                    target_height = max(h for w, h in sizes)
                 else: # Match First
-                    target_height = images[0].height
+                    target_height = sizes[0][1]
                 
-                for i in range(len(images)):
-                    if images[i].height != target_height:
-                        ratio = target_height / images[i].height
-                        new_width = int(images[i].width * ratio)
-                        resample = Image.Resampling.LANCZOS if ratio < 1 else Image.Resampling.BICUBIC
-                        images[i] = images[i].resize((new_width, target_height), resample)
+                for i, (w, h) in enumerate(sizes):
+                    if h != target_height:
+                        ratio = target_height / h
+                        sizes[i] = (int(w * ratio), target_height)
 
         # Calculate dimensions of the stitched image
         if self.is_vertical:
             # Vertical stitching (top to bottom)
-            width = max(img.width for img in images)
-            height = sum(img.height for img in images) + self.spacing * (len(images) - 1)
+            width = max(w for w, h in sizes)
+            height = sum(h for w, h in sizes) + self.spacing * (len(sizes) - 1)
         else:
             # Horizontal stitching (left to right)
-            width = sum(img.width for img in images) + self.spacing * (len(images) - 1)
-            height = max(img.height for img in images)
+            width = sum(w for w, h in sizes) + self.spacing * (len(sizes) - 1)
+            height = max(h for w, h in sizes)
             
         # Parse background color
         bg_color_setting = getattr(self, 'bg_color', "Transparent")
@@ -166,61 +265,51 @@ class StitcherThread(QThread):
             bg_color_rgba = (0, 0, 0, 0)
         
         # Create a new image with the calculated dimensions
-        mode = 'RGB' if self.output_format.lower() in ['jpg', 'jpeg'] else 'RGBA'
+        mode = 'RGB' if self.output_format in ['jpg', 'jpeg'] else 'RGBA'
         
         # If output is JPEG and they chose transparent, force it to white
         if mode == 'RGB' and bg_color_rgba[3] == 0:
             bg_color_rgba = (255, 255, 255, 255)
-            
-        stitched = Image.new(mode, (width, height), bg_color_rgba)
-        
-        # Paste images into the stitched image
-        x_offset = 0
-        y_offset = 0
         
-        alignment_setting = getattr(self, 'alignment', "Center")
+        # Allocate the canvas uninitialised; only the areas not covered by a tile get the background
+        channels = 3 if mode == 'RGB' else 4
+        if len(set(bg_color_rgba[:channels])) == 1:
+            # Every channel holds the same byte (transparent, white), so gutters are a plain memset
+            fill = bg_color_rgba[0]
+        else:
+            fill = np.array(bg_color_rgba[:channels], dtype=np.uint8)
+        out = self._get_canvas(height, width, channels)
         
-        for img in images:
+        # Lay out the tiles and fill the gaps between them
+        jobs = []
+        offset = 0
+        for (path, _), (w, h) in zip(entries, sizes):
+            jobs.append((path, (w, h), offset))
             if self.is_vertical:
-                if alignment_setting == "Start (Left/Top)":
-                    x_offset = 0
-                elif alignment_setting == "End (Right/Bottom)":
-                    x_offset = width - img.width
-                else: # Center
-                    x_offset = (width - img.width) // 2
-                    
-                stitched.paste(img, (x_offset, y_offset))
-                y_offset += img.height + self.spacing
+                offset += h
+                out[offset:offset + self.spacing] = fill
             else:
-                if alignment_setting == "Start (Left/Top)":
-                    y_offset = 0
-                elif alignment_setting == "End (Right/Bottom)":
-                    y_offset = height - img.height
-                else: # Center
-                    y_offset = (height - img.height) // 2
-                    
-                stitched.paste(img, (x_offset, y_offset))
-                x_offset += img.width + self.spacing
+                offset += w
+                out[:, offset:offset + self.spacing] = fill
+            offset += self.spacing
+        
+        # Pass 2: decode each image straight into its slot and drop it, so only the
+        # tiles currently being decoded are held in memory alongside the canvas
+        with ThreadPoolExecutor(max_workers=min(8, len(jobs))) as executor:
+            futures = [executor.submit(self._blit_tile, out, path, size, tile_offset, mode, fill) for path, size, tile_offset in jobs]
+            for future in futures:
+                future.result()
+        
+        stitched = Image.fromarray(out)
         
         # Check limits and split into chunks if necessary to bypass WEBP/JPEG limitations
-        max_dim = None
-        if self.output_format.lower() == 'webp':
-            max_dim = 16300
-        elif self.output_format.lower() in ['jpg', 'jpeg']:
-            max_dim = 65500
+        max_dim = STITCH_MAX_DIMENSIONS.get(self.output_format)
+        save_format, save_options = STITCH_SAVE_ARGS.get(self.output_format, (None, {}))
             
         def save_chunk(img_chunk, path):
-            if self.output_format.lower() in ['jpg', 'jpeg']:
-                img_chunk.save(path, 'JPEG', quality=95)
-            elif self.output_format.lower() == 'png':
-                img_chunk.save(path, 'PNG')
-            elif self.output_format.lower() == 'webp':
-                img_chunk.save(path, 'WEBP', quality=95)
-            else:
-                img_chunk.save(path)
+            img_chunk.save(path, save_format, **save_options)
 
         if max_dim and (width > max_dim or height > max_dim):
-            import math
             base_path, ext = os.path.splitext(output_path)
             if self.is_vertical:
                 num_chunks = math.ceil(height / max_dim)
@@ -239,7 +328,5 @@ class StitcherThread(QThread):
         else:
             save_chunk(stitched, output_path)
         
-        # Close all images to free memory
-        for img in images:
-            img.close()
+        stitched.close()
             
@@ -6,7 +6,13 @@ from PyQt6.QtCore import *
 
 from src.constants import COLORS, APP_VERSION, GITHUB_RELEASES_URL
 from src.ui.styles import STYLES
-from src.utils.helpers import natural_sort_key, get_file_icon, format_size, get_icon_path
+from src.utils.helpers import natural_sort_key, get_file_icon, format_size, get_icon_path, get_font
+
+# Item data roles on the file list: the file's path (None for a type header), its extension,
+# and a type header's label before the selection count is appended
+PATH_ROLE = Qt.ItemDataRole.UserRole
+EXT_ROLE = Qt.ItemDataRole.UserRole + 1
+HEADER_TEXT_ROLE = Qt.ItemDataRole.UserRole + 2
 
 class FileListManager:
     """Unified file list, checkbox, and drag-drop management for Converter / Upscaler / Denoiser.
@@ -30,12 +36,16 @@ class FileListManager:
 
         # State
         self.files = []
-        self.file_checkboxes = []
+        self.file_items = []  # One checkable QListWidgetItem per file, in list order
+        self.type_items = {}  # Extension -> its checkable group header item
+        self.excluded_ext = None  # Files of this type are shown disabled (e.g. already in the output format)
         self.output_dir = ""
+        self.output_dir_exists = False  # Checked once when the folder is picked, not on every use
         self.selected_folder = None
 
         # UI widgets (set during create_right_panel / create_action_buttons)
         self.file_container = None
+        self.file_list = None
         self.scroll_area = None
         self.output_dir_label = None
         self.select_all_checkbox = None
@@ -81,21 +91,14 @@ class FileListManager:
     def clear_files(self):
         """Clear all files from the list."""
         self.files.clear()
-        self.file_checkboxes.clear()
         self.selected_folder = None
         self.refresh_file_list()
         self.update_button_callback()
 
     def get_selected_files(self):
         """Return list of file paths that are currently checked."""
-        selected = []
-        for cb in self.file_checkboxes:
-            try:
-                if cb.isChecked() and cb.isEnabled():
-                    selected.append(cb.file_path)
-            except RuntimeError:
-                continue
-        return selected
+        return [item.data(PATH_ROLE) for item in self.file_items
+                if item.checkState() == Qt.CheckState.Checked and self._is_enabled(item)]
 
     def set_output_dir(self):
         """Open a folder dialog to set the output directory."""
@@ -104,6 +107,7 @@ class FileListManager:
         folder_dialog.setOption(QFileDialog.Option.ShowDirsOnly, True)
         if folder_dialog.exec():
             self.output_dir = folder_dialog.selectedFiles()[0]
+            self.output_dir_exists = os.path.isdir(self.output_dir)
             if self.output_dir_label:
                 self.output_dir_label.setText(f"📁 {self.output_dir}")
                 self.output_dir_label.setStyleSheet(f"color: {COLORS['text']}; padding: 10px;")
@@ -154,26 +158,67 @@ class FileListManager:
 
     # ─── Checkbox Logic ─────────────────────────────────────────────────
 
+    @staticmethod
+    def _is_enabled(item):
+        return bool(item.flags() & Qt.ItemFlag.ItemIsEnabled)
+
+    def _set_items_checked(self, items, checked):
+        """Check or uncheck the enabled items without re-entering _on_item_changed."""
+        state = Qt.CheckState.Checked if checked else Qt.CheckState.Unchecked
+        self.file_list.blockSignals(True)
+        for item in items:
+            if self._is_enabled(item):
+                item.setCheckState(state)
+        self.file_list.blockSignals(False)
+        # blockSignals also held back the repaint the model would have requested
+        self.file_list.viewport().update()
+
+    def _on_item_changed(self, item):
+        """React to the user ticking a file or a type header in the list."""
+        ext = item.data(EXT_ROLE)
+        if item.data(PATH_ROLE) is None:
+            self.toggle_file_type(item.checkState().value, ext)
+        else:
+            self.update_file_type_checkbox_state()
+            self.update_button_callback()
+
     def toggle_select_all(self, state):
         """Toggle all file checkboxes."""
-        for cb in list(self.file_checkboxes):
-            try:
-                if cb.isEnabled():
-                    cb.setChecked(state == Qt.CheckState.Checked.value)
-            except RuntimeError:
-                if cb in self.file_checkboxes:
-                    self.file_checkboxes.remove(cb)
+        if not self.file_list:
+            return
+        self._set_items_checked(self.file_items, state == Qt.CheckState.Checked.value)
         self.update_file_type_checkbox_state()
+        self.update_button_callback()
 
     def toggle_file_type(self, state, file_ext):
         """Toggle all checkboxes for a specific file type."""
-        for cb in list(self.file_checkboxes):
-            try:
-                if hasattr(cb, 'file_ext') and cb.file_ext == file_ext and cb.isEnabled():
-                    cb.setChecked(state == Qt.CheckState.Checked.value)
-            except RuntimeError:
-                if cb in self.file_checkboxes:
-                    self.file_checkboxes.remove(cb)
+        if not self.file_list:
+            return
+        items = [item for item in self.file_items if item.data(EXT_ROLE) == file_ext]
+        self._set_items_checked(items, state == Qt.CheckState.Checked.value)
+        self.update_file_type_checkbox_state()
+        self.update_button_callback()
+
+    def set_excluded_extension(self, file_ext):
+        """Disable and untick files of one type, re-enabling any previously excluded ones."""
+        self.excluded_ext = file_ext
+        if not self.file_list:
+            return
+        reselect = self.select_all_checkbox is not None and self.select_all_checkbox.isChecked()
+        self.file_list.blockSignals(True)
+        for item in self.file_items:
+            if item.data(EXT_ROLE) == file_ext:
+                item.setCheckState(Qt.CheckState.Unchecked)
+                item.setFlags(item.flags() & ~Qt.ItemFlag.ItemIsEnabled)
+            elif not self._is_enabled(item):
+                item.setFlags(item.flags() | Qt.ItemFlag.ItemIsEnabled)
+                # If "Select All" is checked, check this file too
+                if reselect:
+                    item.setCheckState(Qt.CheckState.Checked)
+        self.file_list.blockSignals(False)
+        self.file_list.viewport().update()
+        self.update_file_type_checkbox_state()
+        self.update_button_callback()
 
     def update_select_all_checkbox_state(self):
         """Update 'Select All' checkbox to reflect current selection state."""
@@ -181,14 +226,11 @@ class FileListManager:
             return
         checked = 0
         enabled = 0
-        for cb in self.file_checkboxes:
-            try:
-                if cb.isEnabled():
-                    enabled += 1
-                    if cb.isChecked():
-                        checked += 1
-            except RuntimeError:
-                continue
+        for item in self.file_items:
+            if self._is_enabled(item):
+                enabled += 1
+                if item.checkState() == Qt.CheckState.Checked:
+                    checked += 1
         if enabled > 0:
             self.select_all_checkbox.blockSignals(True)
             self.select_all_checkbox.setChecked(checked == enabled)
@@ -198,43 +240,26 @@ class FileListManager:
                 self.file_count_label.setText(f"Total: {len(self.files)} files, {checked} selected")
 
     def update_file_type_checkbox_state(self, _state=None):
-        """Update per-type checkboxes and Select All based on individual checkbox states."""
-        # Group checkboxes by extension
-        groups = {}
-        for cb in self.file_checkboxes:
-            try:
-                if hasattr(cb, 'file_ext') and cb.isEnabled():
-                    groups.setdefault(cb.file_ext, []).append(cb)
-            except RuntimeError:
-                continue
-
-        # Find file-type header checkboxes in the UI
-        if self.file_container and self.file_container.layout():
-            for i in range(self.file_container.layout().count()):
-                widget = self.file_container.layout().itemAt(i).widget()
-                if isinstance(widget, QScrollArea):
-                    scroll_widget = widget.widget()
-                    if scroll_widget:
-                        for j in range(scroll_widget.layout().count()):
-                            item = scroll_widget.layout().itemAt(j)
-                            if item.widget() and isinstance(item.widget(), QFrame):
-                                frame = item.widget()
-                                if frame.layout() is not None:
-                                    for k in range(frame.layout().count()):
-                                        item2 = frame.layout().itemAt(k)
-                                        if item2 and item2.layout():
-                                            for l_idx in range(item2.layout().count()):
-                                                w = item2.layout().itemAt(l_idx).widget()
-                                                if isinstance(w, QCheckBox) and hasattr(w, 'file_ext'):
-                                                    ext = w.file_ext
-                                                    if ext in groups:
-                                                        checked_ct = sum(1 for c in groups[ext] if c.isChecked())
-                                                        total_ct = len(groups[ext])
-                                                        w.blockSignals(True)
-                                                        w.setChecked(checked_ct == total_ct)
-                                                        if hasattr(w, 'original_text'):
-                                                            w.setText(f"{w.original_text} ({checked_ct}/{total_ct} selected)")
-                                                        w.blockSignals(False)
+        """Update per-type headers and Select All based on individual file states."""
+        if not self.file_list:
+            return
+        # Count [checked, enabled] files per extension
+        counts = {}
+        for item in self.file_items:
+            if self._is_enabled(item):
+                count = counts.setdefault(item.data(EXT_ROLE), [0, 0])
+                count[1] += 1
+                if item.checkState() == Qt.CheckState.Checked:
+                    count[0] += 1
+
+        self.file_list.blockSignals(True)
+        for ext, header in self.type_items.items():
+            if ext in counts:
+                checked_ct, total_ct = counts[ext]
+                header.setCheckState(Qt.CheckState.Checked if checked_ct == total_ct else Qt.CheckState.Unchecked)
+                header.setText(f"{header.data(HEADER_TEXT_ROLE)} ({checked_ct}/{total_ct} selected)")
+        self.file_list.blockSignals(False)
+        self.file_list.viewport().update()
         self.update_select_all_checkbox_state()
 
     def add_files(self):
@@ -277,7 +302,7 @@ class FileListManager:
         btn_layout.setSpacing(10)
 
         add_files_btn = QPushButton("📁 Add Files")
-        add_files_btn.setFont(QFont("Segoe UI", 10))
+        add_files_btn.setFont(get_font(10))
         add_files_btn.setFixedHeight(40)
         add_files_btn.clicked.connect(self.add_files)
         add_files_btn.setCursor(Qt.CursorShape.PointingHandCursor)
@@ -285,7 +310,7 @@ class FileListManager:
         btn_layout.addWidget(add_files_btn, 0, 0)
 
         add_folder_btn = QPushButton("📂 Add Folder")
-        add_folder_btn.setFont(QFont("Segoe UI", 10))
+        add_folder_btn.setFont(get_font(10))
         add_folder_btn.setFixedHeight(40)
         add_folder_btn.clicked.connect(self.add_folder)
         add_folder_btn.setCursor(Qt.CursorShape.PointingHandCursor)
@@ -293,7 +318,7 @@ class FileListManager:
         btn_layout.addWidget(add_folder_btn, 0, 1)
 
         clear_btn = QPushButton("🚫 Clear Files")
-        clear_btn.setFont(QFont("Segoe UI", 10))
+        clear_btn.setFont(get_font(10))
         clear_btn.setFixedHeight(40)
         clear_btn.clicked.connect(self.clear_files)
         clear_btn.setCursor(Qt.CursorShape.PointingHandCursor)
@@ -301,7 +326,7 @@ class FileListManager:
         btn_layout.addWidget(clear_btn, 1, 0)
 
         output_btn = QPushButton("📂 Set Output")
-        output_btn.setFont(QFont("Segoe UI", 10))
+        output_btn.setFont(get_font(10))
         output_btn.setFixedHeight(40)
         output_btn.clicked.connect(self.set_output_dir)
         output_btn.setCursor(Qt.CursorShape.PointingHandCursor)
@@ -376,10 +401,9 @@ class FileListManager:
         """Rebuild the file list UI from current self.files."""
         # Save existing checkbox states
         checkbox_states = {}
-        for cb in self.file_checkboxes:
+        for item in self.file_items:
             try:
-                if hasattr(cb, 'file_path'):
-                    checkbox_states[cb.file_path] = cb.isChecked()
+                checkbox_states[item.data(PATH_ROLE)] = item.checkState() == Qt.CheckState.Checked
             except RuntimeError:
                 pass
 
@@ -388,7 +412,9 @@ class FileListManager:
             w = self.file_container.layout().itemAt(i).widget()
             if w:
                 w.deleteLater()
-        self.file_checkboxes = []
+        self.file_items = []
+        self.type_items = {}
+        self.file_list = None
 
         if not self.files:
             lbl = QLabel("No files selected")
@@ -396,11 +422,6 @@ class FileListManager:
             lbl.setStyleSheet("color: #888888; padding: 10px;")
             self.file_container.layout().addWidget(lbl)
         else:
-            file_scroll = QScrollArea()
-            file_scroll.setWidgetResizable(True)
-            file_scroll.setFrameShape(QFrame.Shape.NoFrame)
-            file_scroll.setStyleSheet(STYLES['scroll_area'])
-
             list_widget = QWidget()
             list_layout = QVBoxLayout(list_widget)
             list_layout.setContentsMargins(5, 5, 5, 5)
@@ -431,76 +452,60 @@ class FileListManager:
             sep2.setStyleSheet(f"background-color: {COLORS['border']}; margin: 5px 0px;")
             list_layout.addWidget(sep2)
 
+            # One item view for every file: rows are painted by a single delegate and only
+            # the visible ones are drawn, instead of a checkbox + two labels per file
+            self.file_list = QListWidget()
+            self.file_list.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
+            self.file_list.setMinimumHeight(150)
+            self.file_list.setStyleSheet(STYLES['file_list'])
+
             # Group by extension
             file_groups = {}
             for fp in self.files:
                 ext = os.path.splitext(fp)[1].lower()[1:]
                 file_groups.setdefault(ext, []).append(fp)
 
-            for ext, ext_files in file_groups.items():
-                group_frame = QFrame()
-                group_frame.setStyleSheet(f"background-color: {COLORS['panel']}; border-radius: 8px;")
-                group_layout = QVBoxLayout(group_frame)
-                group_layout.setContentsMargins(10, 10, 10, 10)
-                group_layout.setSpacing(5)
+            header_font = QFont()
+            header_font.setBold(True)
+            header_font.setPointSize(11)
+            header_background = QColor(COLORS['panel'])
+            checkable = Qt.ItemFlag.ItemIsUserCheckable | Qt.ItemFlag.ItemIsEnabled
 
+            for ext, ext_files in file_groups.items():
                 # Type header
-                header_layout = QHBoxLayout()
                 original_text = f"{ext.upper()} Files ({len(ext_files)})"
-                type_cb = QCheckBox(original_text)
-                type_cb.setStyleSheet("font-weight: bold; font-size: 11pt;")
-                type_cb.file_ext = ext
-                type_cb.original_text = original_text
-                all_checked = all(checkbox_states.get(fp, True) for fp in ext_files)
-                type_cb.setChecked(all_checked)
-                type_cb.stateChanged.connect(lambda state, e=ext: self.toggle_file_type(state, e))
-                header_layout.addWidget(type_cb)
-                header_layout.addStretch()
-                group_layout.addLayout(header_layout)
-
-                type_sep = QFrame(); type_sep.setFrameShape(QFrame.Shape.HLine)
-                type_sep.setStyleSheet(f"background-color: {COLORS['border']}; margin: 5px 0px;")
-                group_layout.addWidget(type_sep)
-
-                grid = QGridLayout()
-                grid.setSpacing(5)
-                num_columns = 4
-
-                for i, fp in enumerate(ext_files):
+                header = QListWidgetItem(original_text)
+                header.setFlags(checkable)
+                header.setFont(header_font)
+                header.setBackground(header_background)
+                header.setData(EXT_ROLE, ext)
+                header.setData(HEADER_TEXT_ROLE, original_text)
+                header.setCheckState(Qt.CheckState.Checked)
+                self.file_list.addItem(header)
+                self.type_items[ext] = header
+
+                excluded = ext == self.excluded_ext
+                for fp in ext_files:
                     fname = os.path.basename(fp)
-                    item = QWidget()
-                    item_layout = QHBoxLayout(item)
-                    item_layout.setContentsMargins(2, 2, 2, 2)
-                    item_layout.setSpacing(5)
-
-                    cb = QCheckBox()
-                    initial = checkbox_states.get(fp, True)
-                    cb.file_path = fp
-                    cb.file_ext = ext
-                    cb.setChecked(initial)
-                    cb.stateChanged.connect(self.update_file_type_checkbox_state)
-                    cb.stateChanged.connect(lambda _: self.update_button_callback())
-                    self.file_checkboxes.append(cb)
-                    item_layout.addWidget(cb)
-
-                    icon_lbl = QLabel(get_file_icon(ext))
-                    item_layout.addWidget(icon_lbl)
-
-                    max_len = 15
-                    display_name = fname if len(fname) <= max_len else fname[:max_len-3] + "..."
-                    name_lbl = QLabel(display_name)
-                    name_lbl.setToolTip(fname)
-                    name_lbl.setStyleSheet(f"color: {COLORS['text']};")
-                    item_layout.addWidget(name_lbl, 1)
-
-                    grid.addWidget(item, i // num_columns, i % num_columns)
-
-                group_layout.addLayout(grid)
-                list_layout.addWidget(group_frame)
-
-            file_scroll.setWidget(list_widget)
-            self.file_container.layout().addWidget(file_scroll)
-            self.update_select_all_checkbox_state()
+                    item = QListWidgetItem(f"{get_file_icon(ext)}  {fname}")
+                    item.setToolTip(fname)
+                    item.setData(PATH_ROLE, fp)
+                    item.setData(EXT_ROLE, ext)
+                    if excluded:
+                        item.setFlags(Qt.ItemFlag.ItemIsUserCheckable)
+                        item.setCheckState(Qt.CheckState.Unchecked)
+                    else:
+                        item.setFlags(checkable)
+                        initial = checkbox_states.get(fp, True)
+                        item.setCheckState(Qt.CheckState.Checked if initial else Qt.CheckState.Unchecked)
+                    self.file_list.addItem(item)
+                    self.file_items.append(item)
+
+            self.file_list.itemChanged.connect(self._on_item_changed)
+            list_layout.addWidget(self.file_list, 1)
+
+            self.file_container.layout().addWidget(list_widget)
+            self.update_file_type_checkbox_state()
 
         self.update_button_callback()
 
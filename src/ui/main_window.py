@@ -4,6 +4,10 @@ import sys
 import time
 import re
 import threading
+import functools
+import html
+import signal
+from collections import deque
 from PyQt6.QtWidgets import *
 from PyQt6.QtGui import *
 from PyQt6.QtCore import *
@@ -12,7 +16,7 @@ from src.constants import *
 from src.config import *
 from src.utils.helpers import *
 from src.utils.logger import logger
-from src.utils.updater import UpdateCheckerThread
+from src.utils.settings_store import settings_store
 from src.managers.file_list_manager import FileListManager
 from src.ui.styles import *
 from src.ui.widgets.progress_dialog import ProcessingProgressDialog
@@ -31,24 +35,102 @@ from src.ui.panels.stitcher_panel import StitcherPanelMixin
 from src.ui.panels.settings_panel import SettingsPanelMixin
 from src.ui.panels.footer import FooterMixin
 
+# One pass per GPU name: whichever kind matches first (leftmost) wins; names matching nothing count as discrete.
+# Radeon counts as dedicated only without the "(TM)"/"Graphics" branding AMD uses for its integrated GPUs.
+_GPU_CLASS_RE = re.compile(
+    r'(?P<nvidia>nvidia)'
+    r'|(?P<amd>\brx\s*\d|radeon(?!\(tm\))(?!.*\bgraphics\b))'
+    r'|(?P<integrated>intel|uhd|radeon\(tm\)|\bgraphics\b|\bhd\b)'
+)
+
+# src/core, where the bundled upscaler tools live
+CORE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "core")
+
+# Quiet period after the last settings change before settings.json is written
+SETTINGS_SAVE_DELAY_MS = 250
+
+# Windows device class for display adapters; each numbered subkey is one adapter's driver entry
+DISPLAY_CLASS_KEY = r"SYSTEM\CurrentControlSet\Control\Class\{4d36e968-e325-11ce-bfc1-08002be10318}"
+
+def _enum_gpus_winreg():
+    """Return the lower-cased driver descriptions of the display adapters listed in the registry"""
+    import winreg
+    gpu_lines = []
+    with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, DISPLAY_CLASS_KEY) as class_key:
+        index = 0
+        while True:
+            try:
+                subkey_name = winreg.EnumKey(class_key, index)
+            except OSError:
+                break
+            index += 1
+            try:
+                with winreg.OpenKey(class_key, subkey_name) as adapter_key:
+                    name = winreg.QueryValueEx(adapter_key, "DriverDesc")[0].strip().lower()
+            except OSError:
+                continue  # "Properties" is access-denied and some entries have no description
+            if name and name not in gpu_lines:
+                gpu_lines.append(name)
+    return tuple(gpu_lines)
+
+# The installed GPUs don't change while the app runs, so the query only runs once; failures raise and aren't cached
+@functools.lru_cache(maxsize=1)
+def _detect_gpus():
+    """Return the lower-cased names of the installed video controllers"""
+    # Reading the registry is in-process; PowerShell/WMI costs a process spawn and is only a fallback
+    try:
+        gpu_lines = _enum_gpus_winreg()
+    except (ImportError, OSError):
+        gpu_lines = ()
+    if gpu_lines:
+        return gpu_lines
+    
+    startupinfo = subprocess.STARTUPINFO()
+    startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
+    
+    result = subprocess.run(
+        ['powershell', '-Command', 'Get-WmiObject win32_VideoController | Select-Object -ExpandProperty Name'], 
+        stdout=subprocess.PIPE, 
+        stderr=subprocess.PIPE,
+        startupinfo=startupinfo,
+        text=True,
+        timeout=5
+    )
+    
+    output = result.stdout.strip().lower()
+    return tuple(line.strip() for line in output.split('\n') if line.strip())
+
 class ImageConverter(QWidget, ConverterPanelMixin, UpscalerPanelMixin, DenoiserPanelMixin, StitcherPanelMixin, SettingsPanelMixin, FooterMixin):
+    log_lines_queued = pyqtSignal()  # The first line of a new batch is waiting for the log view
+
     def __init__(self):
         super().__init__()
         self.vulkan_support = False  # Add this line to track Vulkan support
 
-        # Initialize logger
-        self.log_messages = []
+        # Initialize logger; log() also runs on worker threads (stdout is redirected),
+        # so the lines queued for the view are handed over under a lock
+        self._log_lock = threading.Lock()
+        self.log_messages = deque(maxlen=settings_store.get('log_max_lines', LOG_MAX_LINES))
+        self._reset_log_counts()
         
         # Redirect stdout to capture terminal output
         self.setup_stdout_redirect()
 
         # Set window icon
-        icon_path = get_icon_path("icon.ico")
-        if os.path.exists(icon_path):
-            self.setWindowIcon(QIcon(icon_path))
+        icon = get_icon("icon.ico")
+        if icon:
+            self.setWindowIcon(icon)
 
-        # Show the experimental warning dialog
-        QTimer.singleShot(100, self.show_experimental_warning)
+        # Settings changes are written once things go quiet for a moment, and always before exit
+        self._settings_save_timer = QTimer(self)
+        self._settings_save_timer.setSingleShot(True)
+        self._settings_save_timer.setInterval(SETTINGS_SAVE_DELAY_MS)
+        self._settings_save_timer.timeout.connect(lambda: QThreadPool.globalInstance().start(settings_store.flush))
+        QApplication.instance().aboutToQuit.connect(settings_store.flush)
+
+        # Show the experimental warning dialog (no timer at all once the user has dismissed it for good)
+        if not settings_store.get('hide_experimental_warning', False):
+            QTimer.singleShot(100, self.show_experimental_warning)
 
         # Set window title and size
         self.setWindowTitle("Image/PSD Converter")
@@ -59,6 +141,13 @@ class ImageConverter(QWidget, ConverterPanelMixin, UpscalerPanelMixin, DenoiserP
         self.output_dir = ""
         self.thread = None
         self.progress_dialog = None
+        self._cancel_msg_box = None  # Built on first cancel
+        self._hybrid_dialog = None  # Built on first hint
+        self._settings_panel = None  # Built when the Settings tab is first opened
+        self.logger_view = None
+        self._update_check_view = None  # Shows the last update check on the Updates page
+        self._network_manager = None  # Created by the first update check
+        self._update_reply = None  # The update check in flight
         self.conversion_history = []
         self.selected_folder = None
         self.file_checkboxes = []  # Add this to track checkboxes
@@ -74,9 +163,11 @@ class ImageConverter(QWidget, ConverterPanelMixin, UpscalerPanelMixin, DenoiserP
         # Initialize combo box references
         self.jpeg_quality_combo = None
         self.webp_quality_combo = None
+        self.webp_method_combo = None
         self.png_compression_combo = None
         self.pdf_dpi_combo = None
         self.pdf_quality_combo = None
+        self.pdf_optimize_check = None
 
         self.denoiser_files = []
         self.denoiser_output_dir = ""
@@ -100,30 +191,61 @@ class ImageConverter(QWidget, ConverterPanelMixin, UpscalerPanelMixin, DenoiserP
         initial_format = self.format_combo.currentText().lower()
         self._update_upscale_availability(initial_format)
         self.update_upscale_availability()
+        
+        self._install_signal_handlers()
+        
+        # Check for updates shortly after startup, whether or not Settings gets opened
+        QTimer.singleShot(1000, self.check_for_updates)
+
+    def _install_signal_handlers(self):
+        """Shut down cleanly on SIGINT/SIGTERM instead of orphaning running upscaler/denoiser processes"""
+        try:
+            signal.signal(signal.SIGINT, self._graceful_shutdown)
+            signal.signal(signal.SIGTERM, self._graceful_shutdown)
+        except ValueError:
+            return  # Handlers can only be installed from the main thread
+        
+        # Python only runs signal handlers between bytecodes, so wake the interpreter while Qt's loop is idle
+        self._signal_timer = QTimer(self)
+        self._signal_timer.timeout.connect(lambda: None)
+        self._signal_timer.start(500)
+
+    def _graceful_shutdown(self, signum, frame):
+        """Stop the workers and their child processes, then quit the application"""
+        self.log(f"Received signal {signum}, shutting down", "WARNING")
+        for worker in (self.thread, self.upscaler_thread, self.denoiser_thread):
+            if worker and worker.isRunning():
+                worker.stop()
+                if not worker.wait(2000):
+                    # The child ignored terminate(); make sure it doesn't outlive the app
+                    process = worker.process
+                    if process is not None:
+                        try:
+                            process.kill()
+                        except OSError:
+                            pass
+        
+        for dialog in (self.progress_dialog, self.upscaler_progress_dialog, self.denoiser_progress_dialog):
+            if dialog:
+                dialog.close()
+        
+        QApplication.quit()
+
+    def _save_settings(self):
+        """Schedule a write of pending settings changes; a burst of changes is written once"""
+        self._settings_save_timer.start()  # Restarting the timer pushes the write back
 
     def show_experimental_warning(self):
         """Show a warning dialog about the experimental state of the application"""
         # Check if we should show the warning
-        try:
-            import json
-            from src.utils.helpers import get_data_path
-            settings_path = get_data_path("settings.json")
-            if os.path.exists(settings_path):
-                with open(settings_path, 'r') as f:
-                    try:
-                        settings = json.load(f)
-                        if settings.get('hide_experimental_warning', False):
-                            return  # Don't show the dialog
-                    except:
-                        pass
-        except:
-            pass
+        if settings_store.get('hide_experimental_warning', False):
+            return  # Don't show the dialog
         
         dialog = QDialog(self)
         dialog.setWindowTitle("Important Notice")
         dialog.setMinimumSize(650, 500)
         dialog.setWindowFlags(Qt.WindowType.Dialog | Qt.WindowType.CustomizeWindowHint | Qt.WindowType.WindowTitleHint)
-        dialog.setStyleSheet(f"background-color: {COLORS['background']}; color: {COLORS['text']};")
+        dialog.setStyleSheet(STYLES['notice_dialog'])
         
         main_layout = QVBoxLayout(dialog)
         main_layout.setContentsMargins(25, 25, 25, 25)
@@ -131,10 +253,7 @@ class ImageConverter(QWidget, ConverterPanelMixin, UpscalerPanelMixin, DenoiserP
         
         # Create a rounded container for the warning content
         warning_container = QFrame()
-        warning_container.setStyleSheet(f"""
-            background-color: {COLORS['panel']}; 
-            border-radius: 15px;
-        """)
+        warning_container.setStyleSheet(STYLES['notice_container'])
         
         container_layout = QVBoxLayout(warning_container)
         container_layout.setContentsMargins(20, 20, 20, 20)
@@ -144,11 +263,11 @@ class ImageConverter(QWidget, ConverterPanelMixin, UpscalerPanelMixin, DenoiserP
         title_layout = QHBoxLayout()
         
         warning_icon = QLabel("⚠️")
-        warning_icon.setStyleSheet("font-size: 36px; color: #FFB940;")
+        warning_icon.setStyleSheet(STYLES['notice_icon'])
         title_layout.addWidget(warning_icon)
         
         title = QLabel("Experimental Software - Please Read")
-        title.setStyleSheet("font-size: 18pt; font-weight: bold; color: #FFB940;")
+        title.setStyleSheet(STYLES['notice_title'])
         title_layout.addWidget(title)
         title_layout.addStretch()
         
@@ -158,15 +277,9 @@ class ImageConverter(QWidget, ConverterPanelMixin, UpscalerPanelMixin, DenoiserP
         line = QFrame()
         line.setFrameShape(QFrame.Shape.HLine)
         line.setFrameShadow(QFrame.Shadow.Sunken)
-        line.setStyleSheet(f"background-color: {COLORS['border']}; margin: 0px 5px;")
+        line.setStyleSheet(STYLES['notice_separator'])
         container_layout.addWidget(line)
         
-        # Create content widget for scrolling
-        content_widget = QWidget()
-        content_layout = QVBoxLayout(content_widget)
-        content_layout.setContentsMargins(5, 5, 5, 5)
-        content_layout.setSpacing(10)
-        
         # Warning message with softer colors and more rounded elements
         warning_text = """
         <p style="font-size: 14pt; font-weight: bold; color: #FFB940;">Before You Begin</p>
@@ -200,64 +313,20 @@ class ImageConverter(QWidget, ConverterPanelMixin, UpscalerPanelMixin, DenoiserP
         <p style="color: #0078d4; font-weight: bold;">By clicking "I Understand" below, you acknowledge that you've read these notes and are ready to proceed.</p>
         """
         
-        warning_label = QLabel(warning_text)
-        warning_label.setWordWrap(True)
-        warning_label.setTextFormat(Qt.TextFormat.RichText)
-        warning_label.setStyleSheet("font-size: 12px; line-height: 1.4;")
-        content_layout.addWidget(warning_label)
-        
-        # Create a scroll area with proper styling
-        scroll = QScrollArea()
-        scroll.setWidget(content_widget)
-        scroll.setWidgetResizable(True)
-        scroll.setFrameShape(QFrame.Shape.NoFrame)
-        scroll.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
-        scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
-        scroll.setStyleSheet(f"""
-            QScrollArea {{
-                border: none;
-                background-color: transparent;
-            }}
-            QScrollBar:vertical {{
-                background: transparent;
-                width: 16px;
-                margin: 3px;
-                border-radius: 8px;
-            }}
-            QScrollBar:vertical:hover {{
-                width: 20px;
-            }}
-            QScrollBar::handle:vertical {{
-                background-color: #4d4d5f;
-                min-height: 30px;
-                border-radius: 6px;
-                margin: 3px 3px 3px 3px;
-            }}
-            QScrollBar::handle:vertical:hover {{
-                background-color: #5d5d6f;
-            }}
-            QScrollBar::add-line:vertical, 
-            QScrollBar::sub-line:vertical {{
-                height: 0px;
-                background: transparent;
-            }}
-            QScrollBar::add-page:vertical, 
-            QScrollBar::sub-page:vertical {{
-                background: transparent;
-            }}
-        """)
+        # QTextBrowser lays rich text out incrementally and scrolls itself, unlike a word-wrapped QLabel in a QScrollArea
+        browser = QTextBrowser()
+        browser.setHtml(warning_text)
+        browser.setOpenExternalLinks(True)
+        browser.setFrameShape(QFrame.Shape.NoFrame)
+        browser.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        browser.setStyleSheet(STYLES['scroll_area'] + STYLES['notice_text'])
         
-        container_layout.addWidget(scroll)
+        container_layout.addWidget(browser)
         main_layout.addWidget(warning_container)
         
         # Checkbox for "Don't show again" with rounded styling
         dont_show_check = QCheckBox("Don't show this message again")
-        dont_show_check.setStyleSheet(f"""
-            QCheckBox {{ color: {COLORS['text']}; font-size: 12px; }}
-            QCheckBox::indicator {{ width: 18px; height: 18px; }}
-            QCheckBox::indicator:unchecked {{ background-color: {COLORS['panel']}; border: 1px solid {COLORS['text']}; border-radius: 4px; }}
-            QCheckBox::indicator:checked {{ background-color: {COLORS['primary']}; border: 1px solid {COLORS['primary']}; border-radius: 4px; }}
-        """)
+        dont_show_check.setStyleSheet(STYLES['notice_checkbox'])
         main_layout.addWidget(dont_show_check)
         
         # Buttons with more rounded styling
@@ -267,39 +336,13 @@ class ImageConverter(QWidget, ConverterPanelMixin, UpscalerPanelMixin, DenoiserP
         exit_btn.setFixedHeight(45)
         exit_btn.setMinimumWidth(150)
         exit_btn.clicked.connect(lambda: sys.exit(0))
-        exit_btn.setStyleSheet(f"""
-            QPushButton {{ 
-                background-color: {COLORS['secondary']}; 
-                color: {COLORS['text']}; 
-                border: none; 
-                border-radius: 10px; 
-                padding: 10px; 
-                font-weight: 600; 
-                font-size: 14px;
-            }}
-            QPushButton:hover {{ 
-                background-color: {COLORS['hover']}; 
-            }}
-        """)
+        exit_btn.setStyleSheet(STYLES['notice_exit_button'])
         
         understand_btn = QPushButton("I Understand")
         understand_btn.setFixedHeight(45)
         understand_btn.setMinimumWidth(150)
         understand_btn.clicked.connect(dialog.accept)
-        understand_btn.setStyleSheet(f"""
-            QPushButton {{ 
-                background-color: {COLORS['error']}; 
-                color: white; 
-                border: none; 
-                border-radius: 10px; 
-                padding: 10px; 
-                font-weight: 600; 
-                font-size: 14px;
-            }}
-            QPushButton:hover {{ 
-                background-color: {COLORS['error_hover']}; 
-            }}
-        """)
+        understand_btn.setStyleSheet(STYLES['notice_accept_button'])
         
         button_layout.addWidget(exit_btn)
         button_layout.addStretch()
@@ -311,28 +354,8 @@ class ImageConverter(QWidget, ConverterPanelMixin, UpscalerPanelMixin, DenoiserP
         def on_dialog_closed():
             if dont_show_check.isChecked():
                 # Save the preference to a settings file
-                try:
-                    import json
-                    from src.utils.helpers import get_data_path
-                    settings_path = get_data_path("settings.json")
-                    
-                    # Load existing settings if available
-                    settings = {}
-                    if os.path.exists(settings_path):
-                        with open(settings_path, 'r') as f:
-                            try:
-                                settings = json.load(f)
-                            except:
-                                settings = {}
-                    
-                    # Update settings
-                    settings['hide_experimental_warning'] = True
-                    
-                    # Save settings
-                    with open(settings_path, 'w') as f:
-                        json.dump(settings, f)
-                except:
-                    pass
+                settings_store.set('hide_experimental_warning', True)
+                self._save_settings()
         
         dialog.finished.connect(on_dialog_closed)
         dialog.exec()
@@ -343,56 +366,29 @@ class ImageConverter(QWidget, ConverterPanelMixin, UpscalerPanelMixin, DenoiserP
         msg_box.setWindowTitle(title)
         msg_box.setText(message)
         msg_box.setIcon(icon)
-        msg_box.setStyleSheet(f"""
-            QMessageBox {{
-                background-color: {COLORS['background']};
-                color: {COLORS['text']};
-            }}
-            QLabel {{
-                color: {COLORS['text']};
-                font-size: 10pt;
-                font-family: 'Segoe UI';
-            }}
-        """)
+        msg_box.setStyleSheet(STYLES['info_message_box'])
         
         # Style the OK button
         ok_btn = msg_box.addButton(QMessageBox.StandardButton.Ok)
-        ok_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {COLORS['primary']};
-                color: white;
-                border: none;
-                border-radius: 8px;
-                padding: 8px 16px;
-                font-weight: 600;
-                min-width: 80px;
-            }}
-            QPushButton:hover {{
-                background-color: {COLORS['hover']};
-            }}
-        """)
+        ok_btn.setStyleSheet(STYLES['ok_button'])
         
         msg_box.exec()        
 
     def check_gpu_compatibility(self):
         """Check if GPU supports upscaling using ESRGAN-style detection"""
+        # A user override or a CUDA device list in the environment already answers this without querying the system
+        if settings_store.get('force_gpu', False):
+            self.log("GPU detection skipped: 'force_gpu' is set in settings", "INFO")
+            return True
+        cuda_devices = os.environ.get('CUDA_VISIBLE_DEVICES') or os.environ.get('NVIDIA_VISIBLE_DEVICES')
+        if cuda_devices and cuda_devices.strip() not in ('-1', 'none', 'void'):
+            self.log(f"GPU detection skipped: CUDA devices visible ({cuda_devices})", "INFO")
+            return True
+        
         try:
             if os.name == 'nt':  # Windows
                 try:
-                    startupinfo = subprocess.STARTUPINFO()
-                    startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
-                    
-                    result = subprocess.run(
-                        ['powershell', '-Command', 'Get-WmiObject win32_VideoController | Select-Object -ExpandProperty Name'], 
-                        stdout=subprocess.PIPE, 
-                        stderr=subprocess.PIPE,
-                        startupinfo=startupinfo,
-                        text=True,
-                        timeout=5
-                    )
-                    
-                    output = result.stdout.strip().lower()
-                    gpu_lines = [line.strip() for line in output.split('\n') if line.strip()]
+                    gpu_lines = list(_detect_gpus())
                     
                     # Log all detected GPUs for debugging
                     self.log(f"Detected GPUs: {gpu_lines}", "INFO")
@@ -402,16 +398,22 @@ class ImageConverter(QWidget, ConverterPanelMixin, UpscalerPanelMixin, DenoiserP
                     if has_hybrid_graphics:
                         self.log("Hybrid graphics detected (integrated + dedicated GPU)", "INFO")
                     
-                    # Priority order: NVIDIA > RX > Others
+                    # Classify each GPU once: 'nvidia', 'amd', 'integrated' or 'discrete'
+                    gpu_kinds = []
                     for gpu in gpu_lines:
-                        if 'nvidia' in gpu:
+                        match = _GPU_CLASS_RE.search(gpu)
+                        gpu_kinds.append((gpu, match.lastgroup if match else 'discrete'))
+                    
+                    # Priority order: NVIDIA > RX > Others
+                    for gpu, kind in gpu_kinds:
+                        if kind == 'nvidia':
                             self.log(f"NVIDIA GPU detected: {gpu}", "INFO")
                             # Show a hint for hybrid graphics systems
                             if has_hybrid_graphics:
                                 self.log("For optimal performance, ensure this application uses your NVIDIA GPU", "WARNING")
                                 self.show_hybrid_graphics_hint()
                             return True
-                        elif 'rx' in gpu or 'radeon' in gpu and not 'graphics' in gpu:
+                        elif kind == 'amd':
                             self.log(f"AMD dedicated GPU detected: {gpu}", "INFO")
                             # Show a hint for hybrid graphics systems
                             if has_hybrid_graphics:
@@ -420,8 +422,8 @@ class ImageConverter(QWidget, ConverterPanelMixin, UpscalerPanelMixin, DenoiserP
                             return True
                     
                     # If no preferred GPU found, check for any discrete GPU
-                    for gpu in gpu_lines:
-                        if not any(x in gpu for x in ['intel', 'uhd', 'hd graphics', 'radeon(tm)', 'graphics', 'hd']):
+                    for gpu, kind in gpu_kinds:
+                        if kind == 'discrete':
                             self.log(f"Discrete GPU detected: {gpu}", "INFO")
                             return True
                     
@@ -443,27 +445,22 @@ class ImageConverter(QWidget, ConverterPanelMixin, UpscalerPanelMixin, DenoiserP
 
     def show_hybrid_graphics_hint(self):
         """Show a hint dialog for users with hybrid graphics systems"""
-        from src.utils.helpers import get_data_path
-        settings_path = get_data_path("settings.json")
-        if os.path.exists(settings_path):
-            try:
-                with open(settings_path, 'r') as f:
-                    settings = json.load(f)
-                    if settings.get('hide_hybrid_graphics_hint', False):
-                        return  # Don't show if user chose not to see it again
-            except:
-                pass  # Continue if settings file can't be read
+        if settings_store.get('hide_hybrid_graphics_hint', False):
+            return  # Don't show if user chose not to see it again
         
+        # The dialog's content never changes, so it is built on first use and reused
+        if self._hybrid_dialog is None:
+            self._hybrid_dialog = self._build_hybrid_dialog()
+        
+        self._hybrid_dont_show_check.setChecked(False)
+        self._hybrid_dialog.exec()
+
+    def _build_hybrid_dialog(self):
+        """Build the hybrid graphics hint dialog"""
         dialog = QDialog(self)
         dialog.setWindowTitle("Hybrid Graphics Detected")
         dialog.setFixedWidth(500)
-        dialog.setStyleSheet(f"""
-            QDialog {{
-                background-color: {COLORS['background']};
-                color: {COLORS['text']};
-                border-radius: 10px;
-            }}
-        """)
+        dialog.setStyleSheet(STYLES['hybrid_dialog'])
         
         main_layout = QVBoxLayout(dialog)
         main_layout.setContentsMargins(20, 20, 20, 20)
@@ -483,12 +480,13 @@ class ImageConverter(QWidget, ConverterPanelMixin, UpscalerPanelMixin, DenoiserP
             "Select 'High Performance' or your dedicated GPU for this application."
         )
         description.setWordWrap(True)
-        description.setStyleSheet(f"font-size: 12px; color: {COLORS['text']}; margin: 10px 0;")
+        description.setStyleSheet(STYLES['hint_description'])
         main_layout.addWidget(description)
         
         # Don't show again checkbox
         dont_show_check = QCheckBox("Don't show this message again")
-        dont_show_check.setStyleSheet(f"font-size: 12px; color: {COLORS['text']};")
+        self._hybrid_dont_show_check = dont_show_check
+        dont_show_check.setStyleSheet(STYLES['hint_checkbox'])
         main_layout.addWidget(dont_show_check)
         
         # Buttons
@@ -496,20 +494,7 @@ class ImageConverter(QWidget, ConverterPanelMixin, UpscalerPanelMixin, DenoiserP
         
         understand_btn = QPushButton("I Understand")
         understand_btn.clicked.connect(dialog.accept)
-        understand_btn.setStyleSheet(f"""
-            QPushButton {{ 
-                background-color: {COLORS['primary']}; 
-                color: white; 
-                border: none; 
-                border-radius: 10px; 
-                padding: 10px; 
-                font-weight: 600; 
-                font-size: 14px;
-            }}
-            QPushButton:hover {{ 
-                background-color: {COLORS['hover']}; 
-            }}
-        """)
+        understand_btn.setStyleSheet(STYLES['hint_button'])
         
         button_layout.addStretch()
         button_layout.addWidget(understand_btn)
@@ -519,113 +504,74 @@ class ImageConverter(QWidget, ConverterPanelMixin, UpscalerPanelMixin, DenoiserP
         # Save the preference if "Don't show again" is checked
         def on_dialog_closed():
             if dont_show_check.isChecked():
-                try:
-                    import json
-                    from src.utils.helpers import get_data_path
-                    settings_path = get_data_path("settings.json")
-                    
-                    # Load existing settings if available
-                    settings = {}
-                    if os.path.exists(settings_path):
-                        with open(settings_path, 'r') as f:
-                            try:
-                                settings = json.load(f)
-                            except:
-                                settings = {}
-                    
-                    # Update settings
-                    settings['hide_hybrid_graphics_hint'] = True
-                    
-                    # Save settings
-                    with open(settings_path, 'w') as f:
-                        json.dump(settings, f)
-                except:
-                    pass
+                settings_store.set('hide_hybrid_graphics_hint', True)
+                self._save_settings()
         
         dialog.finished.connect(on_dialog_closed)
-        dialog.exec()
+        return dialog
 
     def stop_conversion(self):
         """Stop the conversion thread when cancel is clicked"""
-        if hasattr(self, 'thread') and self.thread and self.thread.isRunning():
+        if self.thread is not None and self.thread.isRunning() and not self.thread.cancelled:
             # Set a flag to indicate cancellation
             self.thread.cancelled = True
             self.thread.running = False
             
             # Update failure count for remaining files
-            if hasattr(self.thread, 'total_files') and hasattr(self.thread, 'processed_files'):
-                remaining = self.thread.total_files - self.thread.processed_files
-                self.thread.failure_count += remaining
-            
-            # Call the thread's stop method which handles process termination
-            self.thread.stop()  
-            self.thread.wait(1000)  # Wait for thread to finish
+            remaining = self.thread.total_files - self.thread.processed_files
+            self.thread.failure_count += remaining
             
-            # Close the progress dialog if it's open
-            if hasattr(self, 'progress_dialog') and self.progress_dialog:
-                self.progress_dialog.close()
-                self.progress_dialog = None
+            # The rest happens once the thread has actually wound down, without blocking the UI;
+            # the cancel message replaces the completion summary
+            self.thread.completion_signal.disconnect(self.conversion_complete)
+            self.thread.finished.connect(self._on_thread_cancelled)
             
-            # Show cancellation message
+            # Call the thread's stop method which handles process termination
+            self.thread.stop()
+            if not self.thread.isRunning():
+                self._on_thread_cancelled()  # It finished before the handler was connected
+
+    def _on_thread_cancelled(self):
+        """Close the progress dialog and report a cancelled conversion once its thread has finished"""
+        if self.thread is None:
+            return  # Already handled
+        self.thread = None
+        
+        # Close the progress dialog if it's open
+        if self.progress_dialog is not None:
+            self.progress_dialog.close()
+            self.progress_dialog = None
+        
+        # Show cancellation message; the open-folder button only shows when there's a folder to open
+        # (the conversion wrote to the converter tab's folder, whose existence was checked when it was picked)
+        output_dir = self.converter_fm.output_dir
+        msg_box = self._cancel_message_box()
+        self._cancel_open_btn.setVisible(bool(output_dir) and self.converter_fm.output_dir_exists)
+        msg_box.exec()
+        
+        # Handle button clicks
+        if msg_box.clickedButton() == self._cancel_open_btn:
+            # Open the output folder
+            open_folder(output_dir)
+        
+        # Reset the convert button
+        self.convert_btn.setText("✨ Convert")
+        self.update_convert_button_state()
+
+    def _cancel_message_box(self):
+        """Return the "Conversion Cancelled" message box, building it on first use"""
+        if self._cancel_msg_box is None:
             msg_box = QMessageBox(self)
             msg_box.setWindowTitle("Conversion Cancelled")
             msg_box.setText("The conversion process has been cancelled.")
             msg_box.setIcon(QMessageBox.Icon.Information)
+            msg_box.setStyleSheet(STYLES['message_box'])
             
-            # Style the message box
-            msg_box.setStyleSheet(f"""
-                QMessageBox {{
-                    background-color: {COLORS['background']};
-                    color: {COLORS['text']};
-                }}
-                QLabel {{
-                    color: {COLORS['text']};
-                    font-size: 12px;
-                }}
-                QPushButton {{
-                    background-color: {COLORS['primary']};
-                    color: white;
-                    border: none;
-                    border-radius: 6px;
-                    padding: 8px 16px;
-                    font-weight: bold;
-                    min-width: 80px;
-                }}
-                QPushButton:hover {{
-                    background-color: {COLORS['hover']};
-                }}
-            """)
-            
-            # Add buttons
-            if hasattr(self, 'output_dir') and self.output_dir and os.path.exists(self.output_dir):
-                open_btn = msg_box.addButton("📂 Open Output Folder", QMessageBox.ButtonRole.ActionRole)
-                open_btn.setStyleSheet(f"""
-                    background-color: {COLORS['primary']};
-                    color: white;
-                    border: none;
-                    border-radius: 6px;
-                    padding: 8px 16px;
-                    font-weight: bold;
-                    min-width: 150px;
-                """)
-            
-            ok_btn = msg_box.addButton("OK", QMessageBox.ButtonRole.AcceptRole)
-            
-            # Execute the dialog
-            msg_box.exec()
-            
-            # Handle button clicks
-            clicked_button = msg_box.clickedButton()
-            if 'open_btn' in locals() and clicked_button == open_btn:
-                # Open the output folder
-                os.startfile(self.output_dir)
-            
-            # Reset the convert button
-            self.convert_btn.setText("✨ Convert")
-            self.update_convert_button_state()
-            
-            # Clear the thread reference
-            self.thread = None
+            self._cancel_open_btn = msg_box.addButton("📂 Open Output Folder", QMessageBox.ButtonRole.ActionRole)
+            self._cancel_open_btn.setStyleSheet(STYLES['wide_button'])
+            self._cancel_ok_btn = msg_box.addButton("OK", QMessageBox.ButtonRole.AcceptRole)
+            self._cancel_msg_box = msg_box
+        return self._cancel_msg_box
 
     def get_resource_path(self, relative_path):
         try:
@@ -643,6 +589,13 @@ class ImageConverter(QWidget, ConverterPanelMixin, UpscalerPanelMixin, DenoiserP
 
     def switch_settings_tab(self, index, active_btn, inactive_btns):
         """Switch between settings tabs and update button states"""
+        if index == 3 and self._about_page is None:
+            # The About page is built the first time it's opened
+            placeholder = self.settings_stack.widget(index)
+            self._about_page = self.create_about_page()
+            self.settings_stack.insertWidget(index, self._about_page)
+            self.settings_stack.removeWidget(placeholder)
+            placeholder.deleteLater()
         self.settings_stack.setCurrentIndex(index)
         active_btn.setChecked(True)
         
@@ -655,78 +608,123 @@ class ImageConverter(QWidget, ConverterPanelMixin, UpscalerPanelMixin, DenoiserP
 
     def handle_update_error(self, error_message):
         """Handle errors during update check"""
+        self._update_check_view = functools.partial(self._show_update_error, error_message)
+        if self._settings_panel is not None:
+            self._update_check_view()
+        self.log(error_message, "ERROR")
+
+    def _show_update_error(self, error_message):
+        """Show a failed update check on the Updates page"""
         self.latest_version_label.setText("Latest Version: Unknown")
+        self._release_notes_key = None
         self.update_status.setText(error_message)
-        self.update_status.setStyleSheet(f"color: {COLORS['error']};")
-        self.release_notes.setHtml(f"""
+        self.update_status.setStyleSheet(STYLES['status_error'])
+        # The text colour and font come from the release_notes stylesheet
+        self.release_notes.setHtml("""
             <html>
-            <body style="font-family: 'Segoe UI', sans-serif; color: {COLORS['text']};">
+            <body>
                 <p>Could not retrieve release notes. Please check your internet connection or try again later.</p>
             </body>
             </html>
         """)
-        self.log(error_message, "ERROR")
 
     def toggle_auto_refresh(self, state):
         """Toggle automatic log refresh"""
         if state:
             self.update_logger_display()
 
-    def on_log_changed(self):
+    def toggle_log_word_wrap(self, state):
+        """Wrap long log lines; wrapped rows differ in height, so rows are then measured one by one"""
+        self.logger_view.setUniformItemSizes(not state)
+        self.logger_view.setWordWrap(bool(state))
+
+    def on_log_changed(self, was_at_bottom):
         """Handler for when log content changes"""
         if self.auto_refresh.isChecked():
-            self.update_log_statistics(self.log_messages)
-            # Auto-scroll only if near bottom
-            scrollbar = self.logger_text.verticalScrollBar()
-            if scrollbar.value() >= scrollbar.maximum() - 50:
-                scrollbar.setValue(scrollbar.maximum())
+            self.update_log_statistics()
+            # Auto-scroll only if it was near the bottom
+            if was_at_bottom:
+                self.logger_view.scrollToBottom()
+
+    def _flush_log_lines(self):
+        """Append the log lines queued since the last flush"""
+        with self._log_lock:
+            lines, self._pending_log_lines = self._pending_log_lines, []
+        if lines:
+            self.append_log_batch(lines)
+
+    def append_log_batch(self, lines):
+        """Append log lines to the logger view as one batch of rows"""
+        scrollbar = self.logger_view.verticalScrollBar()
+        was_at_bottom = scrollbar.value() >= scrollbar.maximum() - 50
+        self.log_model.append_lines(lines)
+        self.on_log_changed(was_at_bottom)
 
     def filter_logs(self):
         """Filter logs based on level and search text"""
-        level = self.log_level_combo.currentText()
-        search = self.log_search.text().lower()
-        
-        filtered_logs = []
-        for log in self.log_messages:
-            if level != "All" and f"[{level}]" not in log:
-                continue
-            if search and search not in log.lower():
-                continue
-            filtered_logs.append(log)
-        
-        # Update display with filtered logs
-        self.logger_text.clear()
-        for log in filtered_logs:
-            if "[ERROR]" in log:
-                self.logger_text.append(f'<span style="color: {COLORS["error"]};">{log}</span>')
-            elif "[WARNING]" in log:
-                self.logger_text.append(f'<span style="color: #FFCC00;">{log}</span>')
-            elif "[SUCCESS]" in log:
-                self.logger_text.append(f'<span style="color: {COLORS["success"]};">{log}</span>')
-            elif "[TERMINAL]" in log:
-                self.logger_text.append(f'<span style="color: #00BFFF;">{log}</span>')
-            else:
-                self.logger_text.append(log)
-        
-        # Update statistics
-        self.update_log_statistics(filtered_logs)
+        if self._log_filter_state() == self._log_filter_key:
+            return  # Nothing changed (e.g. a search typed and erased before the debounce fired)
+        self.update_logger_display()
+
+    def _log_filter_state(self):
+        """Return the (level, search text) the log view is filtered by"""
+        return self.log_level_combo.currentText(), self.log_search.text().casefold()
+
+    def _build_log_filter(self):
+        """Return a predicate for the current level filter and search text, or None to keep every line"""
+        # The widgets are read once per filter change, not once per line
+        self._log_filter_key = level, needle = self._log_filter_state()
+        tag = None if level == "All" else f"[{level}]"
+        if tag and needle:
+            return lambda log: tag in log and needle in log.casefold()
+        if tag:
+            return lambda log: tag in log
+        if needle:
+            return lambda log: needle in log.casefold()
+        return None
 
-    def update_log_statistics(self, logs):
+    def update_log_statistics(self):
         """Update log statistics display"""
-        total = len(logs)
-        errors = sum(1 for log in logs if "[ERROR]" in log)
-        warnings = sum(1 for log in logs if "[WARNING]" in log)
-        success = sum(1 for log in logs if "[SUCCESS]" in log)
-        
+        with self._log_lock:
+            counts = self._log_counts
+            total, errors, warnings, success = len(self.log_messages), counts["[ERROR]"], counts["[WARNING]"], counts["[SUCCESS]"]
+        self._show_log_statistics(total, errors, warnings, success)
+
+    def _log_snapshot(self):
+        """Return a copy of log_messages that worker threads can't change underneath"""
+        with self._log_lock:
+            return list(self.log_messages)
+
+    def _reset_log_counts(self):
+        """Zero the per-level line counts kept alongside log_messages; callers hold _log_lock"""
+        self._log_counts = {"[ERROR]": 0, "[WARNING]": 0, "[SUCCESS]": 0}
+
+    def _count_log_line(self, log_entry, step):
+        """Add (step=1) or remove (step=-1) a line from the per-level counts"""
+        counts = self._log_counts
+        for tag in counts:
+            if tag in log_entry:
+                counts[tag] += step
+
+    def _show_log_statistics(self, total, errors, warnings, success):
+        """Show log line counts under the log view"""
         stats = f"Total: {total} | Errors: {errors} | Warnings: {warnings} | Success: {success}"
         self.log_stats.setText(stats)
 
     def copy_logs(self):
         """Copy logs to clipboard"""
+        # Joined from log_messages rather than read back out of the view's document; same lines the view shows
+        log_filter = self._log_filter
         clipboard = QApplication.clipboard()
-        clipboard.setText(self.logger_text.toPlainText())
+        clipboard.setText('\n'.join(log for log in self._log_snapshot() if log_filter is None or log_filter(log)))
         self.log("Logs copied to clipboard", "SUCCESS")
 
+    def copy_selected_logs(self):
+        """Copy the selected log lines to the clipboard"""
+        rows = sorted(index.row() for index in self.logger_view.selectionModel().selectedIndexes())
+        if rows:
+            QApplication.clipboard().setText('\n'.join(self.log_model.lines(rows)))
+
     def export_html_logs(self):
         """Export logs as formatted HTML"""
         file_path, _ = QFileDialog.getSaveFileName(
@@ -737,24 +735,29 @@ class ImageConverter(QWidget, ConverterPanelMixin, UpscalerPanelMixin, DenoiserP
         
         if file_path:
             try:
-                with open(file_path, 'w') as f:
-                    html = f"""
+                level_css = " ".join(f".{level.lower()} {{ color: {color}; }}" for level, color in LOG_LEVEL_COLORS.items())
+                
+                # Written line by line as it's generated rather than built up as one string first
+                with open(file_path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+                    f.write(f"""
                     <html>
                     <head>
                         <style>
                             body {{ font-family: 'Consolas', monospace; background: {COLORS['background']}; color: {COLORS['text']}; padding: 20px; }}
-                            .error {{ color: {COLORS['error']}; }}
-                            .warning {{ color: #FFCC00; }}
-                            .success {{ color: {COLORS['success']}; }}
-                            .terminal {{ color: #00BFFF; }}
+                            {level_css}
                         </style>
                     </head>
                     <body>
-                        <pre>{self.logger_text.toHtml()}</pre>
+                        <pre>""")
+                    # Same lines as the log view; a snapshot, since worker threads may log meanwhile
+                    log_filter = self._log_filter
+                    for log_entry in self._log_snapshot():
+                        if log_filter is None or log_filter(log_entry):
+                            f.write(f'<span class="{get_log_level(log_entry).lower()}">{html.escape(log_entry, quote=False)}</span>\n')
+                    f.write("""</pre>
                     </body>
                     </html>
-                    """
-                    f.write(html)
+                    """)
                 self.log(f"Logs exported to HTML: {file_path}", "SUCCESS")
             except Exception as e:
                 self.log(f"Error exporting HTML: {str(e)}", "ERROR")
@@ -824,17 +827,33 @@ class ImageConverter(QWidget, ConverterPanelMixin, UpscalerPanelMixin, DenoiserP
             
             # Initialize log_messages if it doesn't exist
             if not hasattr(self, 'log_messages'):
-                self.log_messages = []
+                self.log_messages = deque(maxlen=LOG_MAX_LINES)
+                self._reset_log_counts()
                 
-            # Add to log messages list
-            self.log_messages.append(log_entry)
-            
-            # Update the logger display if it exists and is initialized
-            if hasattr(self, 'logger_text') and self.logger_text is not None:
+            # Queue just the new line for the logger display instead of rebuilding it
+            show_line = False
+            if hasattr(self, 'logger_view') and self.logger_view is not None:
                 try:
-                    self.update_logger_display()
+                    log_filter = self._log_filter
+                    show_line = self.auto_refresh.isChecked() and (log_filter is None or log_filter(log_entry))
                 except Exception:
                     pass  # Silently fail if we can't update the logger display
+            
+            # Add to log messages list (the oldest line drops off once it's full), count it and
+            # queue it in one step, so the GUI thread never sees the three disagree
+            first_queued = False
+            with self._log_lock:
+                log_messages = self.log_messages
+                if len(log_messages) == log_messages.maxlen:
+                    self._count_log_line(log_messages[0], -1)
+                log_messages.append(log_entry)
+                self._count_log_line(log_entry, 1)
+                if show_line:
+                    pending = self._pending_log_lines
+                    pending.append(log_entry)  # Shown on the next flush
+                    first_queued = len(pending) == 1
+            if first_queued:
+                self.log_lines_queued.emit()
                 
             # Print to console as well for debugging, but only if not from terminal
             # to avoid infinite recursion
@@ -855,11 +874,27 @@ class ImageConverter(QWidget, ConverterPanelMixin, UpscalerPanelMixin, DenoiserP
 
     def clear_log(self):
         """Clear all log messages"""
-        self.log_messages = []
-        if hasattr(self, 'logger_text'):
-            self.logger_text.clear()
+        with self._log_lock:
+            self.log_messages.clear()
+            self._reset_log_counts()
+            self._pending_log_lines = []
+        if self.logger_view is not None:
+            self.log_model.clear()
         self.log("Log cleared", "INFO")
 
+    def set_log_max_lines(self, text):
+        """Change how many log lines are kept, in memory and in the log view"""
+        max_lines = int(text)
+        with self._log_lock:
+            self.log_messages = deque(self.log_messages, maxlen=max_lines)
+            self._reset_log_counts()
+            for log_entry in self.log_messages:
+                self._count_log_line(log_entry, 1)
+        self.log_model.set_max_lines(max_lines)
+        self.update_log_statistics()
+        settings_store.set('log_max_lines', max_lines)
+        self._save_settings()
+
     def save_log(self):
         """Save log messages to a file"""
         if not self.log_messages:
@@ -875,7 +910,7 @@ class ImageConverter(QWidget, ConverterPanelMixin, UpscalerPanelMixin, DenoiserP
         if file_path:
             try:
                 with open(file_path, 'w') as f:
-                    for log_entry in self.log_messages:
+                    for log_entry in self._log_snapshot():
                         f.write(f"{log_entry}\n")
                 self.log(f"Log saved to {file_path}", "SUCCESS")
                 self.show_message("Log Saved", f"Log has been saved to:\n{file_path}", QMessageBox.Icon.Information)
@@ -900,12 +935,17 @@ class ImageConverter(QWidget, ConverterPanelMixin, UpscalerPanelMixin, DenoiserP
 
     def get_current_settings(self):
         """Method to get all current settings as a dictionary"""
+        if self.jpeg_quality_combo is None:
+            # Settings tab not opened yet; only the Optimize PDF choice is saved
+            return dict(DEFAULT_QUALITY_SETTINGS, pdf_optimize=settings_store.get('pdf_optimize', DEFAULT_QUALITY_SETTINGS['pdf_optimize']))
         return {
             'jpeg_quality': self.jpeg_quality_combo.currentText(),
             'webp_quality': self.webp_quality_combo.currentText(),
+            'webp_method': self.webp_method_combo.currentText(),
             'png_compression': self.png_compression_combo.currentText(),
             'pdf_dpi': self.pdf_dpi_combo.currentText(),
-            'pdf_quality': self.pdf_quality_combo.currentText()
+            'pdf_quality': self.pdf_quality_combo.currentText(),
+            'pdf_optimize': self.pdf_optimize_check.isChecked()
         }
 
     def initUI(self):
@@ -1065,15 +1105,13 @@ class ImageConverter(QWidget, ConverterPanelMixin, UpscalerPanelMixin, DenoiserP
         stitcher_layout.addWidget(stitcher_panel, 2)
         stitcher_layout.addWidget(stitcher_file_panel, 3)
 
-        # Create Settings tab
+        # Create Settings tab; the panel itself is built the first time the tab is opened
         settings_tab = QWidget()
         settings_layout = QVBoxLayout(settings_tab)
         settings_layout.setContentsMargins(0, 0, 0, 0)  # Remove internal margins
         settings_layout.setSpacing(10)
-
-        # Add settings panel
-        settings_panel = self.create_settings_panel()
-        settings_layout.addWidget(settings_panel)
+        self._settings_tab = settings_tab
+        tab_widget.currentChanged.connect(lambda index: self._on_tab_changed(tab_widget.widget(index)))
 
         # Add tabs
         tab_widget.addTab(home_tab, "🏠 Converter")
@@ -1089,6 +1127,12 @@ class ImageConverter(QWidget, ConverterPanelMixin, UpscalerPanelMixin, DenoiserP
         
         self.setLayout(main_layout)
 
+    def _on_tab_changed(self, tab):
+        """Build the Settings panel the first time its tab is opened"""
+        if tab is self._settings_tab and self._settings_panel is None:
+            self._settings_panel = self.create_settings_panel()
+            tab.layout().addWidget(self._settings_panel)
+
     def toggle_noise_level_visibility(self, visible):
         """Show or hide the noise level selection based on the selected model"""
         # Check if the noise level combo exists
@@ -1238,7 +1282,6 @@ class ImageConverter(QWidget, ConverterPanelMixin, UpscalerPanelMixin, DenoiserP
 
     def natural_sort_key(self, s):
         """Natural sort key function for sorting filenames with numbers correctly"""
-        import re
         return [int(text) if text.isdigit() else text.lower() 
                 for text in re.split('([0-9]+)', os.path.basename(s))]
 
@@ -1271,29 +1314,10 @@ class ImageConverter(QWidget, ConverterPanelMixin, UpscalerPanelMixin, DenoiserP
         """Toggle output format combo box based on checkbox state"""
         if self.keep_format_check.isChecked():
             self.upscaler_format_combo.setEnabled(False)
-            self.upscaler_format_combo.setStyleSheet(f"""
-                QComboBox {{
-                    background-color: #3d3d4f;
-                    color: #888888;
-                    border: 1px solid #3d3d4f;
-                    border-radius: 8px;
-                    padding: 8px 12px;
-                }}
-            """)
+            self.upscaler_format_combo.setStyleSheet(STYLES['format_combo_disabled'])
         else:
             self.upscaler_format_combo.setEnabled(True)
-            self.upscaler_format_combo.setStyleSheet(f"""
-                QComboBox {{
-                    background-color: {COLORS['background']};
-                    color: {COLORS['text']};
-                    border: 1px solid {COLORS['border']};
-                    border-radius: 8px;
-                    padding: 8px 12px;
-                }}
-                QComboBox:hover {{
-                    border: 1px solid {COLORS['primary']};
-                }}
-            """)
+            self.upscaler_format_combo.setStyleSheet(STYLES['format_combo'])
 
     def start_upscaling(self):
         """Start the upscaling process"""
@@ -1404,7 +1428,7 @@ class ImageConverter(QWidget, ConverterPanelMixin, UpscalerPanelMixin, DenoiserP
         output_format = "PNG"
         
         # Clean up any existing thread
-        if hasattr(self, 'upscaler_thread') and self.upscaler_thread:
+        if self.upscaler_thread is not None:
             try:
                 self.upscaler_thread.progress_signal.disconnect()
                 self.upscaler_thread.completion_signal.disconnect()
@@ -1431,7 +1455,7 @@ class ImageConverter(QWidget, ConverterPanelMixin, UpscalerPanelMixin, DenoiserP
         self.upscaler_thread.log_signal.connect(self.log)
         
         # Create progress dialog
-        if hasattr(self, 'upscaler_progress_dialog') and self.upscaler_progress_dialog:
+        if self.upscaler_progress_dialog is not None:
             self.upscaler_progress_dialog.close()
             self.upscaler_progress_dialog.deleteLater()
         
@@ -1448,12 +1472,12 @@ class ImageConverter(QWidget, ConverterPanelMixin, UpscalerPanelMixin, DenoiserP
     def upscaling_completed(self, last_output_path, input_size, output_size, success_count, failure_count):
         """Show a completion message for upscaling with statistics"""
         # First close the progress dialog if it's still open
-        if hasattr(self, 'upscaler_progress_dialog') and self.upscaler_progress_dialog and self.upscaler_progress_dialog.isVisible():
+        if self.upscaler_progress_dialog is not None and self.upscaler_progress_dialog.isVisible():
             self.upscaler_progress_dialog.accept()
             self.upscaler_progress_dialog = None
             
         # Don't show completion message if the operation was cancelled
-        if hasattr(self, 'upscaler_thread') and self.upscaler_thread and self.upscaler_thread.cancelled:
+        if self.upscaler_thread is not None and self.upscaler_thread.cancelled:
             # Reset the upscale button
             self.upscale_btn.setText("✨ Upscale")
             self.update_upscale_button_state()
@@ -1546,7 +1570,7 @@ class ImageConverter(QWidget, ConverterPanelMixin, UpscalerPanelMixin, DenoiserP
             # Open the output folder
             output_dir = os.path.dirname(last_output_path) if last_output_path else self.upscaler_output_dir
             if output_dir and os.path.exists(output_dir):
-                os.startfile(output_dir)
+                open_folder(output_dir)
 
         # Reset the upscale button
         self.upscale_btn.setText("✨ Upscale")
@@ -1566,7 +1590,7 @@ class ImageConverter(QWidget, ConverterPanelMixin, UpscalerPanelMixin, DenoiserP
 
     def stop_upscaling(self):
         """Stop the upscaling thread"""
-        if not hasattr(self, 'upscaler_thread') or not self.upscaler_thread:
+        if self.upscaler_thread is None:
             return
             
         # Set flags to stop the thread gracefully
@@ -1577,7 +1601,7 @@ class ImageConverter(QWidget, ConverterPanelMixin, UpscalerPanelMixin, DenoiserP
         self.upscaler_thread.stop()
         
         # Disable the cancel button to prevent multiple clicks
-        if hasattr(self, 'upscaler_progress_dialog') and self.upscaler_progress_dialog:
+        if self.upscaler_progress_dialog is not None:
             self.upscaler_progress_dialog.cancel_btn.setEnabled(False)
             self.upscaler_progress_dialog.cancel_btn.setText("Cancelling...")
             # Close the progress dialog immediately
@@ -1645,7 +1669,7 @@ class ImageConverter(QWidget, ConverterPanelMixin, UpscalerPanelMixin, DenoiserP
         if hasattr(msg_box, 'clickedButton') and 'open_btn' in locals() and msg_box.clickedButton() == open_btn:
             # Open the output folder
             if self.upscaler_output_dir and os.path.exists(self.upscaler_output_dir):
-                os.startfile(self.upscaler_output_dir)
+                open_folder(self.upscaler_output_dir)
                 
         # Reset the upscale button
         self.upscale_btn.setText("✨ Upscale")
@@ -1672,8 +1696,7 @@ class ImageConverter(QWidget, ConverterPanelMixin, UpscalerPanelMixin, DenoiserP
         layout.addWidget(title)
         
         # Check for RealESRGAN executable
-        core_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "core")
-        realesrgan_path = os.path.join(core_dir, "esr", "realesrgan-ncnn-vulkan.exe")
+        realesrgan_path = os.path.join(CORE_DIR, "esr", "realesrgan-ncnn-vulkan.exe")
         has_realesrgan = os.path.exists(realesrgan_path)
         
         # Create status indicators
@@ -1783,7 +1806,6 @@ class ImageConverter(QWidget, ConverterPanelMixin, UpscalerPanelMixin, DenoiserP
                 vulkan_status.setStyleSheet("font-size: 12pt; color: #FFCC00;")
         
         # Run the Vulkan check in a separate thread
-        import threading
         vulkan_thread = threading.Thread(target=check_vulkan)
         vulkan_thread.daemon = True
         vulkan_thread.start()
@@ -2126,7 +2148,7 @@ class ImageConverter(QWidget, ConverterPanelMixin, UpscalerPanelMixin, DenoiserP
         
         # Add Files button
         add_files_btn = QPushButton("📁 Add Files")
-        add_files_btn.setFont(QFont("Segoe UI", 10))
+        add_files_btn.setFont(get_font(10))
         add_files_btn.setFixedHeight(40)
         add_files_btn.clicked.connect(self.add_files)
         add_files_btn.setCursor(Qt.CursorShape.PointingHandCursor)
@@ -2147,7 +2169,7 @@ class ImageConverter(QWidget, ConverterPanelMixin, UpscalerPanelMixin, DenoiserP
         
         # Add Folder button
         add_folder_btn = QPushButton("📂 Add Folder")
-        add_folder_btn.setFont(QFont("Segoe UI", 10))
+        add_folder_btn.setFont(get_font(10))
         add_folder_btn.setFixedHeight(40)
         add_folder_btn.clicked.connect(self.add_folder)
         add_folder_btn.setCursor(Qt.CursorShape.PointingHandCursor)
@@ -2156,7 +2178,7 @@ class ImageConverter(QWidget, ConverterPanelMixin, UpscalerPanelMixin, DenoiserP
         
         # Clear Files button (red color)
         clear_files_btn = QPushButton("🚫 Clear Files")
-        clear_files_btn.setFont(QFont("Segoe UI", 10))
+        clear_files_btn.setFont(get_font(10))
         clear_files_btn.setFixedHeight(40)
         clear_files_btn.clicked.connect(self.clear_files)
         clear_files_btn.setCursor(Qt.CursorShape.PointingHandCursor)
@@ -2177,7 +2199,7 @@ class ImageConverter(QWidget, ConverterPanelMixin, UpscalerPanelMixin, DenoiserP
         
         # Set Output button
         set_output_btn = QPushButton("📂 Set Output")
-        set_output_btn.setFont(QFont("Segoe UI", 10))
+        set_output_btn.setFont(get_font(10))
         set_output_btn.setFixedHeight(40)
         set_output_btn.clicked.connect(self.select_output_dir)
         set_output_btn.setCursor(Qt.CursorShape.PointingHandCursor)
@@ -2235,7 +2257,6 @@ class ImageConverter(QWidget, ConverterPanelMixin, UpscalerPanelMixin, DenoiserP
             
             # Natural sort files
             def natural_sort_key(s):
-                import re
                 return [int(text) if text.isdigit() else text.lower()
                         for text in re.split('([0-9]+)', s)]
             
@@ -2291,7 +2312,6 @@ class ImageConverter(QWidget, ConverterPanelMixin, UpscalerPanelMixin, DenoiserP
             
             # Natural sort files using a key function
             def natural_sort_key(s):
-                import re
                 return [int(text) if text.isdigit() else text.lower()
                         for text in re.split('([0-9]+)', s)]
             
@@ -2437,7 +2457,6 @@ class ImageConverter(QWidget, ConverterPanelMixin, UpscalerPanelMixin, DenoiserP
         
         # Sort files in natural order
         def natural_sort_key(s):
-            import re
             return [int(text) if text.isdigit() else text.lower()
                     for text in re.split('([0-9]+)', s)]
         
@@ -2986,30 +3005,9 @@ class ImageConverter(QWidget, ConverterPanelMixin, UpscalerPanelMixin, DenoiserP
             self.upscale_check.setStyleSheet("font-size: 13px; color: #888888;")
             self.upscale_check.setToolTip("AI Upscaling requires Vulkan support")
             
-        # Update file checkboxes based on new format
-        if hasattr(self, 'converter_fm') and hasattr(self.converter_fm, 'file_checkboxes'):
-            current_output_format = format_text.lower()
-            
-            for checkbox in self.converter_fm.file_checkboxes:
-                try:
-                    file_ext = os.path.splitext(checkbox.file_path)[1].lower()[1:]
-                    
-                    # Disable checkbox if file format matches output format
-                    if file_ext == current_output_format:
-                        checkbox.setChecked(False)
-                        checkbox.setEnabled(False)
-                        checkbox.setStyleSheet(f"QCheckBox::indicator {{ background-color: #555555; }}")
-                    else:
-                        checkbox.setEnabled(True)
-                        checkbox.setStyleSheet("")
-                        # If "Select All" is checked, check this box too
-                        if hasattr(self.converter_fm, 'select_all_checkbox') and self.converter_fm.select_all_checkbox.isChecked():
-                            checkbox.setChecked(True)
-                except RuntimeError:
-                    pass
-            
-            self.converter_fm.update_file_type_checkbox_state()
-            self.converter_fm.update_button_callback()
+        # Files already in the new output format can't be selected for conversion
+        if hasattr(self, 'converter_fm'):
+            self.converter_fm.set_excluded_extension(format_text.lower())
 
     def select_output_dir(self):
         dir_dialog = QFileDialog()
@@ -3097,13 +3095,7 @@ class ImageConverter(QWidget, ConverterPanelMixin, UpscalerPanelMixin, DenoiserP
             return
             
         # Get current settings using the correct combo box references
-        current_settings = {
-            'jpeg_quality': self.jpeg_quality_combo.currentText(),
-            'webp_quality': self.webp_quality_combo.currentText(),
-            'png_compression': self.png_compression_combo.currentText(),
-            'pdf_dpi': self.pdf_dpi_combo.currentText(),
-            'pdf_quality': self.pdf_quality_combo.currentText()
-        }
+        current_settings = self.get_current_settings()
             
         # Determine if we should force GPU via upscale_check (if applicable)
         force_enabled = hasattr(self, 'force_upscale_check') and self.force_upscale_check.isChecked()
@@ -3151,7 +3143,7 @@ class ImageConverter(QWidget, ConverterPanelMixin, UpscalerPanelMixin, DenoiserP
             self.progress_dialog = None
             
         # Don't show completion message if the operation was cancelled
-        if hasattr(self, 'thread') and self.thread and self.thread.cancelled:
+        if self.thread is not None and self.thread.cancelled:
             return
             
         # Format sizes in MB
@@ -3236,7 +3228,7 @@ class ImageConverter(QWidget, ConverterPanelMixin, UpscalerPanelMixin, DenoiserP
             # Open the output folder
             output_dir = os.path.dirname(last_output_path)
             if os.path.exists(output_dir):
-                os.startfile(output_dir)
+                open_folder(output_dir)
 
         # Reset the convert button
         self.convert_btn.setText("✨ Convert")
@@ -3248,7 +3240,7 @@ class ImageConverter(QWidget, ConverterPanelMixin, UpscalerPanelMixin, DenoiserP
 
     def open_output_folder(self):
         if self.output_dir and os.path.exists(self.output_dir):
-            os.startfile(self.output_dir)
+            open_folder(self.output_dir)
 
     def show_system_info(self):
         """Show system information dialog with brand icons"""
@@ -3298,23 +3290,7 @@ class ImageConverter(QWidget, ConverterPanelMixin, UpscalerPanelMixin, DenoiserP
             progress = QProgressBar()
             progress.setRange(0, 0)  # Indeterminate progress
             progress.setTextVisible(False)
-            progress.setStyleSheet(f"""
-                QProgressBar {{
-                    border: 1px solid {COLORS['border']};
-                    border-radius: 5px;
-                    background-color: {COLORS['panel']};
-                    height: 20px;
-                    text-align: center;
-                    padding: 0px;
-                }}
-                QProgressBar::chunk {{
-                    background-color: {COLORS['primary']};
-                    border-radius: 4px;
-                    margin: 1px;
-                    border: 1px solid {COLORS['primary']};
-                    min-width: 10px;
-                }}
-            """)
+            progress.setStyleSheet(STYLES['progress_bar'])
             loading_layout.addWidget(progress)
             
             # Show the loading dialog without blocking
@@ -3328,9 +3304,9 @@ class ImageConverter(QWidget, ConverterPanelMixin, UpscalerPanelMixin, DenoiserP
             dialog.setStyleSheet(f"background-color: {COLORS['background']}; color: {COLORS['text']};")
             
             # Set window icon
-            icon_path = get_icon_path("icon.ico")
-            if os.path.exists(icon_path):
-                dialog.setWindowIcon(QIcon(icon_path))
+            icon = get_icon("icon.ico")
+            if icon:
+                dialog.setWindowIcon(icon)
             
             # Create a worker thread to gather system info
             class SystemInfoWorker(QThread):
@@ -3342,7 +3318,6 @@ class ImageConverter(QWidget, ConverterPanelMixin, UpscalerPanelMixin, DenoiserP
                     try:
                         # Gather all system information
                         import platform
-                        import sys
                         
                         info = {}
                         info['os_name'] = platform.system() + " " + platform.release()
@@ -3365,11 +3340,7 @@ class ImageConverter(QWidget, ConverterPanelMixin, UpscalerPanelMixin, DenoiserP
                         info['vulkan_support'] = False
                         
                         try:
-                            import subprocess
-                            import re
                             import tempfile
-                            import time
-                            import os
                             
                             # Create a hidden process
                             startupinfo = subprocess.STARTUPINFO()
@@ -3412,7 +3383,7 @@ class ImageConverter(QWidget, ConverterPanelMixin, UpscalerPanelMixin, DenoiserP
                                         stderr=subprocess.PIPE,
                                         startupinfo=startupinfo,
                                         text=True,
-                                        timeout=3
+                                        timeout=1  # A hung WMI service shouldn't hold up the report
                                     )
                                     
                                     if result.returncode == 0:
@@ -3700,9 +3671,9 @@ class ImageConverter(QWidget, ConverterPanelMixin, UpscalerPanelMixin, DenoiserP
         dialog.setStyleSheet(f"background-color: {COLORS['background']}; color: {COLORS['text']};")
         
         # Set window icon
-        icon_path = get_icon_path("icon.ico")
-        if os.path.exists(icon_path):
-            dialog.setWindowIcon(QIcon(icon_path))
+        icon = get_icon("icon.ico")
+        if icon:
+            dialog.setWindowIcon(icon)
         
         layout = QVBoxLayout(dialog)
         layout.setContentsMargins(20, 20, 20, 20)
@@ -3790,6 +3761,7 @@ class ImageConverter(QWidget, ConverterPanelMixin, UpscalerPanelMixin, DenoiserP
             <li><b>JPEG Quality</b>: Higher values (70-100) provide better quality but larger file sizes</li>
             <li><b>PNG Compression</b>: Higher compression levels take longer but produce smaller files</li>
             <li><b>WEBP Quality</b>: Similar to JPEG, balances quality and file size</li>
+            <li><b>WEBP Encoding</b>: How hard the encoder searches for a smaller file. <b>Balanced</b> is much faster than <b>Best (Slow)</b> for a marginal size difference; use Best for archival copies</li>
         </ul>
         <h3 style="font-size: 18px; margin-top: 15px;">Step 4: AI Upscaling (Optional)</h3>
         <p style="font-size: 14px; margin: 5px 0 10px 10px;">• Enable AI Upscaling by clicking the gear icon to enhance image quality and resolution<br>• Select an upscale factor from the dropdown (1x, 2x, 4x for Waifu2x, and 2x, 3x, 4x for others)<br>• We feature <b>Waifu2x</b>, <b>RealCUGAN</b>, and <b>RealESRGAN</b> models for different art styles.<br>• <b>GPU STRICT MODE:</b> For maximum stability, all AI processing runs strictly on your dedicated GPU (Vulkan). CPU fallback is intentionally disabled.<br>• Upscaling will increase processing time and output file size</p>
@@ -3996,7 +3968,8 @@ class ImageConverter(QWidget, ConverterPanelMixin, UpscalerPanelMixin, DenoiserP
             noise_level=noise_level,
             model=model,
             keep_format=keep_format,
-            output_format=output_format if output_format else "PNG"
+            output_format=output_format if output_format else "PNG",
+            threads=settings_store.get('denoiser_threads')  # Optional "load:proc:save" override
         )
         
         # Connect signals
@@ -4023,7 +3996,7 @@ class ImageConverter(QWidget, ConverterPanelMixin, UpscalerPanelMixin, DenoiserP
             self.denoiser_thread.cancelled = True
             
             # Close the progress dialog
-            if hasattr(self, 'denoiser_progress_dialog') and self.denoiser_progress_dialog:
+            if self.denoiser_progress_dialog is not None:
                 self.denoiser_progress_dialog.close()
                 self.denoiser_progress_dialog = None
             
@@ -4087,7 +4060,7 @@ class ImageConverter(QWidget, ConverterPanelMixin, UpscalerPanelMixin, DenoiserP
             # Handle button clicks
             if hasattr(msg_box, 'clickedButton') and 'open_btn' in locals() and msg_box.clickedButton() == open_btn:
                 if self.denoiser_output_dir and os.path.exists(self.denoiser_output_dir):
-                    os.startfile(self.denoiser_output_dir)
+                    open_folder(self.denoiser_output_dir)
             
             # Reset the denoise button
             self.denoise_btn.setText("✨ Denoise")
@@ -4101,7 +4074,7 @@ class ImageConverter(QWidget, ConverterPanelMixin, UpscalerPanelMixin, DenoiserP
             self.denoiser_progress_dialog = None
             
         # Don't show completion message if the operation was cancelled
-        if hasattr(self, 'denoiser_thread') and self.denoiser_thread and self.denoiser_thread.cancelled:
+        if self.denoiser_thread is not None and self.denoiser_thread.cancelled:
             return
             
         # Format sizes in MB
@@ -4183,7 +4156,7 @@ class ImageConverter(QWidget, ConverterPanelMixin, UpscalerPanelMixin, DenoiserP
             # Open the output folder
             output_dir = os.path.dirname(last_output_path)
             if os.path.exists(output_dir):
-                os.startfile(output_dir)
+                open_folder(output_dir)
 
         # Reset the denoise button
         self.denoise_btn.setText("✨ Denoise")
@@ -4204,21 +4177,7 @@ class ImageConverter(QWidget, ConverterPanelMixin, UpscalerPanelMixin, DenoiserP
             current_spacing = self.spacing_combo.currentText()
             
             # Apply disabled styling to the combo box
-            self.spacing_combo.setStyleSheet("""
-                QComboBox {
-                    background-color: #3d3d4f;
-                    color: #888888;
-                    border: 1px solid #3d3d4f;
-                    border-radius: 8px;
-                    padding: 8px 12px;
-                }
-                QComboBox::drop-down {
-                    border: none;
-                }
-                QComboBox::down-arrow {
-                    image: none;
-                }
-            """)
+            self.spacing_combo.setStyleSheet(STYLES['spacing_combo_disabled'])
             
             if not self.manual_spacing_input.text():
                 self.manual_spacing_input.setText("0")
@@ -4,6 +4,7 @@ from src.ui.widgets.progress_dialog import ProcessingProgressDialog
 from src.ui.widgets.update_notification import UpdateNotification
 from src.ui.widgets.upscale_settings import UpscaleSettingsDialog
 from src.managers.file_list_manager import FileListManager
+from src.utils.settings_store import settings_store
 
 import os
 import time
@@ -20,7 +21,7 @@ from src.config import *
 class ConverterPanelMixin:
     def create_converter_panel(self):
         panel = QFrame()
-        panel.setStyleSheet(f"background-color: {COLORS['panel']}; border-radius: 0px; border-bottom-left-radius: 10px;")
+        panel.setStyleSheet(STYLES['converter_panel'])
         layout = QVBoxLayout(panel)
         layout.setContentsMargins(15, 15, 15, 15)
         layout.setSpacing(15)
@@ -59,10 +60,7 @@ class ConverterPanelMixin:
         self.upscale_settings_btn.setFixedSize(32, 32)
         self.upscale_settings_btn.setCursor(Qt.CursorShape.PointingHandCursor)
         self.upscale_settings_btn.setToolTip("Configure upscale model settings")
-        self.upscale_settings_btn.setStyleSheet(f"""
-            QPushButton {{ background-color: {COLORS['secondary']}; color: {COLORS['text']}; border: none; border-radius: 6px; font-size: 14px; }}
-            QPushButton:hover {{ background-color: {COLORS['hover']}; }}
-        """)
+        self.upscale_settings_btn.setStyleSheet(STYLES['icon_button'])
         self.upscale_settings_btn.clicked.connect(self.open_upscale_settings)
         upscale_layout.addWidget(self.upscale_settings_btn)
         
@@ -83,23 +81,11 @@ class ConverterPanelMixin:
         
         # Instructions button
         instructions_btn = QPushButton("📖 Instructions")
-        instructions_btn.setFont(QFont("Segoe UI", 10))
+        instructions_btn.setFont(get_font(10))
         instructions_btn.setFixedHeight(35)
         instructions_btn.clicked.connect(self.show_instructions)
         instructions_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        instructions_btn.setStyleSheet(f"""
-            QPushButton {{ 
-                background-color: {COLORS['secondary']}; 
-                color: {COLORS['text']}; 
-                border: none; 
-                border-radius: 8px; 
-                padding: 8px; 
-                font-weight: 600; 
-            }}
-            QPushButton:hover {{ 
-                background-color: {COLORS['hover']}; 
-            }}
-        """)
+        instructions_btn.setStyleSheet(STYLES['action_button'])
         
         # Create a horizontal layout for the buttons
         buttons_layout = QHBoxLayout()
@@ -107,11 +93,11 @@ class ConverterPanelMixin:
         
         # System Info button
         system_info_btn = QPushButton("🖥️ Check Upscale")
-        system_info_btn.setFont(QFont("Segoe UI", 10))
+        system_info_btn.setFont(get_font(10))
         system_info_btn.setFixedHeight(35)
         system_info_btn.clicked.connect(self.show_system_info)
         system_info_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        system_info_btn.setStyleSheet(instructions_btn.styleSheet())  # Use same style as instructions button
+        system_info_btn.setStyleSheet(STYLES['action_button'])  # Same style as the instructions button
         buttons_layout.addWidget(system_info_btn)
         
         # Add the buttons layout to the main layout
@@ -119,20 +105,13 @@ class ConverterPanelMixin:
         
         # Help text
         help_text = QLabel("📝 Read the instructions for optimal usage.\n⚙️ Adjust settings to control output quality and file size.\n🖥️ Check Upscale Info to verify AI upscaling availability.")
-        help_text.setStyleSheet(f"""
-            color: {COLORS['text_secondary']}; 
-            font-size: 9pt; 
-            margin-top: 10px;
-            padding: 8px;
-            background-color: rgba(61, 61, 79, 0.3);
-            border-radius: 6px;
-        """)
+        help_text.setStyleSheet(STYLES['help_text'])
         layout.addWidget(help_text)
         
         # Add separator
         separator = QFrame()
         separator.setFrameShape(QFrame.Shape.HLine)
-        separator.setStyleSheet(f"background-color: {COLORS['border']}; margin: 15px 0px;")
+        separator.setStyleSheet(STYLES['separator'])
         layout.addWidget(separator)
         
         # File Selection section
@@ -147,29 +126,12 @@ class ConverterPanelMixin:
         
         # Convert button at the bottom
         self.convert_btn = QPushButton("✨ Convert")
-        self.convert_btn.setFont(QFont("Segoe UI", 12))
+        self.convert_btn.setFont(get_font(12))
         self.convert_btn.setFixedHeight(65)
         self.convert_btn.setEnabled(False)
         self.convert_btn.clicked.connect(self.start_conversion)
         self.convert_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        self.convert_btn.setStyleSheet(f"""
-            QPushButton {{ 
-                background-color: {COLORS['primary']}; 
-                color: white; 
-                border: none; 
-                border-radius: 8px; 
-                padding: 10px; 
-                font-weight: 600; 
-                margin-top: 10px;
-            }}
-            QPushButton:hover {{ 
-                background-color: {COLORS['hover']}; 
-            }}
-            QPushButton:disabled {{ 
-                background-color: {COLORS['disabled']}; 
-                color: {COLORS['text_secondary']}; 
-            }}
-        """)
+        self.convert_btn.setStyleSheet(STYLES['primary_button_large'])
         layout.addWidget(self.convert_btn)
         
         return panel
@@ -180,12 +142,18 @@ class ConverterPanelMixin:
         current_settings = self.get_current_settings()
         
         # If we have an active conversion thread, update its settings
-        if hasattr(self, 'thread') and self.thread and self.thread.isRunning():
+        if self.thread is not None and self.thread.isRunning():
             self.thread.settings = current_settings
             
         # Debug print to verify settings are updated
         print(f"Quality settings updated: {current_settings}")
 
+    def on_pdf_optimize_changed(self, state):
+        """Remember the Optimize PDF choice and pass it to a running conversion"""
+        settings_store.set('pdf_optimize', bool(state))
+        self._save_settings()
+        self.update_quality_settings()
+
     def update_convert_button_state(self):
         """Update the state of the convert button based on file selection and output directory"""
         files_selected = len(self.converter_fm.get_selected_files()) > 0
@@ -443,7 +443,7 @@ class DenoiserPanelMixin:
         
         # Instructions button
         instructions_btn = QPushButton("📖 Denoiser Info")
-        instructions_btn.setFont(QFont("Segoe UI", 10))
+        instructions_btn.setFont(get_font(10))
         instructions_btn.setFixedHeight(35)
         instructions_btn.clicked.connect(self.show_denoiser_instructions)
         instructions_btn.setCursor(Qt.CursorShape.PointingHandCursor)
@@ -464,7 +464,7 @@ class DenoiserPanelMixin:
         
         # System Info button
         system_info_btn = QPushButton("🖥️ Check GPU")
-        system_info_btn.setFont(QFont("Segoe UI", 10))
+        system_info_btn.setFont(get_font(10))
         system_info_btn.setFixedHeight(35)
         system_info_btn.clicked.connect(self.show_system_info)
         system_info_btn.setCursor(Qt.CursorShape.PointingHandCursor)
@@ -503,7 +503,7 @@ class DenoiserPanelMixin:
         
         # Denoise button at the bottom
         self.denoise_btn = QPushButton("✨ Denoise")
-        self.denoise_btn.setFont(QFont("Segoe UI", 12))
+        self.denoise_btn.setFont(get_font(12))
         self.denoise_btn.setFixedHeight(65)
         self.denoise_btn.setEnabled(False)
         self.denoise_btn.clicked.connect(self.start_denoising)
@@ -622,7 +622,7 @@ class DenoiserPanelMixin:
         
         # Add Files button
         add_files_btn = QPushButton("📁 Add Files")
-        add_files_btn.setFont(QFont("Segoe UI", 10))
+        add_files_btn.setFont(get_font(10))
         add_files_btn.setFixedHeight(40)
         add_files_btn.clicked.connect(self.add_denoiser_files)
         add_files_btn.setCursor(Qt.CursorShape.PointingHandCursor)
@@ -643,7 +643,7 @@ class DenoiserPanelMixin:
         
         # Add Folder button
         add_folder_btn = QPushButton("📂 Add Folder")
-        add_folder_btn.setFont(QFont("Segoe UI", 10))
+        add_folder_btn.setFont(get_font(10))
         add_folder_btn.setFixedHeight(40)
         add_folder_btn.clicked.connect(self.add_denoiser_folder)
         add_folder_btn.setCursor(Qt.CursorShape.PointingHandCursor)
@@ -652,7 +652,7 @@ class DenoiserPanelMixin:
         
         # Clear Files button
         clear_files_btn = QPushButton("🚫 Clear Files")
-        clear_files_btn.setFont(QFont("Segoe UI", 10))
+        clear_files_btn.setFont(get_font(10))
         clear_files_btn.setFixedHeight(40)
         clear_files_btn.clicked.connect(self.clear_denoiser_files)
         clear_files_btn.setCursor(Qt.CursorShape.PointingHandCursor)
@@ -673,7 +673,7 @@ class DenoiserPanelMixin:
         
         # Set Output button
         set_output_btn = QPushButton("📂 Set Output")
-        set_output_btn.setFont(QFont("Segoe UI", 10))
+        set_output_btn.setFont(get_font(10))
         set_output_btn.setFixedHeight(40)
         set_output_btn.clicked.connect(self.set_denoiser_output_dir)
         set_output_btn.setCursor(Qt.CursorShape.PointingHandCursor)
@@ -1019,28 +1019,9 @@ class DenoiserPanelMixin:
         
         # Apply the same styling as used in toggle_output_format
         if is_checked:
-            self.denoiser_format_combo.setStyleSheet(f"""
-                QComboBox {{
-                    background-color: #3d3d4f;
-                    color: #888888;
-                    border: 1px solid #3d3d4f;
-                    border-radius: 8px;
-                    padding: 8px 12px;
-                }}
-            """)
+            self.denoiser_format_combo.setStyleSheet(STYLES['format_combo_disabled'])
         else:
-            self.denoiser_format_combo.setStyleSheet(f"""
-                QComboBox {{
-                    background-color: {COLORS['background']};
-                    color: {COLORS['text']};
-                    border: 1px solid {COLORS['border']};
-                    border-radius: 8px;
-                    padding: 8px 12px;
-                }}
-                QComboBox:hover {{
-                    border: 1px solid {COLORS['primary']};
-                }}
-            """)
+            self.denoiser_format_combo.setStyleSheet(STYLES['format_combo'])
 
     def update_denoiser_progress(self, value, eta_text, speed_text):
         """Update the denoiser progress dialog"""
@@ -1055,9 +1036,9 @@ class DenoiserPanelMixin:
         dialog.setStyleSheet(f"background-color: {COLORS['background']}; color: {COLORS['text']};")
         
         # Set window icon
-        icon_path = get_icon_path("icon.ico")
-        if os.path.exists(icon_path):
-            dialog.setWindowIcon(QIcon(icon_path))
+        icon = get_icon("icon.ico")
+        if icon:
+            dialog.setWindowIcon(icon)
         
         layout = QVBoxLayout(dialog)
         layout.setContentsMargins(20, 20, 20, 20)
@@ -102,9 +102,9 @@ class FooterMixin:
         dialog.setStyleSheet(f"background-color: {COLORS['background']}; color: {COLORS['text']};")
         
         # Set window icon
-        icon_path = get_icon_path("contact.png")
-        if os.path.exists(icon_path):
-            dialog.setWindowIcon(QIcon(icon_path))
+        icon = get_icon("contact.png")
+        if icon:
+            dialog.setWindowIcon(icon)
             
         layout = QVBoxLayout(dialog)
         layout.setContentsMargins(25, 25, 25, 25)
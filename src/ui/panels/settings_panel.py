@@ -1,26 +1,64 @@
 
 from src.ui.widgets.animated_combobox import AnimatedComboBox
+from src.ui.widgets.log_list_model import LogListModel
 from src.ui.widgets.progress_dialog import ProcessingProgressDialog
 from src.ui.widgets.update_notification import UpdateNotification
 from src.ui.widgets.upscale_settings import UpscaleSettingsDialog
 from src.managers.file_list_manager import FileListManager
+from src.utils.settings_store import settings_store
 
 import os
+import re
+import json
 import time
+import functools
 import psutil
 from PyQt6.QtWidgets import *
 from PyQt6.QtGui import *
 from PyQt6.QtCore import *
+from PyQt6.QtNetwork import QNetworkAccessManager, QNetworkRequest, QNetworkReply
 
 from src.constants import *
 from src.ui.styles import *
 from src.utils.helpers import *
 from src.config import *
 
+# Release notes page up to the notes themselves, rendered once
+_RELEASE_NOTES_HEAD = f"""
+            <html>
+            <head>
+                <style>
+                    body {{ 
+                        font-family: 'Segoe UI', sans-serif; 
+                        color: {COLORS['text']}; 
+                        margin: 0;
+                        padding: 0;
+                    }}
+                    h2 {{ color: {COLORS['primary']}; margin-top: 10px; }}
+                    h3 {{ color: {COLORS['secondary']}; margin-top: 8px; }}
+                    a {{ color: {COLORS['primary']}; text-decoration: none; }}
+                    a:hover {{ text-decoration: underline; }}
+                    .notes-container {{ 
+                        white-space: pre-wrap; 
+                        overflow-y: auto;
+                        padding: 5px;
+                    }}
+                    ul {{ padding-left: 20px; }}
+                    li {{ margin-bottom: 5px; }}
+                </style>
+            </head>
+            <body>
+                <h2>Release Notes</h2>
+                """
+
+# Markdown in the release notes that gets converted, in one pass over the text
+_NOTES_MARKDOWN_HTML = {'### ': '<h3>', '## ': '<h2>', '\n- ': '\n• '}
+_NOTES_MARKDOWN = re.compile('|'.join(re.escape(token) for token in _NOTES_MARKDOWN_HTML))
+
 class SettingsPanelMixin:
     def create_settings_panel(self):
         panel = QFrame()
-        panel.setStyleSheet(f"background-color: {COLORS['panel']}; border-radius: 10px;")
+        panel.setStyleSheet(STYLES['settings_panel'])
         layout = QHBoxLayout(panel)  # Changed to horizontal layout
         layout.setContentsMargins(0, 0, 0, 0)  # Remove margins
         layout.setSpacing(0)
@@ -28,12 +66,7 @@ class SettingsPanelMixin:
         # Create vertical tab bar on the left
         tab_bar_frame = QFrame()
         tab_bar_frame.setMinimumWidth(170)
-        tab_bar_frame.setStyleSheet(f"""
-            background-color: {COLORS['background']};
-            border-radius: 0px;
-            border-bottom-left-radius: 10px;
-            border-top-left-radius: 10px;
-        """)
+        tab_bar_frame.setStyleSheet(STYLES['settings_tab_bar'])
         tab_bar_layout = QVBoxLayout(tab_bar_frame)
         tab_bar_layout.setContentsMargins(0, 20, 20, 20)  # Added proper margins
         tab_bar_layout.setSpacing(10)  # Increased spacing between elements
@@ -49,17 +82,12 @@ class SettingsPanelMixin:
         # Add separator
         separator = QFrame()
         separator.setFrameShape(QFrame.Shape.HLine)
-        separator.setStyleSheet(f"background-color: {COLORS['border']}; margin: 5px")
+        separator.setStyleSheet(STYLES['separator_compact'])
         tab_bar_layout.addWidget(separator)
         
         # Create stacked widget for content
         self.settings_stack = QStackedWidget()
-        self.settings_stack.setStyleSheet(f"""
-            background-color: {COLORS['panel']};
-            border-radius: 0px;
-            border-top-right-radius: 10px;
-            border-bottom-right-radius: 10px;
-        """)
+        self.settings_stack.setStyleSheet(STYLES['settings_stack'])
         
         # Create settings content
         settings_content = QWidget()
@@ -69,56 +97,56 @@ class SettingsPanelMixin:
         
         # Image Formats Group
         image_group = QGroupBox("Image Settings (Converter Only)")
-        image_group.setStyleSheet(f"""
-            QGroupBox {{
-                font-size: 12pt;
-                font-weight: bold;
-                border: 1px solid {COLORS['border']};
-                border-radius: 8px;
-                margin-top: 1ex;
-                padding: 10px;
-            }}
-            QGroupBox::title {{
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px;
-            }}
-        """)
+        image_group.setStyleSheet(STYLES['settings_group'])
         image_layout = QVBoxLayout(image_group)
         
         # JPEG/WEBP Quality
         jpeg_layout, self.jpeg_quality_combo = self._create_combo_setting("JPEG Quality:", ["Maximum", "High", "Medium", "Low"])
         webp_layout, self.webp_quality_combo = self._create_combo_setting("WEBP Quality:", ["Maximum", "High", "Medium", "Low"])
+        webp_method_layout, self.webp_method_combo = self._create_combo_setting("WEBP Encoding:", ["Best (Slow)", "Balanced", "Fast"])
         png_layout, self.png_compression_combo = self._create_combo_setting("PNG Compression:", ["Maximum", "Normal", "Fast", "None"])
+        self.jpeg_quality_combo.setCurrentText(DEFAULT_QUALITY_SETTINGS['jpeg_quality'])
+        self.webp_quality_combo.setCurrentText(DEFAULT_QUALITY_SETTINGS['webp_quality'])
+        self.webp_method_combo.setCurrentText(DEFAULT_QUALITY_SETTINGS['webp_method'])
+        self.png_compression_combo.setCurrentText(DEFAULT_QUALITY_SETTINGS['png_compression'])
         
         # Connect signals to update settings immediately
         self.jpeg_quality_combo.currentTextChanged.connect(self.update_quality_settings)
         self.webp_quality_combo.currentTextChanged.connect(self.update_quality_settings)
+        self.webp_method_combo.currentTextChanged.connect(self.update_quality_settings)
         self.png_compression_combo.currentTextChanged.connect(self.update_quality_settings)
         
         # Add settings to image group
         image_layout.addLayout(jpeg_layout)
         image_layout.addLayout(webp_layout)
+        image_layout.addLayout(webp_method_layout)
         image_layout.addLayout(png_layout)
         settings_layout.addWidget(image_group)
         
         # Document Formats Group
         doc_group = QGroupBox("Document Settings (Converter Only)")
-        doc_group.setStyleSheet(image_group.styleSheet())  # Reuse the style
+        doc_group.setStyleSheet(STYLES['settings_group'])
         doc_layout = QVBoxLayout(doc_group)
         
         # PDF Settings
         pdf_dpi_layout, self.pdf_dpi_combo = self._create_combo_setting("PDF Resolution:", ["72 DPI", "150 DPI", "300 DPI", "600 DPI"])
-        self.pdf_dpi_combo.setCurrentText("150 DPI")  # Set default to 150 DPI
+        self.pdf_dpi_combo.setCurrentText(DEFAULT_QUALITY_SETTINGS['pdf_dpi'])
         pdf_quality_layout, self.pdf_quality_combo = self._create_combo_setting("PDF Quality:", ["High", "Medium", "Low"])
+        self.pdf_quality_combo.setCurrentText(DEFAULT_QUALITY_SETTINGS['pdf_quality'])
 
         # Connect PDF settings signals
         self.pdf_dpi_combo.currentTextChanged.connect(self.update_quality_settings)
         self.pdf_quality_combo.currentTextChanged.connect(self.update_quality_settings)
         
+        # PDF to PDF is a plain copy unless the file should be rewritten (unused objects dropped, streams compressed)
+        self.pdf_optimize_check = QCheckBox("Optimize PDF when converting PDF to PDF")
+        self.pdf_optimize_check.setChecked(settings_store.get('pdf_optimize', DEFAULT_QUALITY_SETTINGS['pdf_optimize']))
+        self.pdf_optimize_check.stateChanged.connect(self.on_pdf_optimize_changed)
+        
         # Add settings to document group
         doc_layout.addLayout(pdf_dpi_layout)
         doc_layout.addLayout(pdf_quality_layout)
+        doc_layout.addWidget(self.pdf_optimize_check)
         settings_layout.addWidget(doc_group)
         
         # Create updates content
@@ -133,7 +161,7 @@ class SettingsPanelMixin:
         updates_layout.addWidget(updates_title)
         
         # Current version info
-        self.current_version_label = QLabel("Current Version: 6.0")
+        self.current_version_label = QLabel(f"Current Version: {APP_VERSION}")
         self.current_version_label.setStyleSheet("font-size: 12pt;")
         updates_layout.addWidget(self.current_version_label)
         
@@ -152,25 +180,12 @@ class SettingsPanelMixin:
         self.release_notes = QTextEdit()
         self.release_notes.setReadOnly(True)
         self.release_notes.setMinimumHeight(200)
-        self.release_notes.setStyleSheet(f"""
-            QTextEdit {{
-                background-color: {COLORS['background']};
-                color: {COLORS['text']};
-                border: 1px solid {COLORS['border']};
-                border-radius: 8px;
-                padding: 10px;
-                font-family: 'Segoe UI', sans-serif;
-                font-size: 10pt;
-            }}
-            
-            QScrollArea {{ border: none; background-color: transparent; }}
-            QScrollBar:vertical {{ background-color: {COLORS['background']}; width: 10px; border-radius: 5px; }}
-            QScrollBar::handle:vertical {{ background-color: #4d4d5f; border-radius: 5px; min-height: 20px; }}
-            QScrollBar::add-page:vertical, QScrollBar::sub-page:vertical {{ background-color: transparent; }}
-            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {{ height: 0px; }}
-        """)
+        self.release_notes.setStyleSheet(STYLES['release_notes'])
 
         self.release_notes.setPlaceholderText("Release notes will appear here...")
+        self.release_notes.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
+        self.release_notes.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
+        self._release_notes_key = None  # (version, notes, url) currently shown
         updates_layout.addWidget(self.release_notes)
         
         # Create a horizontal layout for update buttons
@@ -179,29 +194,17 @@ class SettingsPanelMixin:
         # Check for updates button
         check_updates_btn = QPushButton("🔄 Check for Updates")
         check_updates_btn.setFixedHeight(45)
-        check_updates_btn.setFont(QFont("Segoe UI", 10))
+        check_updates_btn.setFont(get_font(10))
         check_updates_btn.clicked.connect(self.check_for_updates)
-        check_updates_btn.setStyleSheet(f"""
-            QPushButton {{ 
-                background-color: {COLORS['primary']}; 
-                color: white; 
-                border: none; 
-                border-radius: 8px; 
-                padding: 10px; 
-                font-weight: 600; 
-            }}
-            QPushButton:hover {{ 
-                background-color: {COLORS['hover']}; 
-            }}
-        """)
+        check_updates_btn.setStyleSheet(STYLES['primary_button'])
         update_buttons_layout.addWidget(check_updates_btn)
         
         # Download latest release button
         download_btn = QPushButton("⬇️ Download Latest Release")
         download_btn.setFixedHeight(45)
-        download_btn.setFont(QFont("Segoe UI", 10))
+        download_btn.setFont(get_font(10))
         download_btn.clicked.connect(lambda: QDesktopServices.openUrl(QUrl("https://github.com/GuptaAman777/psd-converter/releases/latest")))
-        download_btn.setStyleSheet(check_updates_btn.styleSheet())
+        download_btn.setStyleSheet(STYLES['primary_button'])
         update_buttons_layout.addWidget(download_btn)
         
         # Add the buttons layout to the main layout
@@ -213,21 +216,9 @@ class SettingsPanelMixin:
         # Visit GitHub button
         github_btn = QPushButton("🌐 Visit GitHub Repository")
         github_btn.setFixedHeight(45)
-        github_btn.setFont(QFont("Segoe UI", 10))
+        github_btn.setFont(get_font(10))
         github_btn.clicked.connect(lambda: QDesktopServices.openUrl(QUrl("https://github.com/GuptaAman777/psd-converter")))
-        github_btn.setStyleSheet(f"""
-            QPushButton {{ 
-                background-color: {COLORS['secondary']}; 
-                color: {COLORS['text']}; 
-                border: none; 
-                border-radius: 8px; 
-                padding: 10px; 
-                font-weight: 600; 
-            }}
-            QPushButton:hover {{ 
-                background-color: {COLORS['hover']}; 
-            }}
-        """)
+        github_btn.setStyleSheet(STYLES['secondary_button'])
         github_layout.addWidget(github_btn)
         
         # Add the GitHub button layout to the main layout
@@ -261,16 +252,7 @@ class SettingsPanelMixin:
         refresh_btn = QPushButton("🔄")
         refresh_btn.setFixedSize(30, 30)
         refresh_btn.clicked.connect(self.update_logger_display)
-        refresh_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {COLORS['secondary']};
-                border-radius: 15px;
-                padding: 5px;
-            }}
-            QPushButton:hover {{
-                background-color: {COLORS['hover']};
-            }}
-        """)
+        refresh_btn.setStyleSheet(STYLES['refresh_button'])
         filter_layout.addWidget(refresh_btn)
         
         # Add word wrap toggle
@@ -281,163 +263,92 @@ class SettingsPanelMixin:
         # Search box
         self.log_search = QLineEdit()
         self.log_search.setPlaceholderText("Search logs...")
-        self.log_search.textChanged.connect(self.filter_logs)
-        self.log_search.setStyleSheet(f"""
-            QLineEdit {{
-                background-color: {COLORS['background']};
-                color: {COLORS['text']};
-                border: 1px solid {COLORS['border']};
-                border-radius: 8px;
-                padding: 8px;
-                font-size: 10pt;
-            }}
-            QLineEdit:focus {{
-                border-color: {COLORS['primary']};
-            }}
-        """)
+        # Re-filter once typing pauses rather than on every keystroke
+        self._log_filter_timer = QTimer(self)
+        self._log_filter_timer.setSingleShot(True)
+        self._log_filter_timer.setInterval(LOG_FILTER_DELAY_MS)
+        self._log_filter_timer.timeout.connect(self.filter_logs)
+        self.log_search.textChanged.connect(self._log_filter_timer.start)
+        self.log_search.setStyleSheet(STYLES['log_search'])
         filter_layout.addWidget(self.log_search)
         
         logger_layout.addLayout(filter_layout)
         
-        # Create logger text edit
-        self.logger_text = QTextEdit()
-        self.logger_text.setReadOnly(True)
-        self.logger_text.setMinimumHeight(300)  # Increased height since it has its own tab now
-        self.logger_text.setStyleSheet(f"""
-            QTextEdit {{
-                background-color: {COLORS['background']};
-                color: {COLORS['text']};
-                border: 1px solid {COLORS['border']};
-                border-radius: 8px;
-                padding: 8px;
-                font-family: 'Consolas', 'Courier New', monospace;
-                font-size: 10pt;
-                min-width: 400px;
-            }}
-            QScrollBar:vertical {{
-                background: transparent;
-                width: 16px;
-                margin: 3px;
-                border-radius: 8px;
-            }}
-            QScrollBar:vertical:hover {{
-                width: 20px;
-            }}
-            QScrollBar::handle:vertical {{
-                background-color: #4d4d5f;
-                min-height: 30px;
-                border-radius: 6px;
-                margin: 3px 3px 3px 3px;
-            }}
-            QScrollBar::handle:vertical:hover {{
-                background-color: #5d5d6f;
-            }}
-            QScrollBar::add-line:vertical, 
-            QScrollBar::sub-line:vertical {{
-                height: 0px;
-                background: transparent;
-            }}
-            QScrollBar::add-page:vertical, 
-            QScrollBar::sub-page:vertical {{
-                background: transparent;
-            }}
-            
-            /* Horizontal scrollbar styling to match vertical */
-            QScrollBar:horizontal {{
-                background: transparent;
-                height: 16px;
-                margin: 3px;
-                border-radius: 8px;
-            }}
-            QScrollBar:horizontal:hover {{
-                height: 20px;
-            }}
-            QScrollBar::handle:horizontal {{
-                background-color: #4d4d5f;
-                min-width: 30px;
-                border-radius: 6px;
-                margin: 3px 3px 3px 3px;
-            }}
-            QScrollBar::handle:horizontal:hover {{
-                background-color: #5d5d6f;
-            }}
-            QScrollBar::add-line:horizontal, 
-            QScrollBar::sub-line:horizontal {{
-                width: 0px;
-                background: transparent;
-            }}
-            QScrollBar::add-page:horizontal, 
-            QScrollBar::sub-page:horizontal {{
-                background: transparent;
-            }}
-        """)
-        
-        # Connect signals AFTER creating the widget
-        self.logger_text.textChanged.connect(self.on_log_changed)
-        self.word_wrap.stateChanged.connect(lambda state: 
-            self.logger_text.setLineWrapMode(
-                QTextEdit.LineWrapMode.WidgetWidth if state else QTextEdit.LineWrapMode.NoWrap
-            )
-        )
+        self._log_filter = None  # Rebuilt by update_logger_display() whenever the filter changes
+        self._log_filter_key = None  # The (level, search text) _log_filter was built from
+        
+        # Create logger view; a list over the shown lines, so only the visible rows are ever laid out
+        self.log_model = LogListModel(self)
+        self.log_model.set_max_lines(self.log_messages.maxlen)
+        self.logger_view = QListView()
+        self.logger_view.setModel(self.log_model)
+        self.logger_view.setUniformItemSizes(True)  # Rows are one line each until Word Wrap is turned on
+        self.logger_view.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+        self.logger_view.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)
+        self.logger_view.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.logger_view.setMinimumHeight(300)  # Increased height since it has its own tab now
+        self.logger_view.setStyleSheet(STYLES['log_view'])
+        copy_shortcut = QShortcut(QKeySequence(QKeySequence.StandardKey.Copy), self.logger_view)
+        copy_shortcut.setContext(Qt.ShortcutContext.WidgetShortcut)
+        copy_shortcut.activated.connect(self.copy_selected_logs)
+        
+        # log() only queues lines (it may be called from worker threads via stdout);
+        # they are appended here in batches, on the GUI thread. The timer only runs
+        # while lines are waiting, and the signal starts it on the GUI thread.
+        self._pending_log_lines = []
+        self._log_flush_timer = QTimer(self)
+        self._log_flush_timer.setSingleShot(True)
+        self._log_flush_timer.setInterval(LOG_FLUSH_INTERVAL_MS)
+        self._log_flush_timer.timeout.connect(self._flush_log_lines)
+        self.log_lines_queued.connect(self._log_flush_timer.start)
+        self.word_wrap.stateChanged.connect(self.toggle_log_word_wrap)
         
         # Add statistics label
         self.log_stats = QLabel()
-        self.log_stats.setStyleSheet(f"color: {COLORS['text_secondary']}; font-size: 9pt;")
-        logger_layout.addWidget(self.logger_text)
-        logger_layout.addWidget(self.log_stats)
+        self.log_stats.setStyleSheet(STYLES['log_stats'])
+        logger_layout.addWidget(self.logger_view)
+        
+        # Statistics with the line cap next to them
+        stats_layout = QHBoxLayout()
+        stats_layout.addWidget(self.log_stats)
+        stats_layout.addStretch()
+        max_lines_label = QLabel("Max Lines:")
+        self.log_max_lines_combo = AnimatedComboBox()
+        self.log_max_lines_combo.addItems([str(n) for n in LOG_MAX_LINES_OPTIONS])
+        self.log_max_lines_combo.setCurrentText(str(self.log_messages.maxlen))
+        self.log_max_lines_combo.currentTextChanged.connect(self.set_log_max_lines)
+        stats_layout.addWidget(max_lines_label)
+        stats_layout.addWidget(self.log_max_lines_combo)
+        logger_layout.addLayout(stats_layout)
 
         # Add logger controls
         logger_controls = QHBoxLayout()
         
         clear_log_btn = QPushButton("🧹 Clear Log")
         clear_log_btn.setFixedHeight(35)
-        clear_log_btn.setFont(QFont("Segoe UI", 10))
+        clear_log_btn.setFont(get_font(10))
         clear_log_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        clear_log_btn.setStyleSheet(f"""
-            QPushButton {{ 
-                background-color: {COLORS['error']}; 
-                color: {COLORS['text']}; 
-                border: none; 
-                border-radius: 8px; 
-                padding: 8px; 
-                font-weight: 600; 
-            }}
-            QPushButton:hover {{ 
-                background-color: {COLORS['error_hover']}; 
-            }}
-        """)
+        clear_log_btn.setStyleSheet(STYLES['action_button_red'])
         clear_log_btn.clicked.connect(self.clear_log)
         
         save_log_btn = QPushButton("📥 Save Log")
         save_log_btn.setFixedHeight(35)
-        save_log_btn.setFont(QFont("Segoe UI", 10))
+        save_log_btn.setFont(get_font(10))
         save_log_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        save_log_btn.setStyleSheet(f"""
-            QPushButton {{ 
-                background-color: {COLORS['secondary']}; 
-                color: {COLORS['text']}; 
-                border: none; 
-                border-radius: 8px; 
-                padding: 8px; 
-                font-weight: 600; 
-            }}
-            QPushButton:hover {{ 
-                background-color: {COLORS['hover']}; 
-            }}
-        """)
+        save_log_btn.setStyleSheet(STYLES['action_button'])
         save_log_btn.clicked.connect(self.save_log)
         
         copy_btn = QPushButton("📋 Copy")
         copy_btn.setFixedHeight(35)
-        copy_btn.setFont(QFont("Segoe UI", 10))
+        copy_btn.setFont(get_font(10))
         copy_btn.clicked.connect(self.copy_logs)
-        copy_btn.setStyleSheet(save_log_btn.styleSheet())
+        copy_btn.setStyleSheet(STYLES['action_button'])
         
         export_html_btn = QPushButton("📥 Export HTML")
         export_html_btn.setFixedHeight(35)
-        export_html_btn.setFont(QFont("Segoe UI", 10))
+        export_html_btn.setFont(get_font(10))
         export_html_btn.clicked.connect(self.export_html_logs)
-        export_html_btn.setStyleSheet(save_log_btn.styleSheet())
+        export_html_btn.setStyleSheet(STYLES['action_button'])
         
         logger_controls.addWidget(clear_log_btn)
         logger_controls.addWidget(copy_btn)
@@ -446,46 +357,71 @@ class SettingsPanelMixin:
         
         logger_layout.addLayout(logger_controls)
         
+        settings_btn = QPushButton("⚙️\nSettings")
+        settings_btn.setFixedSize(80, 70)  # Increased width to accommodate text
+        settings_btn.setCheckable(True)
+        settings_btn.setChecked(True)  # Start with settings tab active
+        settings_btn.setStyleSheet(STYLES['settings_tab_button'])
+        
         # Add content to stacked widget
         self.settings_stack.addWidget(settings_content)
         self.settings_stack.addWidget(updates_content)
         self.settings_stack.addWidget(logger_content)
+        self.settings_stack.addWidget(QWidget())  # The About page, built by create_about_page() when first opened
+        self._about_page = None
+
+        updates_btn = QPushButton("🔄\nUpdates")
+        updates_btn.setFixedSize(80, 70)
+        updates_btn.setCheckable(True)
+        updates_btn.setStyleSheet(STYLES['settings_tab_button'])
         
-        settings_btn = QPushButton("⚙️\nSettings")
-        settings_btn.setFixedSize(80, 70)  # Increased width to accommodate text
-        settings_btn.setCheckable(True)
-        settings_btn.setChecked(True)  # Start with settings tab active
-        settings_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {COLORS['background']};
-                color: {COLORS['text']};
-                border: none;
-                border-radius: 8px;
-                padding: 5px;
-                margin: 5px;
-                text-align: center;
-                min-width: 140px;
-                font-size: 13px;
-            }}
-            QPushButton:hover {{
-                background-color: {COLORS['!tab']};
-                font-size: 13px;
-                min-width: 140px;
-            }}
-            QPushButton:checked {{
-                background-color: {COLORS['primary']};
-                color: white;
-                font-weight: bold;
-                font-size: 14px;
-            }}
-            /* Adjust line spacing */
-            QPushButton {{
-                text-align: center;
-                line-height: 1.0;
-            }}
-        """)
+        logger_btn = QPushButton("📋\nLogger")
+        logger_btn.setFixedSize(80, 70)  # Increased width to accommodate text
+        logger_btn.setCheckable(True)
+        logger_btn.setStyleSheet(STYLES['settings_tab_button'])
+        
+        about_btn = QPushButton("ℹ️\nAbout")
+        about_btn.setFixedSize(80, 70)
+        about_btn.setCheckable(True)
+        about_btn.setStyleSheet(STYLES['settings_tab_button'])
+        
+        # Add tooltips
+        settings_btn.setToolTip("Settings")
+        updates_btn.setToolTip("Check for Updates")
+        logger_btn.setToolTip("Logger")
+        about_btn.setToolTip("About")
         
-        # Create about content
+        # Connect button signals
+        settings_btn.clicked.connect(lambda: self.switch_settings_tab(0, settings_btn, [updates_btn, logger_btn, about_btn]))
+        updates_btn.clicked.connect(lambda: self.switch_settings_tab(1, updates_btn, [settings_btn, logger_btn, about_btn]))
+        logger_btn.clicked.connect(lambda: self.switch_settings_tab(2, logger_btn, [settings_btn, updates_btn, about_btn]))
+        about_btn.clicked.connect(lambda: self.switch_settings_tab(3, about_btn, [settings_btn, updates_btn, logger_btn]))
+        
+        # Add buttons to tab bar with proper spacing
+        tab_bar_layout.addWidget(settings_btn, alignment=Qt.AlignmentFlag.AlignCenter)
+        tab_bar_layout.addSpacing(10)  # Add explicit spacing between buttons
+        tab_bar_layout.addWidget(updates_btn, alignment=Qt.AlignmentFlag.AlignCenter)
+        tab_bar_layout.addSpacing(10)  # Add explicit spacing between buttons
+        tab_bar_layout.addWidget(logger_btn, alignment=Qt.AlignmentFlag.AlignCenter)
+        tab_bar_layout.addSpacing(10)  # Add explicit spacing between buttons
+        tab_bar_layout.addWidget(about_btn, alignment=Qt.AlignmentFlag.AlignCenter)
+        tab_bar_layout.addStretch()
+        
+        # Add frames to main layout
+        layout.addWidget(tab_bar_frame)
+        layout.addWidget(self.settings_stack)
+        
+        # Initialize with any existing logs
+        self.update_logger_display()
+        
+        # Show the result of the startup update check if it finished before the panel was opened
+        if self._update_check_view is not None:
+            self._update_check_view()
+        
+        return panel
+
+    def create_about_page(self):
+        """Build the About page of the Settings panel"""
         about_content = QWidget()
         about_layout = QVBoxLayout(about_content)
         about_layout.setContentsMargins(20, 20, 20, 20)
@@ -500,28 +436,7 @@ class SettingsPanelMixin:
         about_scroll = QScrollArea()
         about_scroll.setWidgetResizable(True)
         about_scroll.setFrameShape(QFrame.Shape.NoFrame)
-        about_scroll.setStyleSheet(f"""
-            QScrollArea {{ 
-                background-color: transparent;
-                border: none;
-            }}
-            QScrollBar:vertical {{ 
-                background-color: {COLORS['background']}; 
-                width: 10px; 
-                border-radius: 5px; 
-            }}
-            QScrollBar::handle:vertical {{ 
-                background-color: #4d4d5f; 
-                border-radius: 5px; 
-                min-height: 20px; 
-            }}
-            QScrollBar::add-page:vertical, QScrollBar::sub-page:vertical {{ 
-                background-color: transparent; 
-            }}
-            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {{ 
-                height: 0px; 
-            }}
-        """)
+        about_scroll.setStyleSheet(STYLES['about_scroll'])
         
         # Create a widget to hold all the about content
         about_content_widget = QWidget()
@@ -530,18 +445,12 @@ class SettingsPanelMixin:
         
         # Logo section
         logo_frame = QFrame()
-        logo_frame.setStyleSheet(f"""
-            QFrame {{
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 transparent, stop:0.5 {COLORS['panel']}, stop:1 transparent);
-                border-radius: 10px;
-                padding: 10px;
-            }}
-        """)
+        logo_frame.setStyleSheet(STYLES['about_logo'])
         logo_layout = QVBoxLayout(logo_frame)
         
         group_name = QLabel("Alvanheim Scanlation Group")
         group_name.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        group_name.setStyleSheet(f"font-size: 24px; font-weight: bold; color: {COLORS['primary']};")
+        group_name.setStyleSheet(STYLES['about_group_name'])
         logo_layout.addWidget(group_name)
         
         about_content_layout.addWidget(logo_frame)
@@ -549,13 +458,7 @@ class SettingsPanelMixin:
         # Function to create section frames
         def create_section(title, content_widgets):
             section_frame = QFrame()
-            section_frame.setStyleSheet(f"""
-                QFrame {{
-                    background-color: {COLORS['background']};
-                    border-radius: 8px;
-                    padding: 15px;
-                }}
-            """)
+            section_frame.setStyleSheet(STYLES['about_section'])
             
             # Add shadow effect
             shadow = QGraphicsDropShadowEffect()
@@ -569,18 +472,12 @@ class SettingsPanelMixin:
             
             # Section title with left border
             title_frame = QFrame()
-            title_frame.setStyleSheet(f"""
-                QFrame {{
-                    border-left: 3px solid {COLORS['primary']};
-                    padding-left: 7px;
-                    margin-bottom: 5px;
-                }}
-            """)
+            title_frame.setStyleSheet(STYLES['about_section_title'])
             title_layout = QVBoxLayout(title_frame)
             title_layout.setContentsMargins(0, 0, 0, 0)
             
             title_label = QLabel(title)
-            title_label.setStyleSheet(f"font-size: 18px; font-weight: bold; color: {COLORS['secondary']};")
+            title_label.setStyleSheet(STYLES['about_section_title_label'])
             title_layout.addWidget(title_label)
             
             section_layout.addWidget(title_frame)
@@ -677,7 +574,7 @@ class SettingsPanelMixin:
         # Copyright footer
         copyright_label = QLabel("PSD Converter v6.0 © 2026 Alvanheim Scanlation Group")
         copyright_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        copyright_label.setStyleSheet(f"font-style: italic; color: {COLORS['text_secondary']}; font-size: 10pt; margin-top: 10px;")
+        copyright_label.setStyleSheet(STYLES['about_copyright'])
         about_content_layout.addWidget(copyright_label)
         
         # Add spacing at the bottom
@@ -693,21 +590,9 @@ class SettingsPanelMixin:
         # Discord button
         discord_btn = QPushButton("🎮 Join Our Discord")
         discord_btn.setFixedHeight(45)
-        discord_btn.setFont(QFont("Segoe UI", 10))
+        discord_btn.setFont(get_font(10))
         discord_btn.clicked.connect(lambda: QDesktopServices.openUrl(QUrl("https://discord.gg/GCrthAhBmy")))
-        discord_btn.setStyleSheet(f"""
-            QPushButton {{ 
-                background-color: #5865F2; 
-                color: white; 
-                border: none; 
-                border-radius: 8px; 
-                padding: 10px; 
-                font-weight: 600; 
-            }}
-            QPushButton:hover {{ 
-                background-color: #4752C4; 
-            }}
-        """)
+        discord_btn.setStyleSheet(STYLES['discord_button'])
         social_buttons_layout.addWidget(discord_btn)
         
         about_layout.addLayout(social_buttons_layout)
@@ -715,177 +600,82 @@ class SettingsPanelMixin:
         # GitHub profile button
         github_profile_btn = QPushButton("🌐 Visit Developer's GitHub")
         github_profile_btn.setFixedHeight(45)
-        github_profile_btn.setFont(QFont("Segoe UI", 10))
+        github_profile_btn.setFont(get_font(10))
         github_profile_btn.clicked.connect(lambda: QDesktopServices.openUrl(QUrl("https://github.com/GuptaAman777")))
-        github_profile_btn.setStyleSheet(f"""
-            QPushButton {{ 
-                background-color: {COLORS['secondary']}; 
-                color: {COLORS['text']}; 
-                border: none; 
-                border-radius: 8px; 
-                padding: 10px; 
-                font-weight: 600; 
-            }}
-            QPushButton:hover {{ 
-                background-color: {COLORS['hover']}; 
-            }}
-        """)
+        github_profile_btn.setStyleSheet(STYLES['secondary_button'])
         about_layout.addWidget(github_profile_btn)
         
-        # Add content to stacked widget
-        self.settings_stack.addWidget(settings_content)
-        self.settings_stack.addWidget(updates_content)
-        self.settings_stack.addWidget(logger_content)
-        self.settings_stack.addWidget(about_content)
-
-        updates_btn = QPushButton("🔄\nUpdates")
-        updates_btn.setFixedSize(80, 70)
-        updates_btn.setCheckable(True)
-        updates_btn.setStyleSheet(settings_btn.styleSheet())
-        
-        logger_btn = QPushButton("📋\nLogger")
-        logger_btn.setFixedSize(80, 70)  # Increased width to accommodate text
-        logger_btn.setCheckable(True)
-        logger_btn.setStyleSheet(settings_btn.styleSheet())
-        
-        about_btn = QPushButton("ℹ️\nAbout")
-        about_btn.setFixedSize(80, 70)
-        about_btn.setCheckable(True)
-        about_btn.setStyleSheet(settings_btn.styleSheet())
-        
-        # Add tooltips
-        settings_btn.setToolTip("Settings")
-        updates_btn.setToolTip("Check for Updates")
-        logger_btn.setToolTip("Logger")
-        about_btn.setToolTip("About")
-        
-        # Connect button signals
-        settings_btn.clicked.connect(lambda: self.switch_settings_tab(0, settings_btn, [updates_btn, logger_btn, about_btn]))
-        updates_btn.clicked.connect(lambda: self.switch_settings_tab(1, updates_btn, [settings_btn, logger_btn, about_btn]))
-        logger_btn.clicked.connect(lambda: self.switch_settings_tab(2, logger_btn, [settings_btn, updates_btn, about_btn]))
-        about_btn.clicked.connect(lambda: self.switch_settings_tab(3, about_btn, [settings_btn, updates_btn, logger_btn]))
-        
-        # Add buttons to tab bar with proper spacing
-        tab_bar_layout.addWidget(settings_btn, alignment=Qt.AlignmentFlag.AlignCenter)
-        tab_bar_layout.addSpacing(10)  # Add explicit spacing between buttons
-        tab_bar_layout.addWidget(updates_btn, alignment=Qt.AlignmentFlag.AlignCenter)
-        tab_bar_layout.addSpacing(10)  # Add explicit spacing between buttons
-        tab_bar_layout.addWidget(logger_btn, alignment=Qt.AlignmentFlag.AlignCenter)
-        tab_bar_layout.addSpacing(10)  # Add explicit spacing between buttons
-        tab_bar_layout.addWidget(about_btn, alignment=Qt.AlignmentFlag.AlignCenter)
-        tab_bar_layout.addStretch()
-        
-        # Add frames to main layout
-        layout.addWidget(tab_bar_frame)
-        layout.addWidget(self.settings_stack)
-        
-        # Initialize with any existing logs
-        self.update_logger_display()
-        
-        # Check for updates when the panel is created
-        QTimer.singleShot(1000, self.check_for_updates)
-        
-        return panel
+        return about_content
 
     def check_for_updates(self):
         """Check for updates from GitHub repository"""
-        self.update_status.setText("Checking for updates...")
-        self.update_status.setStyleSheet(f"color: {COLORS['text']};")
-        self.latest_version_label.setText("Latest Version: Checking...")
-        
-        # Get current version from a version file or hardcoded value
-        current_version = "6.0"  # You can replace this with a dynamic version
-        self.current_version_label.setText(f"Current Version: {current_version}")
-        
-        # Create a worker thread to check for updates
-        class UpdateCheckerThread(QThread):
-            update_found = pyqtSignal(str, str, str, bool)
-            error_occurred = pyqtSignal(str)
-            
-            def run(self):
-                try:
-                    import requests
-                    import json
-                    
-                    # GitHub API URL for the latest release
-                    url = "https://api.github.com/repos/GuptaAman777/psd-converter/releases/latest"
-                    
-                    # Send request with a timeout
-                    response = requests.get(url, timeout=10)
-                    
-                    if response.status_code == 200:
-                        data = response.json()
-                        latest_version = data.get('tag_name', '').lstrip('v')
-                        release_notes = data.get('body', 'No release notes available.')
-                        release_url = data.get('html_url', '')
-                        
-                        # Compare versions (simple string comparison for now)
-                        update_available = latest_version != current_version
-                        
-                        self.update_found.emit(latest_version, release_notes, release_url, update_available)
-                    else:
-                        self.error_occurred.emit(f"Error checking for updates: HTTP {response.status_code}")
-                except Exception as e:
-                    self.error_occurred.emit(f"Error checking for updates: {str(e)}")
-        
-        # Create and start the thread
-        self.update_checker = UpdateCheckerThread()
-        self.update_checker.update_found.connect(self.handle_update_result)
-        self.update_checker.error_occurred.connect(self.handle_update_error)
-        self.update_checker.start()
+        # The startup check can run before the Settings tab has been opened
+        if self._settings_panel is not None:
+            self.update_status.setText("Checking for updates...")
+            self.update_status.setStyleSheet(STYLES['status_text'])
+            self.latest_version_label.setText("Latest Version: Checking...")
+            self.current_version_label.setText(f"Current Version: {APP_VERSION}")
+        
+        if self._update_reply is not None:
+            return  # A check is already running
+        
+        # Qt's network stack runs the request on the event loop; no worker thread needed
+        if self._network_manager is None:
+            self._network_manager = QNetworkAccessManager(self)
+        request = QNetworkRequest(QUrl(GITHUB_RELEASES_URL))
+        request.setHeader(QNetworkRequest.KnownHeaders.UserAgentHeader, f"psd-converter/{APP_VERSION}")
+        request.setTransferTimeout(10000)
+        self._update_reply = self._network_manager.get(request)
+        self._update_reply.finished.connect(self._on_update_reply)
+
+    def _on_update_reply(self):
+        """Handle the finished update check request"""
+        reply, self._update_reply = self._update_reply, None
+        reply.deleteLater()
+        
+        status = reply.attribute(QNetworkRequest.Attribute.HttpStatusCodeAttribute)
+        if status is not None and status != 200:
+            self.handle_update_error(f"Error checking for updates: HTTP {status}")
+            return
+        if reply.error() != QNetworkReply.NetworkError.NoError:
+            self.handle_update_error(f"Error checking for updates: {reply.errorString()}")
+            return
+        
+        try:
+            data = json.loads(bytes(reply.readAll()))
+            latest_version = data.get('tag_name', '').lstrip('v')
+            release_notes = data.get('body', 'No release notes available.')
+            release_url = data.get('html_url', '')
+        except (ValueError, AttributeError) as e:
+            self.handle_update_error(f"Error checking for updates: {str(e)}")
+            return
+        
+        # Compare versions (simple string comparison for now)
+        update_available = latest_version != APP_VERSION
+        self.handle_update_result(latest_version, release_notes, release_url, update_available)
 
     def handle_update_result(self, latest_version, release_notes, release_url, update_available):
         """Handle the result of the update check"""
-        self.latest_version_label.setText(f"Latest Version: {latest_version}")
-        
-        # Format release notes with Markdown
-        formatted_notes = release_notes.replace('## ', '<h2>').replace('### ', '<h3>')
-        formatted_notes = formatted_notes.replace('\n- ', '\n• ')
-        
-        # Enhance the release notes display with better scrolling
-        self.release_notes.setHtml(f"""
-            <html>
-            <head>
-                <style>
-                    body {{ 
-                        font-family: 'Segoe UI', sans-serif; 
-                        color: {COLORS['text']}; 
-                        margin: 0;
-                        padding: 0;
-                    }}
-                    h2 {{ color: {COLORS['primary']}; margin-top: 10px; }}
-                    h3 {{ color: {COLORS['secondary']}; margin-top: 8px; }}
-                    a {{ color: {COLORS['primary']}; text-decoration: none; }}
-                    a:hover {{ text-decoration: underline; }}
-                    .notes-container {{ 
-                        white-space: pre-wrap; 
-                        overflow-y: auto;
-                        padding: 5px;
-                    }}
-                    ul {{ padding-left: 20px; }}
-                    li {{ margin-bottom: 5px; }}
-                </style>
-            </head>
-            <body>
-                <h2>Release Notes</h2>
-                <div class="notes-container">{formatted_notes}</div>
-                <p><a href="{release_url}">View on GitHub</a></p>
-            </body>
-            </html>
-        """)
-        
-        # Ensure the QTextEdit is properly configured for scrolling
-        self.release_notes.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
-        self.release_notes.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
-        self.release_notes.setReadOnly(True)
-        
-        # Get current version from the version label
-        current_version = self.current_version_label.text().replace("Current Version: ", "")
-        
-        # Compare versions (simple string comparison)
+        state = self._update_state(latest_version, update_available)
+        
+        # Kept so the Settings tab can show it whenever it's first opened
+        self._update_check_view = functools.partial(self._show_update_result, latest_version, release_notes, release_url, state)
+        if self._settings_panel is not None:
+            self._update_check_view()
+        
+        if state == "early_access":
+            self.log("Early Access version detected", "WARNING")
+        elif state == "available":
+            # Show update notification
+            self.update_notification = UpdateNotification(self, latest_version, release_url)
+            self.update_notification.show()
+            self.update_notification.start_show_animation()
+
+    def _update_state(self, latest_version, update_available):
+        """Return "early_access", "available" or "latest" for the running version"""
         try:
             # Convert versions to tuples of integers for proper comparison
-            current_parts = [int(x) for x in current_version.split('.')]
+            current_parts = [int(x) for x in APP_VERSION.split('.')]
             latest_parts = [int(x) for x in latest_version.split('.')]
             
             # Pad shorter version with zeros
@@ -896,57 +686,67 @@ class SettingsPanelMixin:
             
             # Check if current version is higher than latest
             if current_parts > latest_parts:
-                self.update_status.setText("You are using an Early Access version! Please report any bugs to the developer.")
-                self.update_status.setStyleSheet(f"color: #FFD700;")  # Gold color for early access
-                self.log("Early Access version detected", "WARNING")
-            elif update_available:
-                self.update_status.setText("A new version is available! You can download it from the GitHub repository.")
-                self.update_status.setStyleSheet(f"color: {COLORS['success']};")
-                
-                # Show update notification
-                self.update_notification = UpdateNotification(self, latest_version, release_url)
-                self.update_notification.show()
-                self.update_notification.start_show_animation()
-                
-            else:
-                self.update_status.setText("You have the latest version.")
-                self.update_status.setStyleSheet(f"color: {COLORS['text']};")
+                return "early_access"
         except ValueError:
-            # Fallback to simple string comparison if version parsing fails
-            if update_available:
-                self.update_status.setText("A new version is available! You can download it from the GitHub repository.")
-                self.update_status.setStyleSheet(f"color: {COLORS['success']};")
-                
-                # Show update notification
-                self.update_notification = UpdateNotification(self, latest_version, release_url)
-                self.update_notification.show()
-                self.update_notification.start_show_animation()
-            else:
-                self.update_status.setText("You have the latest version.")
-                self.update_status.setStyleSheet(f"color: {COLORS['text']};")
+            pass  # Fall back to the checker's simple string comparison
+        return "available" if update_available else "latest"
+
+    def _show_update_result(self, latest_version, release_notes, release_url, state):
+        """Show an update check result on the Updates page"""
+        self.latest_version_label.setText(f"Latest Version: {latest_version}")
+        
+        # The notes page is only re-parsed when the release actually changed
+        notes_key = (latest_version, release_notes, release_url)
+        if notes_key != self._release_notes_key:
+            self._release_notes_key = notes_key
+            formatted_notes = _NOTES_MARKDOWN.sub(lambda m: _NOTES_MARKDOWN_HTML[m.group()], release_notes)
+            self.release_notes.setHtml(f"""{_RELEASE_NOTES_HEAD}<div class="notes-container">{formatted_notes}</div>
+                <p><a href="{release_url}">View on GitHub</a></p>
+            </body>
+            </html>
+        """)
+        
+        if state == "early_access":
+            self.update_status.setText("You are using an Early Access version! Please report any bugs to the developer.")
+            self.update_status.setStyleSheet(STYLES['status_early_access'])  # Gold color for early access
+        elif state == "available":
+            self.update_status.setText("A new version is available! You can download it from the GitHub repository.")
+            self.update_status.setStyleSheet(STYLES['status_success'])
+        else:
+            self.update_status.setText("You have the latest version.")
+            self.update_status.setStyleSheet(STYLES['status_text'])
 
     def update_logger_display(self):
-        """Update the logger text edit with all log messages"""
+        """Refill the logger view with the log messages that pass the current filter"""
         try:
-            if hasattr(self, 'logger_text') and self.logger_text is not None:
-                self.logger_text.clear()
-                for log_entry in self.log_messages:
-                    # Apply color based on log level
+            if hasattr(self, 'logger_view') and self.logger_view is not None:
+                self._log_filter = log_filter = self._build_log_filter()
+                
+                # Queued lines are already in log_messages, so the rebuild covers them;
+                # dropped in the same step as the snapshot so no line lands in neither
+                with self._log_lock:
+                    log_messages = list(self.log_messages)
+                    self._pending_log_lines = []
+                
+                # One pass that filters and tallies the statistics
+                shown_logs = []
+                errors = warnings = success = 0
+                for log_entry in log_messages:
+                    if log_filter is not None and not log_filter(log_entry):
+                        continue
+                    shown_logs.append(log_entry)
                     if "[ERROR]" in log_entry:
-                        self.logger_text.append(f'<span style="color: {COLORS["error"]};">{log_entry}</span>')
-                    elif "[WARNING]" in log_entry:
-                        self.logger_text.append(f'<span style="color: #FFCC00;">{log_entry}</span>')
-                    elif "[SUCCESS]" in log_entry:
-                        self.logger_text.append(f'<span style="color: {COLORS["success"]};">{log_entry}</span>')
-                    elif "[TERMINAL]" in log_entry:
-                        self.logger_text.append(f'<span style="color: #00BFFF;">{log_entry}</span>')
-                    else:
-                        self.logger_text.append(log_entry)
+                        errors += 1
+                    if "[WARNING]" in log_entry:
+                        warnings += 1
+                    if "[SUCCESS]" in log_entry:
+                        success += 1
+                
+                # A model reset; nothing is laid out beyond the rows on screen
+                self.log_model.set_lines(shown_logs)
                 
                 # Scroll to the bottom to show the latest log
-                self.logger_text.verticalScrollBar().setValue(
-                    self.logger_text.verticalScrollBar().maximum()
-                )
+                self.logger_view.scrollToBottom()
+                self._show_log_statistics(len(shown_logs), errors, warnings, success)
         except Exception as e:
             print(f"Error updating logger display: {str(e)}")
-
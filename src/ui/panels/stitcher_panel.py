@@ -121,6 +121,12 @@ class StitcherPanelMixin:
         self.stitcher_resize_combo = AnimatedComboBox()
         self.stitcher_resize_combo.addItems(["Don't Resize", "Match Smallest", "Match Largest", "Match First"])
         resize_layout.addWidget(self.stitcher_resize_combo)
+        
+        # Toggle for reduced-scale JPEG decoding when downscaling
+        self.stitcher_fast_jpeg_toggle = QCheckBox("Fast JPEG Decode")
+        self.stitcher_fast_jpeg_toggle.setChecked(False)
+        self.stitcher_fast_jpeg_toggle.setToolTip("Decode large JPEGs at reduced scale when they are resized down.\nFaster, but output may differ slightly from a full-resolution resize.")
+        resize_layout.addWidget(self.stitcher_fast_jpeg_toggle)
         layout.addLayout(resize_layout)
         
         # Output format selection
@@ -136,7 +142,7 @@ class StitcherPanelMixin:
         
         # Instructions button
         instructions_btn = QPushButton("📖 Stitcher Info")
-        instructions_btn.setFont(QFont("Segoe UI", 10))
+        instructions_btn.setFont(get_font(10))
         instructions_btn.setFixedHeight(35)
         instructions_btn.clicked.connect(self.show_stitcher_instructions)
         instructions_btn.setCursor(Qt.CursorShape.PointingHandCursor)
@@ -185,7 +191,7 @@ class StitcherPanelMixin:
         
         # Stitch button at the bottom
         self.stitch_btn = QPushButton("🧵 Stitch Images")
-        self.stitch_btn.setFont(QFont("Segoe UI", 12))
+        self.stitch_btn.setFont(get_font(12))
         self.stitch_btn.setFixedHeight(65)
         self.stitch_btn.setEnabled(False)
         self.stitch_btn.clicked.connect(self.start_stitching)
@@ -220,7 +226,7 @@ class StitcherPanelMixin:
         
         # Add Files button
         add_folders_btn = QPushButton("📁 Add Files")
-        add_folders_btn.setFont(QFont("Segoe UI", 10))
+        add_folders_btn.setFont(get_font(10))
         add_folders_btn.setFixedHeight(40)
         add_folders_btn.clicked.connect(self.add_stitcher_files_as_group)
         add_folders_btn.setCursor(Qt.CursorShape.PointingHandCursor)
@@ -241,7 +247,7 @@ class StitcherPanelMixin:
         
         # Add Parent Folder button
         add_parent_folder_btn = QPushButton("📂 Add Parent Folder")
-        add_parent_folder_btn.setFont(QFont("Segoe UI", 10))
+        add_parent_folder_btn.setFont(get_font(10))
         add_parent_folder_btn.setFixedHeight(40)
         add_parent_folder_btn.clicked.connect(self.add_stitcher_parent_folder)
         add_parent_folder_btn.setCursor(Qt.CursorShape.PointingHandCursor)
@@ -250,7 +256,7 @@ class StitcherPanelMixin:
         
         # Clear Folders button (red color)
         clear_folders_btn = QPushButton("🚫 Clear Folders")
-        clear_folders_btn.setFont(QFont("Segoe UI", 10))
+        clear_folders_btn.setFont(get_font(10))
         clear_folders_btn.setFixedHeight(40)
         clear_folders_btn.clicked.connect(self.clear_stitcher_folders)
         clear_folders_btn.setCursor(Qt.CursorShape.PointingHandCursor)
@@ -271,7 +277,7 @@ class StitcherPanelMixin:
         
         # Set Output button
         set_output_btn = QPushButton("📂 Set Output")
-        set_output_btn.setFont(QFont("Segoe UI", 10))
+        set_output_btn.setFont(get_font(10))
         set_output_btn.setFixedHeight(40)
         set_output_btn.clicked.connect(self.set_stitcher_output_dir)
         set_output_btn.setCursor(Qt.CursorShape.PointingHandCursor)
@@ -386,9 +392,9 @@ class StitcherPanelMixin:
         dialog.setStyleSheet(f"background-color: {COLORS['background']}; color: {COLORS['text']};")
         
         # Set window icon
-        icon_path = get_icon_path("icon.ico")
-        if os.path.exists(icon_path):
-            dialog.setWindowIcon(QIcon(icon_path))
+        icon = get_icon("icon.ico")
+        if icon:
+            dialog.setWindowIcon(icon)
         
         layout = QVBoxLayout(dialog)
         layout.setContentsMargins(20, 20, 20, 20)
@@ -1262,6 +1268,7 @@ class StitcherPanelMixin:
         alignment = self.stitcher_alignment_combo.currentText()
         bg_color = self.stitcher_bg_color_combo.currentText()
         resize_option = self.stitcher_resize_combo.currentText()
+        fast_jpeg_decode = self.stitcher_fast_jpeg_toggle.isChecked()
 
         self.stitch_btn.setText("Stitching...")
         self.stitch_btn.setEnabled(False)
@@ -1338,7 +1345,8 @@ class StitcherPanelMixin:
             alignment=alignment,
             bg_color=bg_color,
             resize_option=resize_option,
-            reverse_order=reverse_order
+            reverse_order=reverse_order,
+            fast_jpeg_decode=fast_jpeg_decode
         )
         
         # Connect signals
@@ -1431,7 +1439,7 @@ class StitcherPanelMixin:
             
             # Update status labels
             self.stitcher_status_label.setText(f"Progress: {percent}% ({value}/{total} folders)")
-            self.stitcher_folder_label.setText(f"Stitching folder: {folder_name}")
+            self.stitcher_folder_label.setText(f"Last stitched: {folder_name}")
 
     def stitching_finished(self, success_count, error_count, output_dir):
         """Handle completion of the stitching process"""
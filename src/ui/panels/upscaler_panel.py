@@ -198,7 +198,7 @@ class UpscalerPanelMixin:
         
         # Instructions button
         instructions_btn = QPushButton("📖 Upscaler Info")
-        instructions_btn.setFont(QFont("Segoe UI", 10))
+        instructions_btn.setFont(get_font(10))
         instructions_btn.setFixedHeight(35)
         instructions_btn.clicked.connect(self.show_upscaler_instructions)
         instructions_btn.setCursor(Qt.CursorShape.PointingHandCursor)
@@ -222,7 +222,7 @@ class UpscalerPanelMixin:
         
         # System Info button
         system_info_btn = QPushButton("🖥️ Check GPU")
-        system_info_btn.setFont(QFont("Segoe UI", 10))
+        system_info_btn.setFont(get_font(10))
         system_info_btn.setFixedHeight(35)
         system_info_btn.clicked.connect(self.show_system_info)
         system_info_btn.setCursor(Qt.CursorShape.PointingHandCursor)
@@ -262,7 +262,7 @@ class UpscalerPanelMixin:
         
         # Upscale button at the bottom
         self.upscale_btn = QPushButton("✨ Upscale")
-        self.upscale_btn.setFont(QFont("Segoe UI", 12))
+        self.upscale_btn.setFont(get_font(12))
         self.upscale_btn.setFixedHeight(65)
         self.upscale_btn.setEnabled(False)
         self.upscale_btn.clicked.connect(self.start_upscaling)
@@ -300,7 +300,7 @@ class UpscalerPanelMixin:
         
         # Add Files button
         add_files_btn = QPushButton("📁 Add Files")
-        add_files_btn.setFont(QFont("Segoe UI", 10))
+        add_files_btn.setFont(get_font(10))
         add_files_btn.setFixedHeight(40)
         add_files_btn.clicked.connect(self.add_upscaler_files)
         add_files_btn.setCursor(Qt.CursorShape.PointingHandCursor)
@@ -321,7 +321,7 @@ class UpscalerPanelMixin:
         
         # Add Folder button
         add_folder_btn = QPushButton("📂 Add Folder")
-        add_folder_btn.setFont(QFont("Segoe UI", 10))
+        add_folder_btn.setFont(get_font(10))
         add_folder_btn.setFixedHeight(40)
         add_folder_btn.clicked.connect(self.add_upscaler_folder)
         add_folder_btn.setCursor(Qt.CursorShape.PointingHandCursor)
@@ -330,7 +330,7 @@ class UpscalerPanelMixin:
         
         # Clear Files button (red color)
         clear_files_btn = QPushButton("🚫 Clear Files")
-        clear_files_btn.setFont(QFont("Segoe UI", 10))
+        clear_files_btn.setFont(get_font(10))
         clear_files_btn.setFixedHeight(40)
         clear_files_btn.clicked.connect(self.clear_upscaler_files)
         clear_files_btn.setCursor(Qt.CursorShape.PointingHandCursor)
@@ -351,7 +351,7 @@ class UpscalerPanelMixin:
         
         # Set Output button (exact match to Home panel)
         set_output_btn = QPushButton("📂 Set Output")
-        set_output_btn.setFont(QFont("Segoe UI", 10))
+        set_output_btn.setFont(get_font(10))
         set_output_btn.setFixedHeight(40)
         set_output_btn.clicked.connect(self.set_upscaler_output_dir)
         set_output_btn.setCursor(Qt.CursorShape.PointingHandCursor)
@@ -1179,7 +1179,7 @@ class UpscalerPanelMixin:
     def open_upscaler_output_folder(self):
         """Open the upscaler output folder"""
         if self.upscaler_output_dir and os.path.exists(self.upscaler_output_dir):
-            os.startfile(self.upscaler_output_dir)
+            open_folder(self.upscaler_output_dir)
 
     def show_upscaler_instructions(self):
         """Show detailed instructions dialog for the Upscaler feature"""
@@ -1189,9 +1189,9 @@ class UpscalerPanelMixin:
         dialog.setStyleSheet(f"background-color: {COLORS['background']}; color: {COLORS['text']};")
         
         # Set window icon
-        icon_path = get_icon_path("icon.ico")
-        if os.path.exists(icon_path):
-            dialog.setWindowIcon(QIcon(icon_path))
+        icon = get_icon("icon.ico")
+        if icon:
+            dialog.setWindowIcon(icon)
         
         layout = QVBoxLayout(dialog)
         layout.setContentsMargins(20, 20, 20, 20)
@@ -56,6 +56,452 @@ STYLES = {
         QProgressBar {{ border: 1px solid {COLORS['border']}; border-radius: 5px; background-color: {COLORS['panel']}; height: 20px; text-align: center; padding: 0px; }}
         QProgressBar::chunk {{ background-color: {COLORS['primary']}; border-radius: 4px; margin: 1px; border: 1px solid {COLORS['primary']}; min-width: 10px; }}
     """,
+    'combo_box': f"""
+        QComboBox {{
+            background-color: {COLORS['background']};
+            color: {COLORS['text']};
+            border: 1px solid {COLORS['border']};
+            border-bottom: 2px solid #141420;  /* Stands in for a drop shadow, which re-blurs offscreen on every repaint */
+            border-radius: 8px;
+            padding: 8px 12px;
+        }}
+        QComboBox:hover {{
+            border-color: {COLORS['primary']};  /* Hover feedback without resizing, so siblings aren't re-laid out */
+        }}
+        QComboBox QAbstractItemView {{
+            background-color: {COLORS['background']};
+            border: 2px solid {COLORS['border']};
+            border-radius: 8px;
+            selection-background-color: {COLORS['primary']};
+            selection-color: white;
+            color: {COLORS['text']};
+            padding: 5px;
+            outline: none; 
+        }}
+        QComboBox QAbstractItemView::item {{
+            min-height: 20px;
+            padding: 5px;
+            border-radius: 8px;
+        }}
+        QComboBox QAbstractItemView::item:hover {{
+            background-color: {COLORS['hover']};
+        }}
+        QComboBox QAbstractItemView::item:focus {{
+            border: none;  
+            outline: none; 
+        }}
+        QComboBox::drop-down {{
+            border: none;
+            width: 30px;
+        }}
+        QComboBox::down-arrow {{
+            image: none;
+            border-left: 5px solid transparent;
+            border-right: 5px solid transparent;
+            border-top: 5px solid {COLORS['text']};
+            margin-right: 10px;
+        }}
+    """,
+    'combo_box_disabled': f"""
+        QComboBox {{
+            background-color: {COLORS['panel']};
+            color: #777777;
+            border: 1px solid #444444;
+            border-radius: 8px;
+            padding: 8px 12px;
+        }}
+        QComboBox QAbstractItemView {{
+            background-color: {COLORS['panel']};
+            border: 2px solid #444444;
+            border-radius: 8px;
+            color: #777777;
+        }}
+        QComboBox::drop-down {{
+            border: none;
+            width: 30px;
+        }}
+        QComboBox::down-arrow {{
+            image: none;
+            border-left: 5px solid transparent;
+            border-right: 5px solid transparent;
+            border-top: 5px solid #777777;
+            margin-right: 10px;
+        }}
+    """,
+    # Output format combos, greyed out while "keep original format" is checked
+    'format_combo': f"""
+        QComboBox {{
+            background-color: {COLORS['background']};
+            color: {COLORS['text']};
+            border: 1px solid {COLORS['border']};
+            border-radius: 8px;
+            padding: 8px 12px;
+        }}
+        QComboBox:hover {{
+            border: 1px solid {COLORS['primary']};
+        }}
+    """,
+    'format_combo_disabled': f"""
+        QComboBox {{
+            background-color: {COLORS['border']};
+            color: #888888;
+            border: 1px solid {COLORS['border']};
+            border-radius: 8px;
+            padding: 8px 12px;
+        }}
+    """,
+    'spacing_combo_disabled': f"""
+        QComboBox {{
+            background-color: {COLORS['border']};
+            color: #888888;
+            border: 1px solid {COLORS['border']};
+            border-radius: 8px;
+            padding: 8px 12px;
+        }}
+        QComboBox::drop-down {{
+            border: none;
+        }}
+        QComboBox::down-arrow {{
+            image: none;
+        }}
+    """,
+    'file_list': f"""
+        QListWidget {{ background-color: transparent; border: none; color: {COLORS['text']}; outline: none; }}
+        QListWidget::item {{ padding: 3px; border-radius: 4px; }}
+        QListWidget::item:hover {{ background-color: {COLORS['panel']}; }}
+        QListWidget::item:disabled {{ color: #777777; }}
+        QScrollBar:vertical {{ background-color: #252535; width: 10px; border-radius: 5px; }}
+        QScrollBar::handle:vertical {{ background-color: #4d4d5f; border-radius: 5px; min-height: 20px; }}
+        QScrollBar::add-page:vertical, QScrollBar::sub-page:vertical {{ background-color: transparent; }}
+        QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {{ height: 0px; }}
+    """,
+    'progress_bar_cancelled': "QProgressBar::chunk { background-color: #d13438; border-radius: 8px; }",
+    'progress_dialog': f"QDialog {{ background-color: {COLORS['background']}; color: {COLORS['text']}; border-radius: 10px; }}",
+    'cancel_button': f"""
+        QPushButton {{ background-color: {COLORS['error']}; color: white; border: none; border-radius: 8px;
+                      padding: 10px; font-weight: 600; margin-bottom: 5px; }}
+        QPushButton:hover {{ background-color: #FF6B6B; }}
+    """,
+    'info_message_box': f"""
+        QMessageBox {{ background-color: {COLORS['background']}; color: {COLORS['text']}; }}
+        QLabel {{ color: {COLORS['text']}; font-size: 10pt; font-family: 'Segoe UI'; }}
+    """,
+    'ok_button': f"""
+        QPushButton {{ background-color: {COLORS['primary']}; color: white; border: none; border-radius: 8px; padding: 8px 16px; font-weight: 600; min-width: 80px; }}
+        QPushButton:hover {{ background-color: {COLORS['hover']}; }}
+    """,
+    'settings_tab_bar': f"""
+        background-color: {COLORS['background']};
+        border-radius: 0px;
+        border-bottom-left-radius: 10px;
+        border-top-left-radius: 10px;
+    """,
+    'settings_stack': f"""
+        background-color: {COLORS['panel']};
+        border-radius: 0px;
+        border-top-right-radius: 10px;
+        border-bottom-right-radius: 10px;
+    """,
+    'settings_group': f"""
+        QGroupBox {{
+            font-size: 12pt;
+            font-weight: bold;
+            border: 1px solid {COLORS['border']};
+            border-radius: 8px;
+            margin-top: 1ex;
+            padding: 10px;
+        }}
+        QGroupBox::title {{
+            subcontrol-origin: margin;
+            left: 10px;
+            padding: 0 5px;
+        }}
+    """,
+    'release_notes': f"""
+        QTextEdit {{
+            background-color: {COLORS['background']};
+            color: {COLORS['text']};
+            border: 1px solid {COLORS['border']};
+            border-radius: 8px;
+            padding: 10px;
+            font-family: 'Segoe UI', sans-serif;
+            font-size: 10pt;
+        }}
+
+        QScrollArea {{ border: none; background-color: transparent; }}
+        QScrollBar:vertical {{ background-color: {COLORS['background']}; width: 10px; border-radius: 5px; }}
+        QScrollBar::handle:vertical {{ background-color: #4d4d5f; border-radius: 5px; min-height: 20px; }}
+        QScrollBar::add-page:vertical, QScrollBar::sub-page:vertical {{ background-color: transparent; }}
+        QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {{ height: 0px; }}
+    """,
+    'refresh_button': f"""
+        QPushButton {{
+            background-color: {COLORS['secondary']};
+            border-radius: 15px;
+            padding: 5px;
+        }}
+        QPushButton:hover {{
+            background-color: {COLORS['hover']};
+        }}
+    """,
+    'log_search': f"""
+        QLineEdit {{
+            background-color: {COLORS['background']};
+            color: {COLORS['text']};
+            border: 1px solid {COLORS['border']};
+            border-radius: 8px;
+            padding: 8px;
+            font-size: 10pt;
+        }}
+        QLineEdit:focus {{
+            border-color: {COLORS['primary']};
+        }}
+    """,
+    'log_view': f"""
+        QListView {{
+            background-color: {COLORS['background']};
+            color: {COLORS['text']};
+            border: 1px solid {COLORS['border']};
+            border-radius: 8px;
+            padding: 8px;
+            font-family: 'Consolas', 'Courier New', monospace;
+            font-size: 10pt;
+            min-width: 400px;
+        }}
+        QListView::item:selected {{
+            background-color: {COLORS['hover']};
+        }}
+        QScrollBar:vertical {{
+            background: transparent;
+            width: 16px;
+            margin: 3px;
+            border-radius: 8px;
+        }}
+        QScrollBar:vertical:hover {{
+            width: 20px;
+        }}
+        QScrollBar::handle:vertical {{
+            background-color: #4d4d5f;
+            min-height: 30px;
+            border-radius: 6px;
+            margin: 3px 3px 3px 3px;
+        }}
+        QScrollBar::handle:vertical:hover {{
+            background-color: #5d5d6f;
+        }}
+        QScrollBar::add-line:vertical,
+        QScrollBar::sub-line:vertical {{
+            height: 0px;
+            background: transparent;
+        }}
+        QScrollBar::add-page:vertical,
+        QScrollBar::sub-page:vertical {{
+            background: transparent;
+        }}
+
+        /* Horizontal scrollbar styling to match vertical */
+        QScrollBar:horizontal {{
+            background: transparent;
+            height: 16px;
+            margin: 3px;
+            border-radius: 8px;
+        }}
+        QScrollBar:horizontal:hover {{
+            height: 20px;
+        }}
+        QScrollBar::handle:horizontal {{
+            background-color: #4d4d5f;
+            min-width: 30px;
+            border-radius: 6px;
+            margin: 3px 3px 3px 3px;
+        }}
+        QScrollBar::handle:horizontal:hover {{
+            background-color: #5d5d6f;
+        }}
+        QScrollBar::add-line:horizontal,
+        QScrollBar::sub-line:horizontal {{
+            width: 0px;
+            background: transparent;
+        }}
+        QScrollBar::add-page:horizontal,
+        QScrollBar::sub-page:horizontal {{
+            background: transparent;
+        }}
+    """,
+    'settings_tab_button': f"""
+        QPushButton {{
+            background-color: {COLORS['background']};
+            color: {COLORS['text']};
+            border: none;
+            border-radius: 8px;
+            padding: 5px;
+            margin: 5px;
+            text-align: center;
+            min-width: 140px;
+            font-size: 13px;
+        }}
+        QPushButton:hover {{
+            background-color: {COLORS['!tab']};
+            font-size: 13px;
+            min-width: 140px;
+        }}
+        QPushButton:checked {{
+            background-color: {COLORS['primary']};
+            color: white;
+            font-weight: bold;
+            font-size: 14px;
+        }}
+        /* Adjust line spacing */
+        QPushButton {{
+            text-align: center;
+            line-height: 1.0;
+        }}
+    """,
+    'about_scroll': f"""
+        QScrollArea {{
+            background-color: transparent;
+            border: none;
+        }}
+        QScrollBar:vertical {{
+            background-color: {COLORS['background']};
+            width: 10px;
+            border-radius: 5px;
+        }}
+        QScrollBar::handle:vertical {{
+            background-color: #4d4d5f;
+            border-radius: 5px;
+            min-height: 20px;
+        }}
+        QScrollBar::add-page:vertical, QScrollBar::sub-page:vertical {{
+            background-color: transparent;
+        }}
+        QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {{
+            height: 0px;
+        }}
+    """,
+    'about_logo': f"""
+        QFrame {{
+            background: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 transparent, stop:0.5 {COLORS['panel']}, stop:1 transparent);
+            border-radius: 10px;
+            padding: 10px;
+        }}
+    """,
+    'about_section': f"""
+        QFrame {{
+            background-color: {COLORS['background']};
+            border-radius: 8px;
+            padding: 15px;
+        }}
+    """,
+    'about_section_title': f"""
+        QFrame {{
+            border-left: 3px solid {COLORS['primary']};
+            padding-left: 7px;
+            margin-bottom: 5px;
+        }}
+    """,
+    'discord_button': f"""
+        QPushButton {{
+            background-color: #5865F2;
+            color: white;
+            border: none;
+            border-radius: 8px;
+            padding: 10px;
+            font-weight: 600;
+        }}
+        QPushButton:hover {{
+            background-color: #4752C4;
+        }}
+    """,
+    'secondary_button': f"""
+        QPushButton {{
+            background-color: {COLORS['secondary']};
+            color: {COLORS['text']};
+            border: none;
+            border-radius: 8px;
+            padding: 10px;
+            font-weight: 600;
+        }}
+        QPushButton:hover {{
+            background-color: {COLORS['hover']};
+        }}
+    """,
+    'hybrid_dialog': f"""
+        QDialog {{
+            background-color: {COLORS['background']};
+            color: {COLORS['text']};
+            border-radius: 10px;
+        }}
+    """,
+    'hint_button': f"""
+        QPushButton {{
+            background-color: {COLORS['primary']};
+            color: white;
+            border: none;
+            border-radius: 10px;
+            padding: 10px;
+            font-weight: 600;
+            font-size: 14px;
+        }}
+        QPushButton:hover {{
+            background-color: {COLORS['hover']};
+        }}
+    """,
+    'wide_button': f"""
+        background-color: {COLORS['primary']};
+        color: white;
+        border: none;
+        border-radius: 6px;
+        padding: 8px 16px;
+        font-weight: bold;
+        min-width: 150px;
+    """,
+    'icon_button': f"""
+        QPushButton {{ background-color: {COLORS['secondary']}; color: {COLORS['text']}; border: none; border-radius: 6px; font-size: 14px; }}
+        QPushButton:hover {{ background-color: {COLORS['hover']}; }}
+    """,
+    'help_text': f"""
+        color: {COLORS['text_secondary']};
+        font-size: 9pt;
+        margin-top: 10px;
+        padding: 8px;
+        background-color: rgba(61, 61, 79, 0.3);
+        border-radius: 6px;
+    """,
+    'converter_panel': f"background-color: {COLORS['panel']}; border-radius: 0px; border-bottom-left-radius: 10px;",
+    'separator': f"background-color: {COLORS['border']}; margin: 15px 0px;",
+    'settings_panel': f"background-color: {COLORS['panel']}; border-radius: 10px;",
+    'separator_compact': f"background-color: {COLORS['border']}; margin: 5px",
+    'log_stats': f"color: {COLORS['text_secondary']}; font-size: 9pt;",
+    'about_group_name': f"font-size: 24px; font-weight: bold; color: {COLORS['primary']};",
+    'about_section_title_label': f"font-size: 18px; font-weight: bold; color: {COLORS['secondary']};",
+    'about_copyright': f"font-style: italic; color: {COLORS['text_secondary']}; font-size: 10pt; margin-top: 10px;",
+    'status_early_access': "color: #FFD700;",
+    'status_success': f"color: {COLORS['success']};",
+    'status_text': f"color: {COLORS['text']};",
+    'status_error': f"color: {COLORS['error']};",
+    'hint_description': f"font-size: 12px; color: {COLORS['text']}; margin: 10px 0;",
+    'hint_checkbox': f"font-size: 12px; color: {COLORS['text']};",
+    'notice_dialog': f"background-color: {COLORS['background']}; color: {COLORS['text']};",
+    'notice_container': f"background-color: {COLORS['panel']}; border-radius: 15px;",
+    'notice_icon': "font-size: 36px; color: #FFB940;",
+    'notice_title': "font-size: 18pt; font-weight: bold; color: #FFB940;",
+    'notice_separator': f"background-color: {COLORS['border']}; margin: 0px 5px;",
+    'notice_text': "QTextBrowser { background-color: transparent; border: none; font-size: 12px; }",
+    'notice_checkbox': f"""
+        QCheckBox {{ color: {COLORS['text']}; font-size: 12px; }}
+        QCheckBox::indicator {{ width: 18px; height: 18px; }}
+        QCheckBox::indicator:unchecked {{ background-color: {COLORS['panel']}; border: 1px solid {COLORS['text']}; border-radius: 4px; }}
+        QCheckBox::indicator:checked {{ background-color: {COLORS['primary']}; border: 1px solid {COLORS['primary']}; border-radius: 4px; }}
+    """,
+    'notice_exit_button': f"""
+        QPushButton {{ background-color: {COLORS['secondary']}; color: {COLORS['text']}; border: none; border-radius: 10px; padding: 10px; font-weight: 600; font-size: 14px; }}
+        QPushButton:hover {{ background-color: {COLORS['hover']}; }}
+    """,
+    'notice_accept_button': f"""
+        QPushButton {{ background-color: {COLORS['error']}; color: white; border: none; border-radius: 10px; padding: 10px; font-weight: 600; font-size: 14px; }}
+        QPushButton:hover {{ background-color: {COLORS['error_hover']}; }}
+    """,
 }
 
 def button_style(bg_color=COLORS['primary'], text_color=COLORS['text'], hover_color=COLORS['hover'], padding="8px", radius="8px", font_weight="600"):
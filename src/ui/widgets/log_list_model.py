@@ -0,0 +1,63 @@
+from PyQt6.QtGui import QColor
+from PyQt6.QtCore import *
+
+from src.constants import LOG_LEVEL_COLORS, LOG_MAX_LINES
+from src.utils.helpers import get_log_level
+
+# QColor for each coloured log level, built once rather than per painted row
+_LEVEL_QCOLORS = {level: QColor(color) for level, color in LOG_LEVEL_COLORS.items()}
+
+class LogListModel(QAbstractListModel):
+    """The log lines shown in the Logger view, one row each, coloured by level"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._lines = []
+        self._max_lines = LOG_MAX_LINES
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._lines)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._lines[index.row()]
+        if role == Qt.ItemDataRole.ForegroundRole:
+            return _LEVEL_QCOLORS.get(get_log_level(self._lines[index.row()]))
+        return None
+
+    def lines(self, rows):
+        """Return the text of the given rows"""
+        return [self._lines[row] for row in rows]
+
+    def set_lines(self, lines):
+        """Replace every row; the view re-lays out nothing but the visible rows"""
+        self.beginResetModel()
+        self._lines = list(lines[-self._max_lines:])
+        self.endResetModel()
+
+    def append_lines(self, lines):
+        """Add rows at the bottom, dropping the oldest ones past the line cap"""
+        if not lines:
+            return
+        if len(lines) > self._max_lines:
+            lines = lines[-self._max_lines:]
+        first = len(self._lines)
+        self.beginInsertRows(QModelIndex(), first, first + len(lines) - 1)
+        self._lines.extend(lines)
+        self.endInsertRows()
+        self._trim()
+
+    def set_max_lines(self, max_lines):
+        """Change the line cap, dropping the oldest rows if there are now too many"""
+        self._max_lines = max_lines
+        self._trim()
+
+    def clear(self):
+        self.set_lines([])
+
+    def _trim(self):
+        excess = len(self._lines) - self._max_lines
+        if excess > 0:
+            self.beginRemoveRows(QModelIndex(), 0, excess - 1)
+            del self._lines[:excess]
+            self.endRemoveRows()
@@ -1,12 +1,11 @@
-import os
 import time
 from PyQt6.QtWidgets import *
 from PyQt6.QtGui import *
 from PyQt6.QtCore import *
 
-from src.constants import COLORS, APP_VERSION, GITHUB_RELEASES_URL
+from src.constants import APP_VERSION, GITHUB_RELEASES_URL
 from src.ui.styles import STYLES
-from src.utils.helpers import natural_sort_key, get_file_icon, format_size, get_icon_path
+from src.utils.helpers import natural_sort_key, get_file_icon, format_size, get_icon, get_font
 
 class ProcessingProgressDialog(QDialog):
     """Single progress dialog used for Converter, Upscaler, and Denoiser."""
@@ -17,13 +16,14 @@ class ProcessingProgressDialog(QDialog):
         self.setFixedSize(450, 220)
         self.setModal(True)
         self._cancel_callback = cancel_callback
+        self._last_update = None
 
         # Window icon
-        icon_path = get_icon_path("icon.ico")
-        if os.path.exists(icon_path):
-            self.setWindowIcon(QIcon(icon_path))
+        icon = get_icon("icon.ico")
+        if icon:
+            self.setWindowIcon(icon)
 
-        self.setStyleSheet(f"QDialog {{ background-color: {COLORS['background']}; color: {COLORS['text']}; border-radius: 10px; }}")
+        self.setStyleSheet(STYLES['progress_dialog'])
 
         layout = QVBoxLayout()
         layout.setContentsMargins(20, 20, 20, 25)
@@ -54,24 +54,25 @@ class ProcessingProgressDialog(QDialog):
         self.cancel_btn = QPushButton("Cancel")
         self.cancel_btn.setFixedHeight(45)
         self.cancel_btn.setMinimumWidth(160)
-        self.cancel_btn.setFont(QFont("Segoe UI", 10))
-        self.cancel_btn.setStyleSheet(f"""
-            QPushButton {{ background-color: {COLORS['error']}; color: white; border: none; border-radius: 8px;
-                          padding: 10px; font-weight: 600; margin-bottom: 5px; }}
-            QPushButton:hover {{ background-color: #FF6B6B; }}
-        """)
+        self.cancel_btn.setFont(get_font(10))
+        self.cancel_btn.setStyleSheet(STYLES['cancel_button'])
         self.cancel_btn.clicked.connect(self._on_cancel)
         layout.addWidget(self.cancel_btn)
         self.setLayout(layout)
 
     def _on_cancel(self):
-        self.progress_bar.setStyleSheet("QProgressBar::chunk { background-color: #d13438; border-radius: 8px; }")
+        self.progress_bar.setStyleSheet(STYLES['progress_bar_cancelled'])
         self.cancel_btn.setEnabled(False)
         self.cancel_btn.setText("Cancelling...")
         if self._cancel_callback:
             self._cancel_callback()
 
     def update_progress(self, value, eta_text, speed_text):
+        # Workers can repeat an update; skip the relayout and repaint when nothing changed
+        update = (value, eta_text, speed_text)
+        if update == self._last_update:
+            return
+        self._last_update = update
         self.progress_bar.setValue(value)
         self.eta_label.setText(eta_text)
         self.speed_label.setText(speed_text)
@@ -2,10 +2,15 @@ import os
 import re
 import sys
 import time
+import functools
+import subprocess
+from PyQt6.QtGui import QIcon, QFont
+
+_NATSORT_SPLIT = re.compile(r'(\d+)').split
 
 def natural_sort_key(s):
     """Key function for natural (human-friendly) sorting of strings."""
-    return [int(text) if text.isdigit() else text.lower() for text in re.split(r'(\d+)', str(s))]
+    return [int(text) if text.isdigit() else text.lower() for text in _NATSORT_SPLIT(str(s))]
 
 def format_size(size_bytes):
     """Format file size in bytes to human-readable format."""
@@ -48,6 +53,7 @@ def calculate_progress_info(processed, total, start_time):
         speed_text = "Calculating speed..."
     return eta_text, speed_text
 
+@functools.lru_cache(maxsize=None)
 def get_icon_path(icon_name):
     """Resolve path to an icon, handling PyInstaller environment."""
     if getattr(sys, 'frozen', False):
@@ -68,6 +74,33 @@ def get_icon_path(icon_name):
         src_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
         return os.path.join(src_path, "assets", "icons", icon_name)
 
+@functools.lru_cache(maxsize=None)
+def get_icon(icon_name):
+    """Return a shared QIcon for an icon file, or None if it doesn't exist."""
+    icon_path = get_icon_path(icon_name)
+    return QIcon(icon_path) if os.path.exists(icon_path) else None
+
+# Opens a folder in the platform's file manager; chosen once here rather than on every click
+if sys.platform == 'win32':
+    open_folder = os.startfile
+elif sys.platform == 'darwin':
+    def open_folder(path):
+        """Open a folder in Finder."""
+        subprocess.Popen(['open', path])
+else:
+    def open_folder(path):
+        """Open a folder in the desktop's file manager."""
+        subprocess.Popen(['xdg-open', path])
+
+@functools.lru_cache(maxsize=None)
+def get_font(point_size):
+    """Return a shared Segoe UI QFont of the given point size; setFont() copies it, so sharing is safe."""
+    return QFont("Segoe UI", point_size)
+
+def get_log_level(log_entry):
+    """Return the LEVEL of a "[time] [LEVEL] message" log line"""
+    return log_entry.partition("] [")[2].partition("]")[0]
+
 def get_data_path(filename):
     """Get the path for data files like settings.json, handling PyInstaller onefile mode."""
     if getattr(sys, 'frozen', False):
@@ -0,0 +1,117 @@
+import os
+import json
+import time
+import threading
+
+from src.utils.helpers import get_data_path
+
+# orjson parses faster when it's installed; the standard library is the fallback
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+# Seconds during which a fresh cache is trusted without checking the file again
+REVALIDATE_INTERVAL = 1.0
+
+class SettingsStore:
+    """settings.json kept parsed in memory, re-read only when the file changes on disk"""
+
+    def __init__(self, path):
+        self._path = path
+        self._cache = {}
+        self._stamp = None  # (st_mtime_ns, st_size) of the file the cache was read from
+        self._checked_at = None  # time.monotonic() of the last freshness check
+        self._dirty = False
+        self._lock = threading.Lock()  # Guards the cache between the UI thread and flush()
+        self._write_lock = threading.Lock()  # Keeps an older snapshot from landing after a newer one
+
+    def _stat(self):
+        try:
+            return os.stat(self._path)
+        except OSError:
+            return None
+
+    def _file_stamp(self):
+        st = self._stat()
+        return (st.st_mtime_ns, st.st_size) if st else None
+
+    def _refresh(self):
+        """Reload the file if it changed since it was last read; unsaved changes are kept"""
+        if self._dirty:
+            return
+        now = time.monotonic()
+        if self._checked_at is not None and now - self._checked_at < REVALIDATE_INTERVAL:
+            return  # Checked moments ago; no syscall at all
+        self._checked_at = now
+        st = self._stat()
+        stamp = (st.st_mtime_ns, st.st_size) if st else None
+        if stamp == self._stamp:
+            return  # One stat instead of open + read + parse
+        if st is None:
+            settings = {}  # No settings saved yet
+        else:
+            settings = self._read(st.st_size)
+        self._cache = settings if isinstance(settings, dict) else {}
+        self._stamp = stamp
+
+    def _read(self, size):
+        """Parse the settings file, or return empty settings if it's unreadable"""
+        try:
+            # One unbuffered binary read of the size stat() already gave; no text-mode stream
+            fd = os.open(self._path, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+            try:
+                data = os.read(fd, size)
+            finally:
+                os.close(fd)
+            return _json_loads(data)
+        except (OSError, ValueError):
+            return {}
+
+    def get(self, key, default=None):
+        with self._lock:
+            self._refresh()
+            return self._cache.get(key, default)
+
+    def set(self, key, value):
+        with self._lock:
+            self._refresh()
+            self._cache[key] = value
+            self._dirty = True
+
+    def flush(self):
+        """Write pending changes; the file is replaced atomically so readers never see it half-written"""
+        with self._write_lock:
+            with self._lock:
+                if not self._dirty:
+                    return
+                snapshot = dict(self._cache)
+                self._dirty = False
+
+            # Serialized up front so the file gets one write() instead of one per JSON token
+            data = json.dumps(snapshot, separators=(',', ':')).encode('utf-8')
+            temp_path = self._path + ".tmp"
+            try:
+                fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0), 0o644)
+                try:
+                    view = memoryview(data)
+                    while view:
+                        view = view[os.write(fd, view):]
+                finally:
+                    os.close(fd)
+                os.replace(temp_path, self._path)
+            except OSError:
+                try:
+                    os.remove(temp_path)
+                except OSError:
+                    pass
+                with self._lock:
+                    self._dirty = True  # Try again on the next flush
+                return
+
+            with self._lock:
+                if not self._dirty:
+                    self._stamp = self._file_stamp()  # Our own write doesn't need re-parsing
+
+# Global settings instance
+settings_store = SettingsStore(get_data_path("settings.json"))